@@ -1,31 +1,71 @@
-from fastapi import Depends, HTTPException, status
+import time
+
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import decode_access_token
+from app.core.database import async_read_session, engine, get_db, read_engine
+from app.core.middleware import READ_PRIMARY_COOKIE
+from app.core.security import STREAM_TOKEN_SCOPE, decode_access_token, unsign_value
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
 
 
-async def get_current_user(
-    token: str | None = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User | None:
+def _reads_pinned(request: Request) -> bool:
+    until = unsign_value(request.cookies.get(READ_PRIMARY_COOKIE, ""))
+    try:
+        return until is not None and float(until) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_db(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Session for read-only endpoints.
+    - Uses the read replica when DATABASE_READ_URL is set
+    - Stays on the writer while the client's read-your-writes cookie is valid,
+      so it sees its own recent writes despite replica lag
+    """
+    if read_engine is engine or _reads_pinned(request):
+        yield db
+        return
+    async with async_read_session() as session:
+        yield session
+
+
+async def read_your_writes(request: Request) -> None:
+    """Mark a write endpoint so the client's following reads use the writer"""
+    request.state.pin_reads = True
+
+
+async def precompressed(request: Request) -> None:
+    """Mark a cacheable catalog endpoint so its compressed bodies are reused"""
+    request.state.precompressed = True
+
+
+async def _user_from_token(token: str | None, db: AsyncSession) -> User | None:
     if not token:
         return None
     payload = decode_access_token(token)
     if not payload:
         return None
     user_id = payload.get("sub")
-    if not user_id:
+    # Scoped tokens (stream tokens) are not bearer tokens
+    if not user_id or payload.get("scope"):
         return None
     result = await db.execute(select(User).where(User.id == user_id))
     return result.scalar_one_or_none()
 
 
+async def get_current_user(
+    token: str | None = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> User | None:
+    return await _user_from_token(token, db)
+
+
 async def require_user(
     user: User | None = Depends(get_current_user),
 ) -> User:
@@ -46,3 +86,31 @@ async def require_admin(
             detail="Admin access required",
         )
     return user
+
+
+async def require_admin_event_stream(
+    token: str | None = Query(None),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Admin check for Server-Sent Events endpoints.
+    - Browsers' EventSource cannot send headers, so the token comes as the
+      token query parameter; only stream tokens from POST /admin/stream-token
+      are accepted, never access tokens
+    """
+    payload = decode_access_token(token) if token else None
+    user = None
+    if payload and payload.get("scope") == STREAM_TOKEN_SCOPE and payload.get("sub"):
+        result = await db.execute(select(User).where(User.id == payload["sub"]))
+        user = result.scalar_one_or_none()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+    if not user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+    return user
@@ -0,0 +1,44 @@
+import time
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.core.metrics import current_timings
+
+_adapters: dict[Any, TypeAdapter] = {}
+
+
+def get_adapter(tp: Any) -> TypeAdapter:
+    """Return a cached TypeAdapter for a response type"""
+    adapter = _adapters.get(tp)
+    if adapter is None:
+        adapter = _adapters[tp] = TypeAdapter(tp)
+    return adapter
+
+
+def _record_serialize(start: float) -> None:
+    timings = current_timings()
+    if timings is not None:
+        timings.serialize += time.perf_counter() - start
+
+
+def from_rows(tp: Any, rows: Any) -> Any:
+    """Validate ORM rows (or plain dicts) into response models in one pass"""
+    start = time.perf_counter()
+    result = get_adapter(tp).validate_python(rows, from_attributes=True)
+    _record_serialize(start)
+    return result
+
+
+def model_response(tp: Any, content: Any, status_code: int = 200) -> Response:
+    """
+    Serialize already-validated response models straight to JSON bytes.
+    - Returning a Response skips FastAPI's response_model re-validation
+    - Serialization runs in pydantic-core instead of jsonable_encoder + json.dumps
+    - tp must match the endpoint's response_model so docs and body agree
+    """
+    start = time.perf_counter()
+    body = get_adapter(tp).dump_json(content)
+    _record_serialize(start)
+    return Response(content=body, status_code=status_code, media_type="application/json")
@@ -1,24 +1,145 @@
+import asyncio
+import json
+import math
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, func, select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, case, exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import require_admin
-from app.core.database import get_db
+from app.api.deps import get_read_db, require_admin, require_admin_event_stream
+from app.api.responses import from_rows, model_response
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import async_session, engines, get_db, pool_status
+from app.core.events import event_bus
+from app.core.security import create_stream_token
 from app.models.booking import Booking
-from app.models.review import Review
+from app.models.booking_archive import BookingArchive
+from app.models.booking_daily_stat import BookingDailyStat
+from app.models.job import Job
+from app.models.operating_hours import OperatingHours
 from app.models.sauna import Sauna
 from app.models.user import User
 from app.schemas.admin import (
     BookingsBySauna,
+    CohortAnalytics,
+    CohortRow,
     DashboardStats,
+    JobStatusCount,
+    OccupancyHeatmap,
+    PoolStatus,
     RecentBooking,
     RevenueByDate,
+    StreamToken,
 )
+from app.services.booking_archive import reaches_archive, with_archive
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+_stats_cache = TTLCache(ttl=settings.DASHBOARD_CACHE_TTL, maxsize=4)
+_occupancy_cache = TTLCache(ttl=settings.ANALYTICS_CACHE_TTL, maxsize=32)
+_cohort_cache = TTLCache(ttl=settings.ANALYTICS_CACHE_TTL, maxsize=16)
+_archive_stats_cache = TTLCache(ttl=settings.ANALYTICS_CACHE_TTL, maxsize=4)
+
+# Seconds between keepalive comments on idle event streams
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+def _count_if(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def _sum_if(column, condition):
+    return func.sum(case((condition, column), else_=0))
+
+
+def _booking_counters(table, today: str):
+    """Dashboard booking counters over a bookings-shaped table"""
+    active = table.c.status != "cancelled"
+    active_today = and_(active, table.c.booking_date == today)
+    return select(
+        _count_if(active),
+        _count_if(table.c.status == "confirmed"),
+        _count_if(table.c.status == "cancelled"),
+        _sum_if(table.c.total_price, active),
+        _count_if(active_today),
+        _sum_if(table.c.total_price, active_today),
+    )
+
+
+async def _booking_stats(db: AsyncSession, today: str):
+    """
+    All booking counters in one conditional-aggregation scan.
+    - Archived rows never change, so their counters, distinct customers
+      included, are cached per archival run
+    - The hot scan then only counts customers with no archived booking, an
+      index probe per hot row instead of a union over the whole archive
+    """
+    archive_version = (
+        await db.execute(select(func.max(BookingArchive.archived_at)))
+    ).scalar()
+    if archive_version is None:
+        result = await db.execute(
+            _booking_counters(Booking.__table__, today).add_columns(
+                func.count(func.distinct(Booking.user_id))
+            )
+        )
+        return result.one()
+
+    archived_before = exists().where(BookingArchive.user_id == Booking.user_id)
+    hot = (
+        await db.execute(
+            _booking_counters(Booking.__table__, today).add_columns(
+                func.count(func.distinct(case((~archived_before, Booking.user_id))))
+            )
+        )
+    ).one()
+
+    async def archived_counters():
+        result = await db.execute(
+            _booking_counters(BookingArchive.__table__, today).add_columns(
+                func.count(func.distinct(BookingArchive.user_id))
+            )
+        )
+        return tuple(result.one())
+
+    archived = await _archive_stats_cache.get_or_compute(
+        (archive_version, today), archived_counters
+    )
+    return tuple((a or 0) + (b or 0) for a, b in zip(hot, archived))
+
+
+async def _sauna_stats():
+    """Active sauna count and overall rating from the per-sauna review aggregates"""
+    async with async_session() as db:
+        result = await db.execute(
+            select(
+                _count_if(Sauna.is_active == True),
+                func.sum(Sauna.rating_sum),
+                func.sum(Sauna.review_count),
+            )
+        )
+        return result.one()
+
+
+async def _dashboard_stats(db: AsyncSession, today: str) -> DashboardStats:
+    # Independent queries run concurrently on separate connections
+    bookings, saunas = await asyncio.gather(_booking_stats(db, today), _sauna_stats())
+    rating_sum, review_count = saunas[1] or 0, saunas[2] or 0
+    return DashboardStats(
+        total_bookings=bookings[0],
+        confirmed_bookings=bookings[1],
+        cancelled_bookings=bookings[2],
+        total_revenue=bookings[3],
+        today_bookings=bookings[4],
+        today_revenue=bookings[5],
+        total_customers=bookings[6],
+        total_saunas=saunas[0],
+        average_rating=rating_sum / review_count if review_count else 0.0,
+    )
+
 
 @router.get("/stats", response_model=DashboardStats)
 async def get_dashboard_stats(
@@ -34,163 +155,125 @@ async def get_dashboard_stats(
     - Total unique customers who have made bookings
     - Total active saunas
     - Average rating from all reviews
+    - Cached in-process for DASHBOARD_CACHE_TTL seconds
     """
 
     today = date.today().isoformat()
-
-    # Total bookings (excluding cancelled)
-    total_bookings_result = await db.execute(
-        select(func.count(Booking.id)).where(Booking.status != "cancelled")
+    return await _stats_cache.get_or_compute(
+        today, lambda: _dashboard_stats(db, today)
     )
-    total_bookings = total_bookings_result.scalar() or 0
 
-    # Confirmed bookings
-    confirmed_result = await db.execute(
-        select(func.count(Booking.id)).where(Booking.status == "confirmed")
-    )
-    confirmed_bookings = confirmed_result.scalar() or 0
 
-    # Cancelled bookings
-    cancelled_result = await db.execute(
-        select(func.count(Booking.id)).where(Booking.status == "cancelled")
-    )
-    cancelled_bookings = cancelled_result.scalar() or 0
-
-    # Total revenue (excluding cancelled)
-    total_revenue_result = await db.execute(
-        select(func.sum(Booking.total_price)).where(Booking.status != "cancelled")
-    )
-    total_revenue = total_revenue_result.scalar() or 0.0
-
-    # Today's bookings
-    today_bookings_result = await db.execute(
-        select(func.count(Booking.id)).where(
-            and_(Booking.booking_date == today, Booking.status != "cancelled")
-        )
-    )
-    today_bookings = today_bookings_result.scalar() or 0
-
-    # Today's revenue
-    today_revenue_result = await db.execute(
-        select(func.sum(Booking.total_price)).where(
-            and_(Booking.booking_date == today, Booking.status != "cancelled")
-        )
-    )
-    today_revenue = today_revenue_result.scalar() or 0.0
-
-    # Total unique customers who have made bookings
-    total_customers_result = await db.execute(
-        select(func.count(func.distinct(Booking.user_id))).where(
-            Booking.user_id.isnot(None)
-        )
-    )
-    total_customers = total_customers_result.scalar() or 0
-
-    # Total active saunas
-    total_saunas_result = await db.execute(
-        select(func.count(Sauna.id)).where(Sauna.is_active == True)
-    )
-    total_saunas = total_saunas_result.scalar() or 0
-
-    # Average rating from all reviews
-    avg_rating_result = await db.execute(select(func.avg(Review.rating)))
-    average_rating = avg_rating_result.scalar() or 0.0
-
-    return DashboardStats(
-        total_bookings=total_bookings,
-        confirmed_bookings=confirmed_bookings,
-        cancelled_bookings=cancelled_bookings,
-        total_revenue=total_revenue,
-        today_bookings=today_bookings,
-        today_revenue=today_revenue,
-        total_customers=total_customers,
-        total_saunas=total_saunas,
-        average_rating=average_rating,
-    )
+def _period_start(day: str, granularity: str) -> str:
+    """First date (YYYY-MM-DD) of the day/week/month bucket containing day"""
+    if granularity == "day":
+        return day
+    d = date.fromisoformat(day)
+    if granularity == "week":
+        return (d - timedelta(days=d.weekday())).isoformat()
+    return d.replace(day=1).isoformat()
 
 
 @router.get("/revenue", response_model=list[RevenueByDate])
 async def get_revenue_by_period(
-    period: int = Query(7, ge=1, le=90),
-    db: AsyncSession = Depends(get_db),
+    period: int = Query(7, ge=1, le=3660),
+    granularity: str = Query("day", pattern="^(day|week|month)$"),
+    db: AsyncSession = Depends(get_read_db),
     admin: User = Depends(require_admin),
 ):
     """
-    Get daily revenue for the specified period.
-    - period: Number of days to retrieve (default 7, max 90)
+    Get revenue for the specified period.
+    - period: Number of days to retrieve (default 7, max 3660)
+    - granularity: day, week (starting Monday) or month; date is the bucket's first day
     - Results ordered by date (newest first)
     - Excludes cancelled bookings
+    - Reads the booking_daily_stats rollup, not raw bookings, so new bookings
+      show up once the job runner applies them (seconds with a polling
+      runner, up to a minute on Lambda; see record_booking_change)
     """
 
     today = date.today()
     start_date = (today - timedelta(days=period - 1)).isoformat()
 
-    # Get revenue and booking count by date
+    # Sum the per-sauna rollup rows into one row per date
     query = (
         select(
-            Booking.booking_date,
-            func.sum(Booking.total_price).label("revenue"),
-            func.count(Booking.id).label("booking_count"),
-        )
-        .where(
-            and_(
-                Booking.booking_date >= start_date,
-                Booking.status != "cancelled",
-            )
+            BookingDailyStat.stat_date,
+            func.sum(BookingDailyStat.revenue),
+            func.sum(BookingDailyStat.booking_count),
+            func.sum(BookingDailyStat.guest_count),
+            func.sum(BookingDailyStat.cancelled_count),
         )
-        .group_by(Booking.booking_date)
-        .order_by(Booking.booking_date.desc())
+        .where(BookingDailyStat.stat_date >= start_date)
+        .group_by(BookingDailyStat.stat_date)
+        .order_by(BookingDailyStat.stat_date.desc())
     )
 
     result = await db.execute(query)
-    rows = result.all()
 
-    return [
-        RevenueByDate(
-            date=row[0],
-            revenue=row[1] or 0.0,
-            booking_count=row[2] or 0,
+    buckets: dict[str, dict] = {}
+    for stat_date, revenue, booking_count, guest_count, cancelled_count in result.all():
+        key = _period_start(stat_date, granularity)
+        bucket = buckets.setdefault(
+            key,
+            {"date": key, "revenue": 0.0, "booking_count": 0, "guest_count": 0, "cancelled_count": 0},
         )
-        for row in rows
-    ]
+        bucket["revenue"] += revenue or 0.0
+        bucket["booking_count"] += booking_count or 0
+        bucket["guest_count"] += guest_count or 0
+        bucket["cancelled_count"] += cancelled_count or 0
+
+    # Days with only cancellations have no revenue row, matching the raw query
+    rows = [b for b in buckets.values() if b["booking_count"]]
+
+    return model_response(list[RevenueByDate], from_rows(list[RevenueByDate], rows))
 
 
 @router.get("/bookings-by-sauna", response_model=list[BookingsBySauna])
 async def get_bookings_by_sauna(
-    db: AsyncSession = Depends(get_db),
+    period: int | None = Query(None, ge=1, le=3660),
+    db: AsyncSession = Depends(get_read_db),
     admin: User = Depends(require_admin),
 ):
     """
     Get booking count and revenue for each sauna.
+    - period: Optional number of days to include (default all time)
     - Excludes cancelled bookings
     - Results ordered by revenue (highest first)
+    - Reads the booking_daily_stats rollup, not raw bookings
     """
 
+    revenue = func.sum(BookingDailyStat.revenue)
+    booking_count = func.sum(BookingDailyStat.booking_count)
     query = (
-        select(
-            Sauna.id,
-            Sauna.name,
-            func.count(Booking.id).label("booking_count"),
-            func.sum(Booking.total_price).label("revenue"),
-        )
-        .join(Booking, Sauna.id == Booking.sauna_id)
-        .where(Booking.status != "cancelled")
+        select(Sauna.id, Sauna.name, booking_count, revenue)
+        .join(BookingDailyStat, Sauna.id == BookingDailyStat.sauna_id)
         .group_by(Sauna.id, Sauna.name)
-        .order_by(func.sum(Booking.total_price).desc())
+        .having(booking_count > 0)
+        .order_by(revenue.desc())
     )
+    if period is not None:
+        start_date = (date.today() - timedelta(days=period - 1)).isoformat()
+        query = query.where(BookingDailyStat.stat_date >= start_date)
 
     result = await db.execute(query)
     rows = result.all()
 
-    return [
-        BookingsBySauna(
-            sauna_id=row[0],
-            sauna_name=row[1],
-            booking_count=row[2] or 0,
-            revenue=row[3] or 0.0,
-        )
-        for row in rows
-    ]
+    return model_response(
+        list[BookingsBySauna],
+        from_rows(
+            list[BookingsBySauna],
+            [
+                {
+                    "sauna_id": row[0],
+                    "sauna_name": row[1],
+                    "booking_count": row[2],
+                    "revenue": row[3],
+                }
+                for row in rows
+            ],
+        ),
+    )
 
 
 @router.get("/recent-bookings", response_model=list[RecentBooking])
@@ -224,17 +307,318 @@ async def get_recent_bookings(
         )
         sauna_map = {s.id: s.name for s in sauna_result.scalars().all()}
 
-    return [
-        RecentBooking(
-            id=b.id,
-            customer_name=b.customer_name,
-            sauna_name=sauna_map.get(b.sauna_id),
-            booking_date=b.booking_date,
-            start_time=b.start_time,
-            end_time=b.end_time,
-            total_price=b.total_price,
-            status=b.status,
-            created_at=b.created_at.isoformat() if b.created_at else "",
+    return model_response(
+        list[RecentBooking],
+        from_rows(
+            list[RecentBooking],
+            [
+                {
+                    "id": b.id,
+                    "customer_name": b.customer_name,
+                    "sauna_name": sauna_map.get(b.sauna_id),
+                    "booking_date": b.booking_date,
+                    "start_time": b.start_time,
+                    "end_time": b.end_time,
+                    "total_price": b.total_price,
+                    "status": b.status,
+                    "created_at": b.created_at.isoformat() if b.created_at else "",
+                }
+                for b in bookings
+            ],
+        ),
+    )
+
+
+def _nullable(values, digits: int) -> list[float | None]:
+    """Round a numpy array to nested lists, NaN becoming None"""
+    import numpy as np
+
+    rounded = values.round(digits)
+    return np.where(np.isnan(rounded), None, rounded).tolist()
+
+
+async def _weekly_open_minutes(
+    db: AsyncSession, saunas: list
+) -> dict[str, list[tuple[int, int] | None]]:
+    """Per-sauna (open, close) minutes for Monday..Sunday from operating hours"""
+    from app.services.occupancy import to_minutes_array
+
+    weekly = {}
+    for sauna_id, _, open_time, close_time in saunas:
+        default = tuple(to_minutes_array([open_time, close_time]).tolist())
+        weekly[sauna_id] = [default] * 7
+
+    result = await db.execute(
+        select(
+            OperatingHours.sauna_id,
+            OperatingHours.day_of_week,
+            OperatingHours.open_time,
+            OperatingHours.close_time,
+            OperatingHours.is_closed,
+        ).where(OperatingHours.sauna_id.in_(weekly.keys()))
+    )
+    for sauna_id, day_of_week, open_time, close_time, is_closed in result.all():
+        if is_closed:
+            weekly[sauna_id][day_of_week] = None
+        else:
+            weekly[sauna_id][day_of_week] = tuple(
+                to_minutes_array([open_time, close_time]).tolist()
+            )
+    return weekly
+
+
+@router.get("/occupancy", response_model=list[OccupancyHeatmap])
+async def get_occupancy_heatmap(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    mode: str = Query("weekday", pattern="^(weekday|date)$"),
+    sauna_id: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    admin: User = Depends(require_admin),
+):
+    """
+    Get hourly utilization heatmaps per sauna.
+    - mode "weekday": weekday x hour, summed over the range
+    - mode "date": date x hour
+    - Utilization is booked hours / open hours per cell (operating hours aware)
+    - Excludes cancelled bookings; archived bookings are read when the range reaches them
+    - Results cached per range for ANALYTICS_CACHE_TTL
+    """
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+    if (end_date - start_date).days >= 3660:
+        raise HTTPException(status_code=400, detail="Date range is limited to 3660 days")
+    from app.services.occupancy import compute_utilization, utilization_ratio
+
+    async def compute() -> list[OccupancyHeatmap]:
+        sauna_query = select(Sauna.id, Sauna.name, Sauna.open_time, Sauna.close_time)
+        if sauna_id:
+            sauna_query = sauna_query.where(Sauna.id == sauna_id)
+        saunas = (await db.execute(sauna_query.order_by(Sauna.name))).all()
+        if not saunas:
+            return []
+        weekly = await _weekly_open_minutes(db, saunas)
+
+        def booking_query(table):
+            query = select(
+                table.c.sauna_id, table.c.booking_date, table.c.start_time, table.c.end_time
+            ).where(
+                and_(
+                    table.c.booking_date >= start_date.isoformat(),
+                    table.c.booking_date <= end_date.isoformat(),
+                    table.c.status != "cancelled",
+                )
+            )
+            if sauna_id:
+                query = query.where(table.c.sauna_id == sauna_id)
+            return query
+
+        query = with_archive(
+            booking_query, await reaches_archive(db, start_date.isoformat())
+        )
+        rows = (await db.execute(query)).tuples().all()
+        columns = tuple(list(c) for c in zip(*rows)) if rows else ([], [], [], [])
+
+        # Array math runs off the event loop
+        labels, booked, opened = await asyncio.to_thread(
+            compute_utilization,
+            [s[0] for s in saunas],
+            weekly,
+            columns,
+            start_date,
+            end_date,
+            mode,
+        )
+        ratio = _nullable(utilization_ratio(booked, opened), 4)
+
+        return [
+            OccupancyHeatmap(
+                sauna_id=s[0],
+                sauna_name=s[1],
+                rows=labels,
+                booked_hours=booked[i].round(2).tolist(),
+                open_hours=opened[i].round(2).tolist(),
+                utilization=ratio[i],
+            )
+            for i, s in enumerate(saunas)
+        ]
+
+    heatmaps = await _occupancy_cache.get_or_compute(
+        (start_date, end_date, mode, sauna_id), compute
+    )
+    return model_response(list[OccupancyHeatmap], heatmaps)
+
+
+@router.get("/cohorts", response_model=CohortAnalytics)
+async def get_cohort_analytics(
+    granularity: str = Query("month", pattern="^(month|week)$"),
+    periods: int = Query(12, ge=1, le=60),
+    db: AsyncSession = Depends(get_read_db),
+    admin: User = Depends(require_admin),
+):
+    """
+    Get repeat-visit and lifetime value analytics per signup cohort.
+    - A customer's cohort is the period of their first booking (registered users only)
+    - Returns the latest `periods` cohorts with retention and cumulative revenue
+      per member for offsets 0..periods-1; future cells are null
+    - Excludes cancelled bookings
+    - Cached until booking data changes (checked with a cheap version query)
+    """
+    from app.services.cohorts import compute_cohorts, data_version_query
+
+    version = tuple((await db.execute(data_version_query())).one())
+    today = date.today()
+
+    async def compute() -> CohortAnalytics:
+        # Cohorts span all history, so archived bookings always count
+        query = with_archive(
+            lambda t: select(t.c.user_id, t.c.created_at, t.c.total_price).where(
+                and_(t.c.user_id.is_not(None), t.c.status != "cancelled")
+            )
+        )
+        rows = (await db.execute(query)).tuples().all()
+        columns = tuple(list(c) for c in zip(*rows)) if rows else ([], [], [])
+
+        # Array math runs off the event loop
+        result = await asyncio.to_thread(
+            compute_cohorts, columns, granularity, periods, today
+        )
+        repeat_rate = _nullable(result["repeat_rate"], 4)
+        median_gap = _nullable(result["median_gap_days"], 1)
+        retention = _nullable(result["retention"], 4)
+        ltv = _nullable(result["ltv"], 2)
+        overall_gap = result["overall_median_gap_days"]
+
+        return CohortAnalytics(
+            granularity=granularity,
+            repeat_rate=round(result["overall_repeat_rate"], 4),
+            median_days_between_visits=None if math.isnan(overall_gap) else round(overall_gap, 1),
+            cohorts=[
+                CohortRow(
+                    cohort=label,
+                    size=int(result["size"][i]),
+                    repeat_rate=repeat_rate[i],
+                    median_days_between_visits=median_gap[i],
+                    retention=retention[i],
+                    ltv=ltv[i],
+                )
+                for i, label in enumerate(result["labels"])
+            ],
         )
-        for b in bookings
+
+    analytics = await _cohort_cache.get_or_compute(
+        (version, today, granularity, periods), compute
+    )
+    return model_response(CohortAnalytics, analytics)
+
+
+@router.get("/db-pool", response_model=list[PoolStatus])
+async def get_db_pool_status(admin: User = Depends(require_admin)):
+    """
+    Get database connection pool metrics for this process.
+    - One entry per engine: the writer, plus the reader when a replica is set
+    - connects much higher than the pool size means connections are churned
+    - invalidations count connections dropped as stale or broken
+    """
+    return [PoolStatus(**pool_status(role)) for role in engines]
+
+
+@router.get("/jobs", response_model=list[JobStatusCount])
+async def get_job_status(
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    """
+    Get background job counts per kind and status.
+    - Failed jobs used up their attempts and are kept until requeued with
+      `python -m app.worker --retry-failed`
+    """
+    result = await db.execute(
+        select(Job.kind, Job.status, func.count()).group_by(Job.kind, Job.status)
+    )
+    counts = [
+        JobStatusCount(kind=kind, status=job_status, count=count)
+        for kind, job_status, count in result.all()
     ]
+    for row in counts:
+        if row.status == "failed":
+            row.last_error = (
+                await db.execute(
+                    select(Job.last_error)
+                    .where(Job.kind == row.kind, Job.status == "failed")
+                    .order_by(Job.finished_at.desc())
+                    .limit(1)
+                )
+            ).scalar()
+    return counts
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _require_stream_enabled() -> None:
+    if not settings.ADMIN_STREAM_ENABLED:
+        raise HTTPException(status_code=404, detail="Event stream is disabled")
+
+
+@router.post(
+    "/stream-token",
+    response_model=StreamToken,
+    dependencies=[Depends(_require_stream_enabled)],
+)
+async def create_event_stream_token(admin: User = Depends(require_admin)):
+    """
+    Issue a token for opening GET /admin/stream.
+    - Valid for STREAM_TOKEN_SECONDS and only for the stream, so the URL it
+      ends up in (and any access log) holds no reusable credential
+    - 404 when the stream is disabled (Lambda); the dashboard then polls
+    """
+    return StreamToken(
+        token=create_stream_token(admin.id), expires_in=settings.STREAM_TOKEN_SECONDS
+    )
+
+
+@router.get("/stream", dependencies=[Depends(_require_stream_enabled)])
+async def stream_dashboard_events(
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(require_admin_event_stream),
+):
+    """
+    Live dashboard updates as Server-Sent Events.
+    - First event "snapshot" carries fresh DashboardStats
+    - Then "booking.created", "booking.cancelled" and "booking.updated" events
+      with the booking and a stats_delta to add to the snapshot counters
+    - "bookings.completed" when the status sweeper completes bookings in this
+      process, with a count and a stats_delta
+    - Authenticate with ?token= from POST /admin/stream-token, since
+      EventSource cannot set headers; access tokens are rejected
+    - Events come from this process only; run a single worker or re-fetch
+      /admin/stats periodically when scaled out
+    """
+    # The stream may stay open for hours; don't hold the auth session's connection
+    await db.close()
+    queue = event_bus.subscribe()
+
+    async def events():
+        try:
+            async with async_session() as snapshot_db:
+                stats = await _dashboard_stats(snapshot_db, date.today().isoformat())
+            yield _sse("snapshot", stats.model_dump())
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=STREAM_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse(event.type, event.data)
+        finally:
+            event_bus.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,12 +1,20 @@
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, require_admin, require_user
+from app.api.deps import (
+    get_current_user,
+    get_read_db,
+    read_your_writes,
+    require_admin,
+    require_user,
+)
+from app.api.responses import from_rows, model_response
 from app.core.database import get_db
 from app.models.booking import Booking
+from app.models.booking_archive import BookingArchive
 from app.models.review import Review
 from app.models.sauna import Sauna
 from app.models.user import User
@@ -16,6 +24,15 @@ from app.schemas.booking import (
     BookingUpdate,
     TimeSlot,
 )
+from app.services.booking_archive import find_booking, reaches_archive
+from app.services.booking_stats import record_booking_change
+from app.services.dashboard_events import publish_booking_event
+from app.services.idempotency import (
+    claim_idempotency_key,
+    complete_idempotency_key,
+    release_idempotency_key,
+    request_fingerprint,
+)
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
@@ -31,6 +48,16 @@ def _from_minutes(minutes: int) -> str:
     return f"{minutes // 60:02d}:{minutes % 60:02d}"
 
 
+def _booking_to_response(
+    b: Booking | BookingArchive, sauna_name: str | None, has_review: bool
+) -> BookingResponse:
+    """Convert Booking model to BookingResponse"""
+    response = from_rows(BookingResponse, b)
+    response.sauna_name = sauna_name
+    response.has_review = has_review
+    return response
+
+
 @router.get("/availability", response_model=list[TimeSlot])
 async def get_availability(
     sauna_id: str = Query(...),
@@ -69,10 +96,10 @@ async def get_availability(
     return slots
 
 
-@router.get("/my")
+@router.get("/my", response_model=list[BookingResponse])
 async def list_my_bookings(
     status: str | None = Query(None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user: User = Depends(require_user),
 ):
     """
@@ -80,13 +107,17 @@ async def list_my_bookings(
     - User must be authenticated
     - Results are sorted by booking date (newest first)
     - Optional status filter (confirmed, completed, cancelled)
+    - Includes archived bookings; confirmed ones are never archived
     """
-    query = select(Booking).where(Booking.user_id == user.id)
-    if status:
-        query = query.where(Booking.status == status)
-    query = query.order_by(Booking.booking_date.desc(), Booking.start_time.desc())
-    result = await db.execute(query)
-    bookings = result.scalars().all()
+    models = [Booking] if status == "confirmed" else [Booking, BookingArchive]
+    bookings = []
+    for model in models:
+        query = select(model).where(model.user_id == user.id)
+        if status:
+            query = query.where(model.status == status)
+        result = await db.execute(query)
+        bookings.extend(result.scalars().all())
+    bookings.sort(key=lambda b: (b.booking_date, b.start_time), reverse=True)
 
     # Fetch sauna names
     sauna_ids = {b.sauna_id for b in bookings}
@@ -104,33 +135,19 @@ async def list_my_bookings(
         )
         review_map = {booking_id for (booking_id,) in r.all()}
 
-    return [
-        BookingResponse(
-            id=b.id,
-            sauna_id=b.sauna_id,
-            booking_date=b.booking_date,
-            start_time=b.start_time,
-            end_time=b.end_time,
-            guest_count=b.guest_count,
-            total_price=b.total_price,
-            customer_name=b.customer_name,
-            customer_phone=b.customer_phone,
-            customer_email=b.customer_email,
-            notes=b.notes,
-            status=b.status,
-            sauna_name=sauna_map.get(b.sauna_id),
-            has_review=b.id in review_map,
-        )
-        for b in bookings
-    ]
+    return model_response(
+        list[BookingResponse],
+        [
+            _booking_to_response(b, sauna_map.get(b.sauna_id), b.id in review_map)
+            for b in bookings
+        ],
+    )
 
 
-@router.post("", response_model=BookingResponse)
-async def create_booking(
-    data: BookingCreate,
-    db: AsyncSession = Depends(get_db),
-    user: User | None = Depends(get_current_user),
-):
+async def _add_booking(
+    data: BookingCreate, db: AsyncSession, user: User | None
+) -> tuple[Booking, Sauna]:
+    """Validate and flush a new booking and its rollup change; the caller commits"""
     result = await db.execute(select(Sauna).where(Sauna.id == data.sauna_id))
     sauna = result.scalar_one_or_none()
     if not sauna:
@@ -179,24 +196,46 @@ async def create_booking(
         notes=data.notes,
     )
     db.add(booking)
-    await db.commit()
+    await record_booking_change(db, booking, None, "confirmed")
+    await db.flush()
+    return booking, sauna
+
+
+@router.post("", response_model=BookingResponse, dependencies=[Depends(read_your_writes)])
+async def create_booking(
+    data: BookingCreate,
+    db: AsyncSession = Depends(get_db),
+    user: User | None = Depends(get_current_user),
+    idempotency_key: str | None = Header(None),
+):
+    """
+    Create a booking.
+    - With an Idempotency-Key header, retries with the same key and body get
+      the first response back (Idempotent-Replayed: true) instead of booking
+      again; the response is stored in the booking's transaction
+    """
+    scoped_key = None
+    if idempotency_key is not None:
+        claimed = await claim_idempotency_key(
+            db, user.id if user else None, idempotency_key, request_fingerprint(data)
+        )
+        if isinstance(claimed, Response):
+            return claimed
+        scoped_key = claimed
+
+    try:
+        booking, sauna = await _add_booking(data, db, user)
+        response = model_response(BookingResponse, _booking_to_response(booking, sauna.name, False))
+        if scoped_key:
+            await complete_idempotency_key(db, scoped_key, response)
+        await db.commit()
+    except Exception:
+        if scoped_key:
+            await release_idempotency_key(db, scoped_key)
+        raise
     await db.refresh(booking)
-    return BookingResponse(
-        id=booking.id,
-        sauna_id=booking.sauna_id,
-        booking_date=booking.booking_date,
-        start_time=booking.start_time,
-        end_time=booking.end_time,
-        guest_count=booking.guest_count,
-        total_price=booking.total_price,
-        customer_name=booking.customer_name,
-        customer_phone=booking.customer_phone,
-        customer_email=booking.customer_email,
-        notes=booking.notes,
-        status=booking.status,
-        sauna_name=sauna.name,
-        has_review=False,
-    )
+    publish_booking_event("booking.created", booking, sauna.name, None)
+    return response
 
 
 @router.get("", response_model=list[BookingResponse])
@@ -207,16 +246,22 @@ async def list_bookings(
     db: AsyncSession = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    query = select(Booking)
-    if date:
-        query = query.where(Booking.booking_date == date)
-    if sauna_id:
-        query = query.where(Booking.sauna_id == sauna_id)
-    if status:
-        query = query.where(Booking.status == status)
-    query = query.order_by(Booking.booking_date.desc(), Booking.start_time)
-    result = await db.execute(query)
-    bookings = result.scalars().all()
+    models = [Booking]
+    if status != "confirmed" and await reaches_archive(db, date):
+        models.append(BookingArchive)
+    bookings = []
+    for model in models:
+        query = select(model)
+        if date:
+            query = query.where(model.booking_date == date)
+        if sauna_id:
+            query = query.where(model.sauna_id == sauna_id)
+        if status:
+            query = query.where(model.status == status)
+        result = await db.execute(query)
+        bookings.extend(result.scalars().all())
+    bookings.sort(key=lambda b: b.start_time)
+    bookings.sort(key=lambda b: b.booking_date, reverse=True)
 
     # Fetch sauna names
     sauna_ids = {b.sauna_id for b in bookings}
@@ -234,31 +279,18 @@ async def list_bookings(
         )
         review_map = {booking_id for (booking_id,) in r.all()}
 
-    return [
-        BookingResponse(
-            id=b.id,
-            sauna_id=b.sauna_id,
-            booking_date=b.booking_date,
-            start_time=b.start_time,
-            end_time=b.end_time,
-            guest_count=b.guest_count,
-            total_price=b.total_price,
-            customer_name=b.customer_name,
-            customer_phone=b.customer_phone,
-            customer_email=b.customer_email,
-            notes=b.notes,
-            status=b.status,
-            sauna_name=sauna_map.get(b.sauna_id),
-            has_review=b.id in review_map,
-        )
-        for b in bookings
-    ]
+    return model_response(
+        list[BookingResponse],
+        [
+            _booking_to_response(b, sauna_map.get(b.sauna_id), b.id in review_map)
+            for b in bookings
+        ],
+    )
 
 
 @router.get("/{booking_id}", response_model=BookingResponse)
 async def get_booking(booking_id: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Booking).where(Booking.id == booking_id))
-    booking = result.scalar_one_or_none()
+    booking = await find_booking(db, booking_id)
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     sauna_result = await db.execute(select(Sauna).where(Sauna.id == booking.sauna_id))
@@ -270,25 +302,14 @@ async def get_booking(booking_id: str, db: AsyncSession = Depends(get_db)):
     )
     has_review = review_result.scalar_one_or_none() is not None
 
-    return BookingResponse(
-        id=booking.id,
-        sauna_id=booking.sauna_id,
-        booking_date=booking.booking_date,
-        start_time=booking.start_time,
-        end_time=booking.end_time,
-        guest_count=booking.guest_count,
-        total_price=booking.total_price,
-        customer_name=booking.customer_name,
-        customer_phone=booking.customer_phone,
-        customer_email=booking.customer_email,
-        notes=booking.notes,
-        status=booking.status,
-        sauna_name=sauna.name if sauna else None,
-        has_review=has_review,
-    )
+    return _booking_to_response(booking, sauna.name if sauna else None, has_review)
 
 
-@router.patch("/{booking_id}/cancel", response_model=BookingResponse)
+@router.patch(
+    "/{booking_id}/cancel",
+    response_model=BookingResponse,
+    dependencies=[Depends(read_your_writes)],
+)
 async def cancel_booking(
     booking_id: str,
     db: AsyncSession = Depends(get_db),
@@ -321,7 +342,9 @@ async def cancel_booking(
             detail="이미 취소된 예약입니다.",
         )
 
+    old_status = booking.status
     booking.status = "cancelled"
+    await record_booking_change(db, booking, old_status, booking.status)
     await db.commit()
     await db.refresh(booking)
 
@@ -334,25 +357,16 @@ async def cancel_booking(
     )
     has_review = review_result.scalar_one_or_none() is not None
 
-    return BookingResponse(
-        id=booking.id,
-        sauna_id=booking.sauna_id,
-        booking_date=booking.booking_date,
-        start_time=booking.start_time,
-        end_time=booking.end_time,
-        guest_count=booking.guest_count,
-        total_price=booking.total_price,
-        customer_name=booking.customer_name,
-        customer_phone=booking.customer_phone,
-        customer_email=booking.customer_email,
-        notes=booking.notes,
-        status=booking.status,
-        sauna_name=sauna.name if sauna else None,
-        has_review=has_review,
-    )
+    sauna_name = sauna.name if sauna else None
+    publish_booking_event("booking.cancelled", booking, sauna_name, old_status)
+    return _booking_to_response(booking, sauna_name, has_review)
 
 
-@router.patch("/{booking_id}", response_model=BookingResponse)
+@router.patch(
+    "/{booking_id}",
+    response_model=BookingResponse,
+    dependencies=[Depends(read_your_writes)],
+)
 async def update_booking(
     booking_id: str,
     data: BookingUpdate,
@@ -363,8 +377,10 @@ async def update_booking(
     booking = result.scalar_one_or_none()
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
+    old_status = booking.status
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(booking, key, value)
+    await record_booking_change(db, booking, old_status, booking.status)
     await db.commit()
     await db.refresh(booking)
     sauna_result = await db.execute(select(Sauna).where(Sauna.id == booking.sauna_id))
@@ -376,19 +392,8 @@ async def update_booking(
     )
     has_review = review_result.scalar_one_or_none() is not None
 
-    return BookingResponse(
-        id=booking.id,
-        sauna_id=booking.sauna_id,
-        booking_date=booking.booking_date,
-        start_time=booking.start_time,
-        end_time=booking.end_time,
-        guest_count=booking.guest_count,
-        total_price=booking.total_price,
-        customer_name=booking.customer_name,
-        customer_phone=booking.customer_phone,
-        customer_email=booking.customer_email,
-        notes=booking.notes,
-        status=booking.status,
-        sauna_name=sauna.name if sauna else None,
-        has_review=has_review,
-    )
+    sauna_name = sauna.name if sauna else None
+    if booking.status != old_status:
+        event_type = "booking.cancelled" if booking.status == "cancelled" else "booking.updated"
+        publish_booking_event(event_type, booking, sauna_name, old_status)
+    return _booking_to_response(booking, sauna_name, has_review)
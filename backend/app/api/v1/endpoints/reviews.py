@@ -1,19 +1,75 @@
+import base64
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from app.api.deps import get_current_user, require_user
+from app.api.deps import get_current_user, get_read_db, read_your_writes, require_user
+from app.api.responses import from_rows, model_response
 from app.core.database import get_db
-from app.models.booking import Booking
 from app.models.review import Review
+from app.models.sauna import Sauna
 from app.models.user import User
-from app.schemas.review import ReviewCreate, ReviewResponse, ReviewSummary
+from app.schemas.review import (
+    ReviewCreate,
+    ReviewPage,
+    ReviewResponse,
+    ReviewSummary,
+)
+from app.services.booking_archive import find_booking
+from app.services.ratings import (
+    SUMMARY_COLUMNS,
+    apply_review_rating,
+    rating_distribution,
+)
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
 
-@router.post("", response_model=ReviewResponse)
+def _encode_cursor(created_at: datetime, review_id: str) -> str:
+    raw = f"{created_at.isoformat()}|{review_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, review_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), review_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
+def _summary_from_aggregates(aggregates) -> ReviewSummary:
+    """Build a ReviewSummary from a row selected with SUMMARY_COLUMNS (or None)"""
+    if aggregates is None or not aggregates.review_count:
+        return ReviewSummary(
+            average_rating=0.0,
+            review_count=0,
+            rating_distribution={1: 0, 2: 0, 3: 0, 4: 0, 5: 0},
+        )
+    return ReviewSummary(
+        average_rating=aggregates.rating_sum / aggregates.review_count,
+        review_count=aggregates.review_count,
+        rating_distribution=rating_distribution(aggregates),
+    )
+
+
+def _review_to_response(r: Review, user_name: str) -> ReviewResponse:
+    """Convert Review model to ReviewResponse"""
+    return ReviewResponse(
+        id=r.id,
+        sauna_id=r.sauna_id,
+        user_id=r.user_id,
+        booking_id=r.booking_id,
+        rating=r.rating,
+        comment=r.comment,
+        created_at=r.created_at,
+        user_name=user_name,
+    )
+
+
+@router.post("", response_model=ReviewResponse, dependencies=[Depends(read_your_writes)])
 async def create_review(
     data: ReviewCreate,
     db: AsyncSession = Depends(get_db),
@@ -22,14 +78,11 @@ async def create_review(
     """
     Create a new review for a sauna.
     - User must be logged in
-    - User must have a completed or confirmed booking for the sauna
+    - User must have a completed booking for the sauna
     - Only one review per booking is allowed
     """
     # Check if booking exists and belongs to the user
-    result = await db.execute(
-        select(Booking).where(Booking.id == data.booking_id)
-    )
-    booking = result.scalar_one_or_none()
+    booking = await find_booking(db, data.booking_id)
 
     if not booking:
         raise HTTPException(
@@ -49,11 +102,11 @@ async def create_review(
             detail="예약된 사우나와 리뷰 대상이 일치하지 않습니다.",
         )
 
-    # Check if booking status is confirmed or completed
-    if booking.status not in ["confirmed", "completed"]:
+    # Bookings become completed once their end time passes (booking status sweeper)
+    if booking.status != "completed":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="완료되었거나 확인된 예약에만 리뷰를 작성할 수 있습니다.",
+            detail="이용이 완료된 예약에만 리뷰를 작성할 수 있습니다.",
         )
 
     # Check for duplicate review
@@ -75,93 +128,117 @@ async def create_review(
         comment=data.comment,
     )
     db.add(review)
+    await apply_review_rating(db, review.sauna_id, review.rating, 1)
     await db.commit()
     await db.refresh(review)
 
-    return ReviewResponse(
-        id=review.id,
-        sauna_id=review.sauna_id,
-        user_id=review.user_id,
-        booking_id=review.booking_id,
-        rating=review.rating,
-        comment=review.comment,
-        created_at=review.created_at,
-        user_name=user.full_name,
-    )
+    return _review_to_response(review, user.full_name)
 
 
-@router.get("", response_model=list[ReviewResponse])
+@router.get("", response_model=ReviewPage)
 async def list_reviews(
     sauna_id: str = Query(...),
-    db: AsyncSession = Depends(get_db),
+    rating: int | None = Query(None, ge=1, le=5),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
-    Get all reviews for a specific sauna.
+    Get reviews for a specific sauna, one page at a time.
     - No authentication required
     - Results are sorted by creation date (newest first)
+    - Optional rating filter (1-5)
+    - Pass next_cursor from the previous page as cursor to continue
     """
-    result = await db.execute(
-        select(Review)
+    query = (
+        select(
+            Review.id,
+            Review.sauna_id,
+            Review.user_id,
+            Review.booking_id,
+            Review.rating,
+            Review.comment,
+            Review.created_at,
+            func.coalesce(User.full_name, "익명").label("user_name"),
+        )
+        .outerjoin(User, User.id == Review.user_id)
         .where(Review.sauna_id == sauna_id)
-        .options(joinedload(Review.user))
-        .order_by(Review.created_at.desc())
     )
-    reviews = result.unique().scalars().all()
-
-    return [
-        ReviewResponse(
-            id=r.id,
-            sauna_id=r.sauna_id,
-            user_id=r.user_id,
-            booking_id=r.booking_id,
-            rating=r.rating,
-            comment=r.comment,
-            created_at=r.created_at,
-            user_name=r.user.full_name if r.user else "익명",
+    if rating is not None:
+        query = query.where(Review.rating == rating)
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.where(
+            or_(
+                Review.created_at < cursor_created_at,
+                and_(Review.created_at == cursor_created_at, Review.id < cursor_id),
+            )
         )
-        for r in reviews
-    ]
+    query = query.order_by(Review.created_at.desc(), Review.id.desc()).limit(limit + 1)
+
+    result = await db.execute(query)
+    rows = result.all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    page = ReviewPage(
+        items=from_rows(list[ReviewResponse], [row._mapping for row in rows]),
+        next_cursor=next_cursor,
+    )
+    return model_response(ReviewPage, page)
 
 
 @router.get("/summary", response_model=ReviewSummary)
 async def get_review_summary(
     sauna_id: str = Query(...),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get review statistics for a specific sauna.
     - No authentication required
     - Returns average rating, total count, and distribution by star rating
+    - Reads the sauna's maintained aggregates instead of scanning reviews
     """
-    # Get all reviews for the sauna
-    result = await db.execute(
-        select(Review).where(Review.sauna_id == sauna_id)
-    )
-    reviews = result.scalars().all()
+    result = await db.execute(select(*SUMMARY_COLUMNS).where(Sauna.id == sauna_id))
+    return _summary_from_aggregates(result.one_or_none())
 
-    if not reviews:
-        return ReviewSummary(
-            average_rating=0.0,
-            review_count=0,
-            rating_distribution={1: 0, 2: 0, 3: 0, 4: 0, 5: 0},
-        )
 
-    # Calculate average and distribution
-    ratings = [r.rating for r in reviews]
-    average_rating = sum(ratings) / len(ratings)
+@router.get("/summaries", response_model=dict[str, ReviewSummary])
+async def get_review_summaries(
+    sauna_ids: list[str] = Query(...),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Get review statistics for many saunas in one call.
+    - No authentication required
+    - Up to 100 sauna ids (repeat sauna_ids); returns a summary keyed by every requested id
+    - Unknown saunas get an empty summary
+    """
+    sauna_ids = list(dict.fromkeys(sauna_ids))
+    if len(sauna_ids) > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="한 번에 최대 100개의 사우나만 조회할 수 있습니다.",
+        )
 
-    rating_distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    for rating in ratings:
-        rating_distribution[rating] += 1
+    rows = {}
+    if sauna_ids:
+        result = await db.execute(select(*SUMMARY_COLUMNS).where(Sauna.id.in_(sauna_ids)))
+        rows = {row.id: row for row in result.all()}
 
-    return ReviewSummary(
-        average_rating=average_rating,
-        review_count=len(reviews),
-        rating_distribution=rating_distribution,
+    return model_response(
+        dict[str, ReviewSummary],
+        {sauna_id: _summary_from_aggregates(rows.get(sauna_id)) for sauna_id in sauna_ids},
     )
 
 
-@router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{review_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(read_your_writes)],
+)
 async def delete_review(
     review_id: str,
     db: AsyncSession = Depends(get_db),
@@ -188,4 +265,5 @@ async def delete_review(
         )
 
     await db.delete(review)
+    await apply_review_rating(db, review.sauna_id, review.rating, -1)
     await db.commit()
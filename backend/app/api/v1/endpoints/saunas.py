@@ -1,103 +1,156 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, select, update
+import asyncio
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+from sqlalchemy import and_, case, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.deps import require_admin
+from app.api.deps import get_read_db, precompressed, read_your_writes, require_admin
+from app.api.responses import from_rows, model_response
+from app.core.config import settings
 from app.core.database import get_db
 from app.models.sauna import Sauna
 from app.models.sauna_image import SaunaImage
+from app.models.sauna_image_variant import SaunaImageVariant
 from app.models.operating_hours import OperatingHours
 from app.models.user import User
 from app.schemas.sauna import (
+    FacetCount,
     SaunaCreate,
+    SaunaFacets,
+    SaunaListPage,
     SaunaResponse,
     SaunaUpdate,
     SaunaDetailResponse,
     SaunaImageResponse,
-    OperatingHoursResponse,
+    SaunaImagesReplace,
 )
+from app.services.storage import get_storage
 
 router = APIRouter(prefix="/saunas", tags=["saunas"])
 
+# Page size when a page is requested (offset or include_facets) without limit
+DEFAULT_PAGE_LIMIT = 20
+
+# Facet buckets as (label, lower bound inclusive, upper bound exclusive)
+PRICE_BUCKETS = [
+    ("0-50000", None, 50000),
+    ("50000-80000", 50000, 80000),
+    ("80000-120000", 80000, 120000),
+    ("120000+", 120000, None),
+]
+TEMPERATURE_BUCKETS = [
+    ("0-60", None, 60),
+    ("60-80", 60, 80),
+    ("80+", 80, None),
+]
+
+
+def _bucket_case(column, buckets):
+    """Build a CASE expression mapping a numeric column to its bucket label"""
+    whens = []
+    for label, low, high in buckets:
+        conditions = []
+        if low is not None:
+            conditions.append(column >= low)
+        if high is not None:
+            conditions.append(column < high)
+        whens.append((and_(*conditions), label))
+    return case(*whens, else_=None)
+
+
+async def _sauna_facets(
+    db: AsyncSession,
+    sauna_type: str | None,
+    min_price: float | None,
+    max_price: float | None,
+) -> tuple[SaunaFacets, int]:
+    """
+    Compute facet counts with a single grouped aggregation.
+    - Groups active saunas by (type, price bucket, temperature bucket)
+    - Each facet applies every filter except its own, so options stay selectable
+    - Also returns the total number of saunas matching all filters
+    """
+    price_bucket = _bucket_case(Sauna.hourly_rate, PRICE_BUCKETS)
+    temperature_bucket = _bucket_case(Sauna.temperature_max, TEMPERATURE_BUCKETS)
+    columns = [Sauna.sauna_type, price_bucket, temperature_bucket]
+
+    price_conditions = []
+    if min_price is not None:
+        price_conditions.append(Sauna.hourly_rate >= min_price)
+    if max_price is not None:
+        price_conditions.append(Sauna.hourly_rate <= max_price)
+    if price_conditions:
+        columns.append(case((and_(*price_conditions), True), else_=False))
+
+    query = (
+        select(*columns, func.count(Sauna.id))
+        .where(Sauna.is_active == True)
+        .group_by(*columns)
+    )
+    result = await db.execute(query)
+
+    type_counts: dict[str | None, int] = {}
+    price_counts = {label: 0 for label, _, _ in PRICE_BUCKETS}
+    temperature_counts = {label: 0 for label, _, _ in TEMPERATURE_BUCKETS}
+    total = 0
+    for row in result.all():
+        row_type, row_price, row_temperature = row[0], row[1], row[2]
+        count = row[-1]
+        price_match = bool(row[3]) if price_conditions else True
+        type_match = not sauna_type or row_type == sauna_type
+
+        if price_match:
+            type_counts[row_type] = type_counts.get(row_type, 0) + count
+        if type_match and row_price is not None:
+            price_counts[row_price] += count
+        if type_match and price_match:
+            total += count
+            if row_temperature is not None:
+                temperature_counts[row_temperature] += count
+
+    facets = SaunaFacets(
+        sauna_type=[
+            FacetCount(value=value, count=count)
+            for value, count in sorted(
+                type_counts.items(), key=lambda x: (-x[1], x[0] or "")
+            )
+        ],
+        price=[FacetCount(value=k, count=v) for k, v in price_counts.items()],
+        temperature=[
+            FacetCount(value=k, count=v) for k, v in temperature_counts.items()
+        ],
+    )
+    return facets, total
+
 
 def _sauna_to_response(s: Sauna) -> SaunaResponse:
     """Convert Sauna model to SaunaResponse"""
-    return SaunaResponse(
-        id=s.id,
-        name=s.name,
-        description=s.description,
-        capacity=s.capacity,
-        hourly_rate=s.hourly_rate,
-        image_url=s.image_url,
-        amenities=s.amenities,
-        is_active=s.is_active,
-        open_time=s.open_time,
-        close_time=s.close_time,
-        address=s.address,
-        road_address=s.road_address,
-        latitude=s.latitude,
-        longitude=s.longitude,
-        phone=s.phone,
-        sauna_type=s.sauna_type,
-        temperature_min=s.temperature_min,
-        temperature_max=s.temperature_max,
-    )
+    return from_rows(SaunaResponse, s)
 
 
 def _sauna_to_detail_response(s: Sauna) -> SaunaDetailResponse:
     """Convert Sauna model to SaunaDetailResponse with images and operating hours"""
-    images = [
-        SaunaImageResponse(
-            id=img.id,
-            image_url=img.image_url,
-            display_order=img.display_order,
-            is_primary=img.is_primary,
-        )
-        for img in sorted(s.images, key=lambda x: (not x.is_primary, x.display_order))
-    ]
-
-    hours = [
-        OperatingHoursResponse(
-            id=h.id,
-            day_of_week=h.day_of_week,
-            open_time=h.open_time,
-            close_time=h.close_time,
-            is_closed=h.is_closed,
-        )
-        for h in sorted(s.operating_hours, key=lambda x: x.day_of_week)
-    ]
-
-    return SaunaDetailResponse(
-        id=s.id,
-        name=s.name,
-        description=s.description,
-        capacity=s.capacity,
-        hourly_rate=s.hourly_rate,
-        image_url=s.image_url,
-        amenities=s.amenities,
-        is_active=s.is_active,
-        open_time=s.open_time,
-        close_time=s.close_time,
-        address=s.address,
-        road_address=s.road_address,
-        latitude=s.latitude,
-        longitude=s.longitude,
-        phone=s.phone,
-        sauna_type=s.sauna_type,
-        temperature_min=s.temperature_min,
-        temperature_max=s.temperature_max,
-        images=images,
-        operating_hours=hours,
-    )
+    response = from_rows(SaunaDetailResponse, s)
+    response.images.sort(key=lambda x: (not x.is_primary, x.display_order))
+    response.operating_hours.sort(key=lambda x: x.day_of_week)
+    return response
 
 
-@router.get("", response_model=list[SaunaResponse])
+@router.get(
+    "",
+    response_model=list[SaunaResponse] | SaunaListPage,
+    dependencies=[Depends(precompressed)],
+)
 async def list_saunas(
     sauna_type: str | None = Query(None),
     min_price: float | None = Query(None),
     max_price: float | None = Query(None),
-    db: AsyncSession = Depends(get_db),
+    limit: int | None = Query(None, ge=1, le=100),
+    offset: int | None = Query(None, ge=0),
+    include_facets: bool = Query(False),
+    sort: str = Query("name", pattern="^(name|rating)$"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     List all active saunas with optional filtering.
@@ -106,6 +159,12 @@ async def list_saunas(
     - sauna_type: Filter by sauna type (traditional, smoke, infrared, steam, etc.)
     - min_price: Filter by minimum hourly rate
     - max_price: Filter by maximum hourly rate
+    - limit, offset: Return a paginated page instead of the full list; limit
+      defaults to DEFAULT_PAGE_LIMIT
+    - include_facets: Return a page with counts per type, price and temperature bucket
+    - sort: "name" (default) or "rating" (highest average first, unrated last)
+
+    Without limit, offset or include_facets the plain list is returned.
     """
     query = select(Sauna).where(Sauna.is_active == True)
 
@@ -118,14 +177,52 @@ async def list_saunas(
     if max_price is not None:
         query = query.where(Sauna.hourly_rate <= max_price)
 
-    query = query.order_by(Sauna.name)
-    result = await db.execute(query)
+    if sort == "rating":
+        order_by = [
+            Sauna.review_count == 0,
+            Sauna.average_rating.desc(),
+            Sauna.review_count.desc(),
+            Sauna.name,
+        ]
+    else:
+        order_by = [Sauna.name]
+
+    if limit is None and offset is None and not include_facets:
+        query = query.order_by(*order_by)
+        result = await db.execute(query)
+        return model_response(
+            list[SaunaResponse], from_rows(list[SaunaResponse], result.scalars().all())
+        )
+
+    facets = None
+    if include_facets:
+        facets, total = await _sauna_facets(db, sauna_type, min_price, max_price)
+    else:
+        total_result = await db.execute(
+            select(func.count()).select_from(query.subquery())
+        )
+        total = total_result.scalar() or 0
+
+    limit = limit or DEFAULT_PAGE_LIMIT
+    offset = offset or 0
+    result = await db.execute(query.order_by(*order_by, Sauna.id).offset(offset).limit(limit))
 
-    return [_sauna_to_response(s) for s in result.scalars().all()]
+    page = SaunaListPage(
+        items=from_rows(list[SaunaResponse], result.scalars().all()),
+        total=total,
+        limit=limit,
+        offset=offset,
+        facets=facets,
+    )
+    return model_response(SaunaListPage, page)
 
 
-@router.get("/{sauna_id}", response_model=SaunaDetailResponse)
-async def get_sauna(sauna_id: str, db: AsyncSession = Depends(get_db)):
+@router.get(
+    "/{sauna_id}",
+    response_model=SaunaDetailResponse,
+    dependencies=[Depends(precompressed)],
+)
+async def get_sauna(sauna_id: str, db: AsyncSession = Depends(get_read_db)):
     """Get detailed sauna information including images and operating hours"""
     result = await db.execute(
         select(Sauna)
@@ -138,10 +235,10 @@ async def get_sauna(sauna_id: str, db: AsyncSession = Depends(get_db)):
     sauna = result.scalar_one_or_none()
     if not sauna:
         raise HTTPException(status_code=404, detail="사우나를 찾을 수 없습니다")
-    return _sauna_to_detail_response(sauna)
+    return model_response(SaunaDetailResponse, _sauna_to_detail_response(sauna))
 
 
-@router.post("", response_model=SaunaResponse)
+@router.post("", response_model=SaunaResponse, dependencies=[Depends(read_your_writes)])
 async def create_sauna(
     data: SaunaCreate,
     db: AsyncSession = Depends(get_db),
@@ -155,7 +252,11 @@ async def create_sauna(
     return _sauna_to_response(sauna)
 
 
-@router.put("/{sauna_id}", response_model=SaunaResponse)
+@router.put(
+    "/{sauna_id}",
+    response_model=SaunaResponse,
+    dependencies=[Depends(read_your_writes)],
+)
 async def update_sauna(
     sauna_id: str,
     data: SaunaUpdate,
@@ -174,7 +275,46 @@ async def update_sauna(
     return _sauna_to_response(sauna)
 
 
-@router.post("/{sauna_id}/images", response_model=SaunaImageResponse)
+async def _add_image(
+    db: AsyncSession,
+    sauna: Sauna,
+    image_url: str,
+    display_order: int,
+    is_primary: bool,
+    variants: list[SaunaImageVariant] | None = None,
+) -> SaunaImage:
+    """Insert an image, keeping a single primary image and the sauna thumbnail in sync"""
+    variants = variants or []
+
+    # If marking as primary, unmark other primary images
+    if is_primary:
+        await db.execute(
+            update(SaunaImage)
+            .where(and_(SaunaImage.sauna_id == sauna.id, SaunaImage.is_primary == True))
+            .values(is_primary=False)
+        )
+        sauna.thumbnail_url = next(
+            (v.url for v in variants if v.name == "thumbnail"), None
+        )
+
+    image = SaunaImage(
+        sauna_id=sauna.id,
+        image_url=image_url,
+        display_order=display_order,
+        is_primary=is_primary,
+        variants=variants,
+    )
+    db.add(image)
+    await db.commit()
+    await db.refresh(image)
+    return image
+
+
+@router.post(
+    "/{sauna_id}/images",
+    response_model=SaunaImageResponse,
+    dependencies=[Depends(read_your_writes)],
+)
 async def add_sauna_image(
     sauna_id: str,
     image_url: str = Query(...),
@@ -189,40 +329,178 @@ async def add_sauna_image(
     if not sauna:
         raise HTTPException(status_code=404, detail="사우나를 찾을 수 없습니다")
 
-    # If marking as primary, unmark other primary images
-    if is_primary:
+    image = await _add_image(db, sauna, image_url, display_order, is_primary)
+    return from_rows(SaunaImageResponse, image)
+
+
+@router.post(
+    "/{sauna_id}/images/upload",
+    response_model=SaunaImageResponse,
+    dependencies=[Depends(read_your_writes)],
+)
+async def upload_sauna_image(
+    sauna_id: str,
+    file: UploadFile = File(...),
+    display_order: int = Form(0),
+    is_primary: bool = Form(False),
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    """
+    Upload an image file for a sauna (admin only).
+    - Stores the original plus resized WebP variants (thumbnail, medium, large)
+    - A primary upload also becomes the sauna's listing thumbnail
+    """
+    # Pillow is only loaded by instances that actually process uploads
+    from app.services.images import InvalidImageError, process_image_upload
+
+    result = await db.execute(select(Sauna).where(Sauna.id == sauna_id))
+    sauna = result.scalar_one_or_none()
+    if not sauna:
+        raise HTTPException(status_code=404, detail="사우나를 찾을 수 없습니다")
+
+    data = await file.read(settings.IMAGE_MAX_UPLOAD_BYTES + 1)
+    if len(data) > settings.IMAGE_MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="이미지 파일이 너무 큽니다",
+        )
+
+    storage = get_storage()
+    try:
+        stored = await process_image_upload(data, f"saunas/{sauna_id}", storage)
+    except InvalidImageError:
+        raise HTTPException(status_code=400, detail="지원하지 않는 이미지 형식입니다")
+
+    original = next(v for v in stored if v.name == "original")
+    variants = [
+        SaunaImageVariant(
+            name=v.name,
+            width=v.width,
+            height=v.height,
+            format=v.format,
+            url=v.url,
+            storage_key=v.storage_key,
+        )
+        for v in stored
+    ]
+    try:
+        image = await _add_image(db, sauna, original.url, display_order, is_primary, variants)
+    except Exception:
+        # Nothing references the stored files without the rows; don't orphan them
+        await asyncio.gather(*(storage.delete(v.storage_key) for v in stored), return_exceptions=True)
+        raise
+    return from_rows(SaunaImageResponse, image)
+
+
+@router.put(
+    "/{sauna_id}/images",
+    response_model=list[SaunaImageResponse],
+    dependencies=[Depends(read_your_writes)],
+)
+async def replace_sauna_images(
+    sauna_id: str,
+    data: SaunaImagesReplace,
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    """
+    Replace a sauna's gallery in one transaction (admin only).
+    - Entries with id keep that image; entries with image_url add a new image
+    - Existing images missing from the list are deleted with their variants
+    - List position becomes display_order; at most one entry may be primary
+    """
+    primaries = [item for item in data.images if item.is_primary]
+    if len(primaries) > 1:
+        raise HTTPException(status_code=400, detail="대표 이미지는 하나만 지정할 수 있습니다")
+    keep_ids = [item.id for item in data.images if item.id]
+    if len(keep_ids) != len(set(keep_ids)):
+        raise HTTPException(status_code=400, detail="중복된 이미지가 있습니다")
+    if any(not item.id and not item.image_url for item in data.images):
+        raise HTTPException(status_code=400, detail="새 이미지에는 image_url이 필요합니다")
+
+    result = await db.execute(select(Sauna).where(Sauna.id == sauna_id))
+    sauna = result.scalar_one_or_none()
+    if not sauna:
+        raise HTTPException(status_code=404, detail="사우나를 찾을 수 없습니다")
+
+    result = await db.execute(select(SaunaImage).where(SaunaImage.sauna_id == sauna_id))
+    existing = {image.id: image for image in result.scalars().all()}
+    if set(keep_ids) - existing.keys():
+        raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다")
+
+    removed_ids = list(existing.keys() - set(keep_ids))
+    storage_keys = [
+        v.storage_key for image_id in removed_ids for v in existing[image_id].variants
+    ]
+    if removed_ids:
+        await db.execute(
+            delete(SaunaImageVariant).where(SaunaImageVariant.image_id.in_(removed_ids))
+        )
+        await db.execute(delete(SaunaImage).where(SaunaImage.id.in_(removed_ids)))
+
+    primary_id = primaries[0].id if primaries else None
+    if keep_ids:
+        orders = {item.id: order for order, item in enumerate(data.images) if item.id}
         await db.execute(
             update(SaunaImage)
-            .where(and_(SaunaImage.sauna_id == sauna_id, SaunaImage.is_primary == True))
-            .values(is_primary=False)
+            .where(SaunaImage.id.in_(keep_ids))
+            .values(
+                display_order=case(orders, value=SaunaImage.id),
+                is_primary=SaunaImage.id == primary_id,
+            )
+            .execution_options(synchronize_session=False)
         )
 
-    image = SaunaImage(
-        sauna_id=sauna_id,
-        image_url=image_url,
-        display_order=display_order,
-        is_primary=is_primary,
+    new_rows = [
+        {
+            "sauna_id": sauna_id,
+            "image_url": item.image_url,
+            "display_order": order,
+            "is_primary": item.is_primary,
+        }
+        for order, item in enumerate(data.images)
+        if not item.id
+    ]
+    if new_rows:
+        await db.execute(insert(SaunaImage), new_rows)
+
+    # Only uploaded images have variants, so a new URL primary has no thumbnail
+    primary_variants = existing[primary_id].variants if primary_id else []
+    sauna.thumbnail_url = next(
+        (v.url for v in primary_variants if v.name == "thumbnail"), None
     )
-    db.add(image)
     await db.commit()
-    await db.refresh(image)
 
-    return SaunaImageResponse(
-        id=image.id,
-        image_url=image.image_url,
-        display_order=image.display_order,
-        is_primary=image.is_primary,
+    storage = get_storage()
+    await asyncio.gather(
+        *(storage.delete(key) for key in storage_keys), return_exceptions=True
+    )
+
+    result = await db.execute(
+        select(SaunaImage)
+        .where(SaunaImage.sauna_id == sauna_id)
+        .order_by(SaunaImage.display_order)
+        .execution_options(populate_existing=True)
+    )
+    return model_response(
+        list[SaunaImageResponse],
+        from_rows(list[SaunaImageResponse], result.scalars().all()),
     )
 
 
-@router.delete("/{sauna_id}/images/{image_id}", status_code=204)
+@router.delete(
+    "/{sauna_id}/images/{image_id}",
+    status_code=204,
+    dependencies=[Depends(read_your_writes)],
+)
 async def delete_sauna_image(
     sauna_id: str,
     image_id: str,
     db: AsyncSession = Depends(get_db),
     admin: User = Depends(require_admin),
 ):
-    """Delete an image from a sauna (admin only)"""
+    """Delete an image and its stored variants from a sauna (admin only)"""
     result = await db.execute(
         select(SaunaImage).where(
             and_(SaunaImage.id == image_id, SaunaImage.sauna_id == sauna_id)
@@ -232,5 +510,16 @@ async def delete_sauna_image(
     if not image:
         raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다")
 
+    storage_keys = [v.storage_key for v in image.variants]
+    if image.is_primary:
+        await db.execute(
+            update(Sauna).where(Sauna.id == sauna_id).values(thumbnail_url=None)
+        )
     await db.delete(image)
     await db.commit()
+
+    # Files are removed after the commit; a failed delete only leaves an orphan file
+    storage = get_storage()
+    await asyncio.gather(
+        *(storage.delete(key) for key in storage_keys), return_exceptions=True
+    )
@@ -0,0 +1,59 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class TTLCache:
+    """
+    Small in-process cache with per-entry expiry.
+    - Entries expire ttl seconds after they are set
+    - The least recently set entry is evicted beyond maxsize
+    - get_or_compute lets only one coroutine compute a missing key at a time;
+      if compute raises, nothing is cached and the error propagates
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    async def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                value = self.get(key, missing)
+                if value is missing:
+                    value = await compute()
+                    self.set(key, value)
+        finally:
+            # Also when compute raises, or failed keys would pile up here
+            self._locks.pop(key, None)
+        return value
@@ -0,0 +1,76 @@
+import gzip
+import hashlib
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+# Supported codings, most preferred first
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Per-response compression favours speed; cached bodies are compressed once,
+# so they can afford the slower, smaller levels
+_LEVELS = {"br": 4, "gzip": 6}
+_CACHED_LEVELS = {"br": 9, "gzip": 9}
+
+_precompressed = TTLCache(ttl=3600, maxsize=settings.COMPRESSION_CACHE_SIZE)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    Best supported coding for an Accept-Encoding header, None for identity.
+    - q=0 rules a coding out; "*" stands for codings not listed
+    - On equal q, brotli wins over gzip
+    """
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for coding in ENCODINGS:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compressible(content_type: str, size: int) -> bool:
+    return size >= settings.COMPRESSION_MIN_SIZE and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress(body: bytes, coding: str, level: int | None = None) -> bytes:
+    level = level or _LEVELS[coding]
+    if coding == "br":
+        return brotli.compress(body, quality=level)
+    # mtime=0 keeps the output identical for identical bodies
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def compress_cached(body: bytes, coding: str) -> bytes:
+    """
+    Compressed body from the in-process cache, compressing on a miss.
+    - Keyed by a hash of the uncompressed body, so entries never go stale;
+      a changed catalog simply produces a new key
+    """
+    key = (coding, hashlib.blake2b(body, digest_size=16).digest())
+    compressed = _precompressed.get(key)
+    if compressed is None:
+        compressed = compress(body, coding, _CACHED_LEVELS[coding])
+        _precompressed.set(key, compressed)
+    return compressed
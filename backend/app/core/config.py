@@ -8,6 +8,91 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     CORS_ORIGINS: list[str] = ["http://localhost:5173", "*"]
     STAGE: str = "dev"
+    # "full" creates tables and seeds demo data at startup; "fast" skips both
+    # (production, where the schema is managed separately)
+    STARTUP_MODE: str = "full"
+
+    # Optional read replica (Aurora reader endpoint) for read-only endpoints;
+    # empty means reads use DATABASE_URL
+    DATABASE_READ_URL: str = ""
+    # Seconds a client's reads stay on the writer after its own write
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    # Connection pooling for MySQL/Aurora (see app.core.database.build_engine).
+    # DB_POOL_MODE: "auto", "queue" (uvicorn), "single" (Lambda) or "null" (RDS Proxy)
+    DB_POOL_MODE: str = "auto"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 10.0
+    # Seconds before a pooled connection is replaced; below typical idle timeouts
+    DB_POOL_RECYCLE: int = 280
+
+    # Request metrics: /metrics requires "Bearer METRICS_TOKEN" when set;
+    # METRICS_LOG writes CloudWatch EMF lines per request (Lambda)
+    METRICS_TOKEN: str = ""
+    METRICS_LOG: bool = False
+    METRICS_NAMESPACE: str = "SaunaBooking"
+    # Statements slower than this are logged (parameters redacted)
+    SLOW_QUERY_MS: float = 200.0
+    # A statement shape repeated this often in one request is logged as an N+1 suspect
+    N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Image storage: "local" writes under STORAGE_LOCAL_DIR, "s3" uses S3_BUCKET
+    STORAGE_BACKEND: str = "local"
+    STORAGE_LOCAL_DIR: str = "./media"
+    STORAGE_BASE_URL: str = "/media"
+    S3_BUCKET: str = ""
+    S3_PREFIX: str = "images"
+    IMAGE_WORKERS: int = 4
+    IMAGE_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+
+    # Time zone booking dates and times are written in; the status sweeper
+    # (app.services.booking_status) completes bookings by this clock. The job
+    # runner (in-app or app.worker) sweeps every BOOKING_SWEEP_SECONDS; Lambda
+    # uses its own EventBridge schedule
+    BOOKING_TIMEZONE: str = "Asia/Seoul"
+    BOOKING_SWEEP_SECONDS: float = 300.0
+
+    # Bookings older than BOOKING_ARCHIVE_DAYS move to bookings_archive
+    # (app.services.booking_archive), BOOKING_ARCHIVE_BATCH_SIZE per transaction
+    BOOKING_ARCHIVE_DAYS: int = 365
+    BOOKING_ARCHIVE_BATCH_SIZE: int = 1000
+
+    # Seconds the admin dashboard statistics are cached in-process
+    DASHBOARD_CACHE_TTL: float = 10.0
+    # Seconds admin analytics (occupancy heatmaps) are cached per range
+    ANALYTICS_CACHE_TTL: float = 300.0
+
+    # /admin/stream needs a process that can hold a response open; disable it
+    # behind API Gateway + Lambda, which buffers responses. Stream tokens are
+    # valid for STREAM_TOKEN_SECONDS, enough to open the connection
+    ADMIN_STREAM_ENABLED: bool = True
+    STREAM_TOKEN_SECONDS: int = 60
+
+    # Idempotency-Key on POST /bookings: hours a stored response is replayed,
+    # seconds a duplicate waits for the first request, and seconds before an
+    # unfinished request's key can be taken over
+    IDEMPOTENCY_TTL_HOURS: int = 24
+    IDEMPOTENCY_WAIT_SECONDS: float = 5.0
+    IDEMPOTENCY_LOCK_SECONDS: int = 30
+
+    # Responses smaller than this many bytes are sent uncompressed
+    COMPRESSION_MIN_SIZE: int = 1024
+    # Compressed bodies kept for endpoints using the precompressed dependency
+    COMPRESSION_CACHE_SIZE: int = 256
+
+    # Background jobs (app.core.jobs): JOB_RUNNER_IN_APP runs a poller inside
+    # the API process; otherwise run `python -m app.worker` or the Lambda schedule.
+    # Failed jobs retry after JOB_BACKOFF_SECONDS, doubling per attempt; a
+    # claimed job is reclaimed after JOB_LEASE_SECONDS without finishing
+    JOB_RUNNER_IN_APP: bool = True
+    JOB_CONCURRENCY: int = 4
+    JOB_BATCH_SIZE: int = 100
+    JOB_POLL_SECONDS: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_BACKOFF_SECONDS: float = 5.0
+    JOB_LEASE_SECONDS: int = 60
+    JOB_RETENTION_HOURS: int = 72
 
     model_config = {"env_file": ".env"}
 
@@ -1,11 +1,142 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import os
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool, StaticPool
 
 from app.core.config import settings
+from app.core.sql_instrumentation import instrument_engine
+
+
+def pool_mode() -> str:
+    """
+    Resolve DB_POOL_MODE.
+    - "auto" picks "single" inside Lambda (one request per instance at a time)
+      and "queue" everywhere else
+    """
+    if settings.DB_POOL_MODE != "auto":
+        return settings.DB_POOL_MODE
+    return "single" if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") else "queue"
+
+
+def build_engine(url: str, mode: str | None = None) -> AsyncEngine:
+    """
+    Create an async engine with pooling suited to the backend and deployment.
+    - sqlite: SQLAlchemy defaults; in-memory databases share one connection
+    - "queue": sized LIFO pool for long-running servers (uvicorn)
+    - "single": one kept-alive connection (plus one overflow for concurrent
+      sessions) reused across warm Lambda invocations
+    - "null": no pooling, for use behind RDS Proxy which pools for us
+    Pooled server connections are pinged on checkout and recycled before
+    Aurora or a frozen Lambda can leave them stale.
+    """
+    url = make_url(url)
+    mode = "sqlite" if url.get_backend_name() == "sqlite" else mode or pool_mode()
+    created = _create_engine(url, mode)
+    _engine_modes[created.sync_engine] = mode
+    return created
+
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+# Pool mode each engine was built with, reported by pool_status
+_engine_modes: "WeakKeyDictionary[Engine, str]" = WeakKeyDictionary()
+
+
+def _create_engine(url: URL, mode: str) -> AsyncEngine:
+    if mode == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            return create_async_engine(url, poolclass=StaticPool)
+        return create_async_engine(url)
+    if mode == "null":
+        return create_async_engine(url, poolclass=NullPool)
+
+    options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+    if mode == "single":
+        return create_async_engine(url, pool_size=1, max_overflow=1, **options)
+    return create_async_engine(
+        url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_use_lifo=True,
+        **options,
+    )
+
+
+engine = build_engine(settings.DATABASE_URL)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Reader engine for replica-routed endpoints; the writer when no replica is set
+read_engine = build_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else engine
+async_read_session = async_sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+# Engines by role, for metrics
+engines = {"writer": engine}
+if read_engine is not engine:
+    engines["reader"] = read_engine
+
+# Pool event counters per engine since process start; connects growing with
+# traffic means connections are being churned rather than reused
+pool_events = {role: {"connect": 0, "checkout": 0, "invalidate": 0} for role in engines}
+
+
+def _count_pool_event(role: str, name: str):
+    def listener(*args):
+        pool_events[role][name] += 1
+
+    return listener
+
+
+for _role, _engine in engines.items():
+    for _name in pool_events[_role]:
+        event.listen(_engine.sync_engine, _name, _count_pool_event(_role, _name))
+
+
+# Per-request statement counts, timing and N+1 detection
+for _engine in engines.values():
+    instrument_engine(_engine)
+
+
+def pool_status(role: str = "writer") -> dict:
+    """Current pool occupancy plus event counters for one engine in `engines`"""
+    target = engines[role]
+    pool = target.pool
+    events = pool_events[role]
+    status = {
+        "role": role,
+        "backend": target.dialect.name,
+        "pool_class": type(pool).__name__,
+        "mode": _engine_modes[target.sync_engine],
+        "size": None,
+        "checked_in": None,
+        "checked_out": None,
+        "overflow": None,
+        "connects": events["connect"],
+        "checkouts": events["checkout"],
+        "invalidations": events["invalidate"],
+    }
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return status
+
 
 class Base(DeclarativeBase):
     pass
@@ -0,0 +1,43 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class Event:
+    type: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+class EventBus:
+    """
+    In-process publish/subscribe for live updates.
+    - Each subscriber gets its own bounded queue
+    - publish never blocks; a subscriber that falls behind loses its oldest events
+    - Only reaches subscribers in the same process (one uvicorn worker / Lambda instance)
+    """
+
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = maxsize
+        self._subscribers: set[asyncio.Queue] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.maxsize)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: Event) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+
+event_bus = EventBus()
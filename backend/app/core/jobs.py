@@ -0,0 +1,308 @@
+import asyncio
+import importlib
+import json
+import logging
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.job import Job
+
+logger = logging.getLogger("app.jobs")
+
+# Modules whose import registers job handlers; loaded before any job runs
+HANDLER_MODULES = ("app.services.booking_stats",)
+
+HandlerFunc = Callable[[AsyncSession, list[dict]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class _Handler:
+    func: HandlerFunc
+    batch_size: int
+    max_attempts: int
+
+
+_handlers: dict[str, _Handler] = {}
+
+
+def job_handler(kind: str, batch_size: int = 1, max_attempts: int | None = None):
+    """
+    Register an async handler for jobs of one kind.
+    - Called as handler(db, payloads) with up to batch_size payloads at once
+    - Must not commit: the runner marks the jobs done in the same transaction,
+      so database work is applied exactly once
+    - Raising retries the whole batch with backoff
+    """
+    def decorator(func: HandlerFunc) -> HandlerFunc:
+        _handlers[kind] = _Handler(
+            func, batch_size, max_attempts or settings.JOB_MAX_ATTEMPTS
+        )
+        return func
+
+    return decorator
+
+
+def load_handlers() -> None:
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+
+
+def _now() -> datetime:
+    """Naive UTC, comparable with what SQLite and MySQL return"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def enqueue(
+    db: AsyncSession, kind: str, payload: dict, delay_seconds: float = 0
+) -> None:
+    """
+    Queue a job in the caller's transaction.
+    - The job only exists once the caller commits, and never without the
+      change that caused it
+    """
+    handler = _handlers.get(kind)
+    db.add(
+        Job(
+            kind=kind,
+            payload=json.dumps(payload),
+            max_attempts=handler.max_attempts if handler else settings.JOB_MAX_ATTEMPTS,
+            run_at=_now() + timedelta(seconds=delay_seconds),
+        )
+    )
+
+
+async def supersede_jobs(
+    db: AsyncSession, kind: str, matches: Callable[[dict], bool]
+) -> int:
+    """
+    Mark unfinished or failed jobs of one kind whose payload matches as done,
+    in the caller's transaction.
+    - For work that recomputes what those jobs would have applied
+    - The rows are locked first; a runner still holding one of them loses its
+      lease and rolls its batch back instead of applying it on top
+    Returns the number of jobs superseded.
+    """
+    result = await db.execute(
+        select(Job.id, Job.payload)
+        .where(Job.kind == kind, Job.status.in_(("queued", "running", "failed")))
+        .with_for_update()
+    )
+    ids = [job_id for job_id, payload in result.all() if matches(json.loads(payload))]
+    for i in range(0, len(ids), 500):
+        await db.execute(
+            update(Job)
+            .where(Job.id.in_(ids[i:i + 500]))
+            .values(status="succeeded", finished_at=_now(), locked_by=None, locked_until=None)
+        )
+    return len(ids)
+
+
+async def retry_failed_jobs(db: AsyncSession, kind: str | None = None) -> int:
+    """Queue failed jobs again with a fresh set of attempts; returns jobs requeued"""
+    stmt = update(Job).where(Job.status == "failed")
+    if kind:
+        stmt = stmt.where(Job.kind == kind)
+    result = await db.execute(
+        stmt.values(status="queued", attempts=0, run_at=_now(), finished_at=None)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+def _backoff_seconds(attempts: int) -> float:
+    """Exponential backoff with jitter, capped at an hour"""
+    delay = min(settings.JOB_BACKOFF_SECONDS * 2 ** (attempts - 1), 3600)
+    return delay * random.uniform(0.5, 1.0)
+
+
+class JobRunner:
+    """
+    Polls the jobs table and runs due jobs.
+    - Jobs are claimed with a conditional UPDATE and a lease, so several
+      runners (uvicorn workers, the worker process, Lambda) can share a table
+    - Claimed jobs are grouped by kind into batches; at most `concurrency`
+      batches run at once, each in its own session
+    - A runner that dies leaves its jobs running until the lease expires,
+      after which another runner claims them again
+    - While polling it also completes finished bookings every
+      BOOKING_SWEEP_SECONDS, so reviews open up without a separate sweeper
+    """
+
+    def __init__(self, concurrency: int | None = None, batch_size: int | None = None):
+        self.concurrency = concurrency or settings.JOB_CONCURRENCY
+        self.batch_size = batch_size or settings.JOB_BATCH_SIZE
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._last_purge = 0.0
+        self._last_sweep = float("-inf")  # sweep on the first poll
+        load_handlers()
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        """Stop polling and wait for batches already claimed to finish"""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def run_forever(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+                if time.monotonic() - self._last_sweep > settings.BOOKING_SWEEP_SECONDS:
+                    await self.sweep_bookings()
+                if time.monotonic() - self._last_purge > 3600:
+                    await self.housekeeping()
+            except Exception:
+                logger.exception("Job runner poll failed")
+                processed = 0
+            if not processed:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), settings.JOB_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def drain(self, max_seconds: float) -> int:
+        """Run due jobs until none are left or max_seconds have passed"""
+        deadline = time.monotonic() + max_seconds
+        total = 0
+        while time.monotonic() < deadline:
+            processed = await self.run_once()
+            if not processed:
+                break
+            total += processed
+        return total
+
+    async def run_once(self) -> int:
+        """Claim one round of due jobs and run them; returns jobs processed"""
+        token = str(uuid.uuid4())
+        jobs = await self._claim(token, self.concurrency * self.batch_size)
+        if not jobs:
+            return 0
+
+        by_kind: dict[str, list[Job]] = {}
+        for job in jobs:
+            by_kind.setdefault(job.kind, []).append(job)
+        batches = []
+        for kind, kind_jobs in by_kind.items():
+            handler = _handlers.get(kind)
+            size = min(handler.batch_size, self.batch_size) if handler else len(kind_jobs)
+            for i in range(0, len(kind_jobs), size):
+                batches.append((kind, kind_jobs[i:i + size]))
+
+        await asyncio.gather(*(self._run_batch(token, kind, batch) for kind, batch in batches))
+        return len(jobs)
+
+    async def _claim(self, token: str, limit: int) -> list[Job]:
+        now = _now()
+        due = or_(
+            and_(Job.status == "queued", Job.run_at <= now),
+            and_(Job.status == "running", Job.locked_until <= now),
+        )
+        async with async_session() as db:
+            ids = (
+                await db.execute(select(Job.id).where(due).order_by(Job.run_at).limit(limit))
+            ).scalars().all()
+            if not ids:
+                return []
+            # Re-checking `due` makes concurrent runners skip each other's claims
+            await db.execute(
+                update(Job)
+                .where(Job.id.in_(ids), due)
+                .values(
+                    status="running",
+                    locked_by=token,
+                    locked_until=now + timedelta(seconds=settings.JOB_LEASE_SECONDS),
+                    attempts=Job.attempts + 1,
+                )
+            )
+            await db.commit()
+            result = await db.execute(select(Job).where(Job.locked_by == token))
+            return list(result.scalars().all())
+
+    async def _run_batch(self, token: str, kind: str, jobs: list[Job]) -> None:
+        ids = [job.id for job in jobs]
+        async with self._semaphore, async_session() as db:
+            try:
+                handler = _handlers.get(kind)
+                if handler is None:
+                    raise LookupError(f"No handler registered for job kind {kind!r}")
+                await handler.func(db, [json.loads(job.payload) for job in jobs])
+                result = await db.execute(
+                    update(Job)
+                    .where(Job.id.in_(ids), Job.locked_by == token)
+                    .values(status="succeeded", finished_at=_now(), locked_by=None, locked_until=None)
+                )
+                if result.rowcount != len(ids):
+                    # The lease ran out and another runner took some of these over
+                    await db.rollback()
+                    logger.warning("Lost the lease on %d %s job(s); not committing", len(ids), kind)
+                    return
+                await db.commit()
+            except Exception as exc:
+                await db.rollback()
+                logger.warning("%d %s job(s) failed: %r", len(ids), kind, exc)
+                await self._record_failure(db, token, jobs, exc)
+
+    async def _record_failure(
+        self, db: AsyncSession, token: str, jobs: list[Job], exc: Exception
+    ) -> None:
+        now = _now()
+        error = repr(exc)[:2000]
+        for job in jobs:
+            if job.attempts >= job.max_attempts or job.kind not in _handlers:
+                logger.error("Job %s (%s) failed permanently: %s", job.id, job.kind, error)
+                values = {"status": "failed", "finished_at": now}
+            else:
+                values = {
+                    "status": "queued",
+                    "run_at": now + timedelta(seconds=_backoff_seconds(job.attempts)),
+                }
+            await db.execute(
+                update(Job)
+                .where(Job.id == job.id, Job.locked_by == token)
+                .values(last_error=error, locked_by=None, locked_until=None, **values)
+            )
+        await db.commit()
+
+    async def sweep_bookings(self) -> int:
+        """Complete bookings whose end time has passed (app.services.booking_status)"""
+        from app.services.booking_status import sweep
+
+        self._last_sweep = time.monotonic()
+        return await sweep()
+
+    async def housekeeping(self) -> None:
+        """Hourly cleanup: finished jobs and expired Idempotency-Keys"""
+        from app.services.idempotency import purge_expired_idempotency_keys
+
+        self._last_purge = time.monotonic()
+        await self.purge_finished()
+        async with async_session() as db:
+            await purge_expired_idempotency_keys(db)
+
+    async def purge_finished(self) -> int:
+        """
+        Delete succeeded jobs older than JOB_RETENTION_HOURS.
+        - Failed jobs are kept until retried (python -m app.worker --retry-failed)
+        """
+        cutoff = _now() - timedelta(hours=settings.JOB_RETENTION_HOURS)
+        async with async_session() as db:
+            result = await db.execute(
+                delete(Job).where(Job.status == "succeeded", Job.finished_at <= cutoff)
+            )
+            await db.commit()
+        return result.rowcount
@@ -0,0 +1,147 @@
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+# Seconds; Prometheus-style cumulative "le" buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestTimings:
+    """Time spent in each phase of the current request"""
+    db: float = 0.0
+    db_queries: int = 0
+    serialize: float = 0.0
+    statements: Counter = field(default_factory=Counter)  # statement shape -> executions
+
+
+_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> RequestTimings:
+    timings = RequestTimings()
+    _timings.set(timings)
+    return timings
+
+
+def current_timings() -> RequestTimings | None:
+    return _timings.get()
+
+
+class Histogram:
+    """Cumulative histogram per label tuple"""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        self._series: dict[tuple, list] = {}  # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted(self._series.items())
+        for label_values, series in items:
+            labels = ",".join(f'{k}="{v}"' for k, v in zip(self.labels, label_values))
+            sep = "," if labels else ""
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{labels}{sep}le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{labels}{sep}le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{labels}}} {series[-2]:.6f}")
+            lines.append(f"{self.name}_count{{{labels}}} {series[-1]}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.value = 0
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge", f"{self.name} {self.value}"]
+
+
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template",
+    ("method", "route", "status"),
+)
+db_duration = Histogram(
+    "http_request_db_seconds",
+    "Database time per request by route template",
+    ("method", "route"),
+)
+serialize_duration = Histogram(
+    "http_request_serialize_seconds",
+    "Response serialization time per request by route template",
+    ("method", "route"),
+)
+in_flight = Gauge("http_requests_in_flight", "Requests currently being handled")
+
+_started = time.time()
+
+
+def render_prometheus(extra: list[str] | None = None) -> str:
+    """All metrics in the Prometheus text exposition format"""
+    lines = [
+        "# HELP process_start_time_seconds Start time of the process since the epoch",
+        "# TYPE process_start_time_seconds gauge",
+        f"process_start_time_seconds {_started:.3f}",
+    ]
+    for metric in (request_duration, db_duration, serialize_duration, in_flight):
+        lines.extend(metric.render())
+    lines.extend(extra or [])
+    return "\n".join(lines) + "\n"
+
+
+def emit_metrics_log(
+    method: str, route: str, status: int, duration: float, timings: RequestTimings, namespace: str
+) -> None:
+    """
+    Write one CloudWatch Embedded Metric Format record to stdout.
+    - For Lambda, where /metrics cannot be scraped; CloudWatch turns these log
+      lines into Latency/DbTime/SerializeTime metrics per route
+    - Written directly to stdout: the Lambda logging prefix would break the JSON
+    """
+    record = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": namespace,
+                    "Dimensions": [["Route"]],
+                    "Metrics": [
+                        {"Name": "Latency", "Unit": "Milliseconds"},
+                        {"Name": "DbTime", "Unit": "Milliseconds"},
+                        {"Name": "SerializeTime", "Unit": "Milliseconds"},
+                    ],
+                }
+            ],
+        },
+        "Route": f"{method} {route}",
+        "Status": status,
+        "Latency": round(duration * 1000, 2),
+        "DbTime": round(timings.db * 1000, 2),
+        "SerializeTime": round(timings.serialize * 1000, 2),
+        "DbQueries": timings.db_queries,
+    }
+    sys.stdout.write(json.dumps(record) + "\n")
+    sys.stdout.flush()
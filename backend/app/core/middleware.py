@@ -0,0 +1,183 @@
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core import metrics
+from app.core.compression import compress, compress_cached, compressible, negotiate_encoding
+from app.core.config import settings
+from app.core.security import sign_value
+from app.core.sql_instrumentation import log_n_plus_one
+
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pins a client's reads to the writer for a few seconds after its own writes.
+    - Write endpoints opt in with the read_your_writes dependency, which sets
+      request.state.pin_reads
+    - On a successful response this adds a short-lived cookie holding the
+      signed expiry timestamp; get_read_db uses the writer while it is valid,
+      and a forged or stretched cookie is ignored
+    - A cookie rather than in-process state, so it works across Lambda instances
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in ("GET", "HEAD", "OPTIONS"):
+            await self.app(scope, receive, send)
+            return
+
+        # Shared with the endpoint's request.state
+        state = scope.setdefault("state", {})
+
+        async def send_with_cookie(message):
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+                and state.get("pin_reads")
+            ):
+                seconds = settings.READ_YOUR_WRITES_SECONDS
+                cookie = (
+                    f"{READ_PRIMARY_COOKIE}={sign_value(str(int(time.time()) + seconds))}; "
+                    f"Max-Age={seconds}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode())]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+class CompressionMiddleware:
+    """
+    Brotli (when installed) or gzip response compression.
+    - The coding is negotiated from Accept-Encoding; identity when none fits
+    - Only complete bodies of text-like types of at least COMPRESSION_MIN_SIZE
+      bytes; streamed responses such as the admin event stream pass through
+    - Endpoints using the precompressed dependency reuse cached compressed
+      bodies instead of compressing each hit
+    - Adds Vary: Accept-Encoding to every compressible response
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        state = scope.setdefault("state", {})
+        pending_start = None
+
+        async def send_compressed(message):
+            nonlocal pending_start
+            if message["type"] == "http.response.start":
+                # Held back until the body shows whether it can be compressed
+                pending_start = message
+                return
+            if pending_start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            start, pending_start = pending_start, None
+            body = message.get("body", b"")
+            start.setdefault("headers", [])
+            headers = MutableHeaders(scope=start)
+            if (
+                message.get("more_body")
+                or "content-encoding" in headers
+                or not compressible(headers.get("content-type", ""), len(body))
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            if coding:
+                if state.get("precompressed"):
+                    body = compress_cached(body, coding)
+                else:
+                    body = compress(body, coding)
+                headers["content-encoding"] = coding
+                headers["content-length"] = str(len(body))
+                message = {**message, "body": body}
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+
+def route_template(scope) -> str:
+    """
+    Full route template (e.g. /api/v1/saunas/{sauna_id}) of the matched route.
+    - Routes of included routers only know their router-relative path, so the
+      prefix is recovered from the request path
+    - Template labels keep metric cardinality bounded; unrouted paths share one
+    """
+    template = getattr(scope.get("route"), "path_format", None)
+    if template is None:
+        return "unmatched"
+    try:
+        rendered = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError):
+        return template
+    path = scope["path"]
+    if path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + template
+    return template
+
+
+class TimingMiddleware:
+    """
+    Per-request timing.
+    - Adds a Server-Timing header with database, serialization and total time
+    - Records latency, DB and serialization histograms per route template and
+      the in-flight gauge, rendered by /metrics
+    - With METRICS_LOG, also writes one CloudWatch EMF line per request
+    - Logs statements repeated N_PLUS_ONE_THRESHOLD+ times as N+1 suspects
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = metrics.start_request_timings()
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                total = (time.perf_counter() - start) * 1000
+                header = (
+                    f'db;dur={timings.db * 1000:.1f};desc="{timings.db_queries} queries", '
+                    f"serialize;dur={timings.serialize * 1000:.1f}, total;dur={total:.1f}"
+                )
+                message["headers"] = [*message.get("headers", []), (b"server-timing", header.encode())]
+            await send(message)
+
+        metrics.in_flight.value += 1
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            metrics.in_flight.value -= 1
+            duration = time.perf_counter() - start
+            route = route_template(scope)
+            method = scope["method"]
+            metrics.request_duration.observe(duration, method, route, str(status))
+            metrics.db_duration.observe(timings.db, method, route)
+            metrics.serialize_duration.observe(timings.serialize, method, route)
+            log_n_plus_one(method, route, timings)
+            if settings.METRICS_LOG:
+                metrics.emit_metrics_log(
+                    method, route, status, duration, timings, settings.METRICS_NAMESPACE
+                )
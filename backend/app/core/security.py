@@ -1,22 +1,49 @@
+import hashlib
+import hmac
 from datetime import datetime, timedelta, timezone
-
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from functools import lru_cache
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib and jose are imported on first use: most requests need neither
+# hashing nor token handling, and both add to Lambda cold-start time.
+
+# "scope" claim of tokens that only open /admin/stream
+STREAM_TOKEN_SCOPE = "admin-stream"
+
+
+@lru_cache
+def _pwd_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
+
+
+def sign_value(value: str) -> str:
+    """value.signature, HMAC-SHA256 with SECRET_KEY; for values kept in cookies"""
+    signature = hmac.new(settings.SECRET_KEY.encode(), value.encode(), hashlib.sha256)
+    return f"{value}.{signature.hexdigest()}"
+
+
+def unsign_value(signed: str) -> str | None:
+    """The value of a sign_value() string, or None if the signature is wrong"""
+    value, _, signature = signed.rpartition(".")
+    if not value or not hmac.compare_digest(sign_value(value), signed):
+        return None
+    return value
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
+    from jose import jwt
+
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (
         expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -25,7 +52,21 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+def create_stream_token(user_id: str) -> str:
+    """
+    Short-lived token for one admin event stream.
+    - EventSource cannot send headers, so it travels in the URL; the scope
+      keeps it from working as a bearer token if it leaks into access logs
+    """
+    return create_access_token(
+        {"sub": user_id, "scope": STREAM_TOKEN_SCOPE},
+        timedelta(seconds=settings.STREAM_TOKEN_SECONDS),
+    )
+
+
 def decode_access_token(token: str) -> dict | None:
+    from jose import JWTError, jwt
+
     try:
         return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
@@ -0,0 +1,128 @@
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.metrics import RequestTimings, current_timings
+
+logger = logging.getLogger("app.sql")
+
+_WHITESPACE = re.compile(r"\s+")
+# Expanded IN lists: (?, ?, ?) / (%s, %s) / (:p1, :p2)
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%s|:\w+)\s*,)+\s*(?:\?|%s|:\w+)\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with whitespace collapsed and IN lists folded, for grouping"""
+    return _IN_LIST.sub("(?...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def redact_parameters(parameters) -> str:
+    """Describe bound parameters by type only, so logs never carry user data"""
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (list, tuple, dict)):
+            return f"<{len(parameters)} rows>"
+        return "(" + ", ".join(type(v).__name__ for v in parameters) + ")"
+    return "()"
+
+
+@dataclass
+class QueryCapture:
+    """Statement shapes executed inside capture_queries()"""
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+_capture: ContextVar[QueryCapture | None] = ContextVar("query_capture", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    shape = statement_shape(statement)
+
+    timings = current_timings()
+    if timings is not None:
+        timings.db += elapsed
+        timings.db_queries += 1
+        timings.statements[shape] += 1
+    capture = _capture.get()
+    if capture is not None:
+        capture.statements.append(shape)
+
+    if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms): %s params=%s",
+            elapsed * 1000,
+            shape,
+            redact_parameters(parameters),
+        )
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    starts = connection.info.get("query_start") if connection is not None else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine) -> None:
+    """Count, time and inspect every statement an async engine executes"""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+def n_plus_one_suspects(timings: RequestTimings) -> list[tuple[str, int]]:
+    """Statement shapes repeated at least N_PLUS_ONE_THRESHOLD times in one request"""
+    return [
+        (shape, count)
+        for shape, count in timings.statements.most_common()
+        if count >= settings.N_PLUS_ONE_THRESHOLD
+    ]
+
+
+def log_n_plus_one(method: str, route: str, timings: RequestTimings) -> None:
+    for shape, count in n_plus_one_suspects(timings):
+        logger.warning("N+1 suspect on %s %s: %d x %s", method, route, count, shape)
+
+
+@contextmanager
+def capture_queries():
+    """Collect the statements executed in this context (including ASGI calls made from it)"""
+    capture = QueryCapture()
+    token = _capture.set(capture)
+    try:
+        yield capture
+    finally:
+        _capture.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """
+    Fail when the wrapped block executes more than `limit` statements.
+
+        with assert_max_queries(2):
+            await client.get(f"/api/v1/bookings/{booking_id}")
+    """
+    with capture_queries() as capture:
+        yield capture
+    if capture.count > limit:
+        listing = "\n".join(f"  {i + 1}. {shape}" for i, shape in enumerate(capture.statements))
+        raise AssertionError(
+            f"{capture.count} queries executed, expected at most {limit}:\n{listing}"
+        )
@@ -1,23 +1,40 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from fastapi.staticfiles import StaticFiles
 
 from app.api.v1.api import api_router
 from app.core.config import settings
-from app.core.database import init_db
-from app.services.seed import seed_data
+from app.core.database import engines, init_db, pool_status
+from app.core.metrics import render_prometheus
+from app.core.middleware import CompressionMiddleware, ReadYourWritesMiddleware, TimingMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await init_db()
-    await seed_data()
+    # Schema and seed work costs several Aurora round trips per cold start
+    if settings.STARTUP_MODE == "full":
+        from app.services.seed import seed_data
+
+        await init_db()
+        await seed_data()
+
+    runner = None
+    if settings.JOB_RUNNER_IN_APP:
+        from app.core.jobs import JobRunner
+
+        runner = JobRunner()
+        runner.start()
     yield
+    if runner is not None:
+        await runner.stop()
 
 
 app = FastAPI(title="Finnish Sauna Booking", version="1.0.0", lifespan=lifespan)
 
+app.add_middleware(ReadYourWritesMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
@@ -25,15 +42,56 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware)
+# Outermost, so timings cover every other middleware
+app.add_middleware(TimingMiddleware)
 
 app.include_router(api_router)
 
+# Serve uploaded images locally; in production they are served from S3/CloudFront
+if settings.STORAGE_BACKEND == "local":
+    app.mount(
+        settings.STORAGE_BASE_URL,
+        StaticFiles(directory=settings.STORAGE_LOCAL_DIR, check_dir=False),
+        name="media",
+    )
+
 
 @app.get("/health")
 async def health():
     return {"status": "ok"}
 
 
+def _pool_metric_lines() -> list[str]:
+    lines = []
+    for role in engines:
+        status = pool_status(role)
+        for key, kind in (
+            ("checked_out", "gauge"),
+            ("overflow", "gauge"),
+            ("connects", "counter"),
+            ("checkouts", "counter"),
+            ("invalidations", "counter"),
+        ):
+            if status[key] is None:
+                continue
+            name = f"db_pool_{key}" + ("_total" if kind == "counter" else "")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f'{name}{{role="{role}"}} {status[key]}')
+    return lines
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(authorization: str | None = Header(None)):
+    """Prometheus text metrics for this process"""
+    if settings.METRICS_TOKEN and authorization != f"Bearer {settings.METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return PlainTextResponse(
+        render_prometheus(_pool_metric_lines()),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 # Lambda handler via Mangum
 try:
     from mangum import Mangum
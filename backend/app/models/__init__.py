@@ -1,8 +1,13 @@
 from app.models.sauna import Sauna
 from app.models.sauna_image import SaunaImage
+from app.models.sauna_image_variant import SaunaImageVariant
 from app.models.operating_hours import OperatingHours
 from app.models.booking import Booking
+from app.models.booking_archive import BookingArchive
+from app.models.booking_daily_stat import BookingDailyStat
 from app.models.user import User
 from app.models.review import Review
+from app.models.idempotency_key import IdempotencyKey
+from app.models.job import Job
 
-__all__ = ["Sauna", "SaunaImage", "OperatingHours", "Booking", "User", "Review"]
+__all__ = ["Sauna", "SaunaImage", "SaunaImageVariant", "OperatingHours", "Booking", "BookingArchive", "BookingDailyStat", "User", "Review", "IdempotencyKey", "Job"]
@@ -1,14 +1,14 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
 
-class Booking(Base):
-    __tablename__ = "bookings"
+class BookingColumns:
+    """Columns shared by bookings and bookings_archive"""
 
     id: Mapped[str] = mapped_column(
         String, primary_key=True, default=lambda: str(uuid.uuid4())
@@ -31,4 +31,12 @@ class Booking(Base):
         DateTime, default=lambda: datetime.now(timezone.utc)
     )
 
+
+class Booking(BookingColumns, Base):
+    __tablename__ = "bookings"
+    __table_args__ = (
+        # Serves the status sweeper's scan for confirmed bookings by date
+        Index("ix_bookings_status_date", "status", "booking_date"),
+    )
+
     sauna = relationship("Sauna")
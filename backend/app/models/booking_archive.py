@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.booking import BookingColumns
+
+
+class BookingArchive(BookingColumns, Base):
+    """
+    Bookings moved out of the hot table by app.services.booking_archive.
+    - Same columns and ids as bookings, so reviews.booking_id still matches
+    - Rows are final (completed, cancelled, no_show) and never updated
+    """
+    __tablename__ = "bookings_archive"
+    __table_args__ = (
+        # Serve a user's history and the "how far back does the archive go" lookup
+        Index("ix_bookings_archive_user_date", "user_id", "booking_date"),
+        Index("ix_bookings_archive_date", "booking_date"),
+        # Changes with every archival batch; keys the dashboard's cached archive counters
+        Index("ix_bookings_archive_archived_at", "archived_at"),
+    )
+
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
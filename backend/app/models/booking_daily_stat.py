@@ -0,0 +1,23 @@
+from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class BookingDailyStat(Base):
+    """
+    Per-date, per-sauna booking rollup.
+    - Maintained incrementally on booking create/cancel/update
+    - booking_count, revenue and guest_count cover non-cancelled bookings
+    - Rebuild with: python -m app.services.booking_stats
+    """
+    __tablename__ = "booking_daily_stats"
+
+    stat_date: Mapped[str] = mapped_column(String(10), primary_key=True)  # YYYY-MM-DD
+    sauna_id: Mapped[str] = mapped_column(
+        String, ForeignKey("saunas.id"), primary_key=True, index=True
+    )
+    booking_count: Mapped[int] = mapped_column(Integer, default=0)
+    revenue: Mapped[float] = mapped_column(Float, default=0.0)
+    guest_count: Mapped[int] = mapped_column(Integer, default=0)
+    cancelled_count: Mapped[int] = mapped_column(Integer, default=0)
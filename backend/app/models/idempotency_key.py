@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class IdempotencyKey(Base):
+    """
+    A client's Idempotency-Key and the response its first request produced.
+    - key is "<user id>:<header value>", or for guests "anonymous:" plus a
+      hash of the header value and request body (services.idempotency._scoped_key)
+    - In progress while response_status is null; locked_until bounds how long
+      a crashed request can hold the key
+    - Rows are dropped after expires_at (IDEMPOTENCY_TTL_HOURS)
+    """
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(300), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64))
+    response_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    response_body: Mapped[str | None] = mapped_column(Text, nullable=True)
+    locked_until: Mapped[datetime] = mapped_column(DateTime)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -10,19 +10,22 @@ from app.core.database import Base
 class Review(Base):
     """
     Customer review model for saunas.
-    - Only customers with completed/confirmed bookings can leave reviews
+    - Only customers with completed bookings can leave reviews
     - One review per booking to prevent duplicates
     """
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Serves the newest-first cursor pagination in list_reviews
+        Index("ix_reviews_sauna_created", "sauna_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String, primary_key=True, default=lambda: str(uuid.uuid4())
     )
     sauna_id: Mapped[str] = mapped_column(String, ForeignKey("saunas.id"), index=True)
     user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True)
-    booking_id: Mapped[str] = mapped_column(
-        String, ForeignKey("bookings.id"), index=True, unique=True
-    )
+    # No foreign key: the booking may have moved to bookings_archive
+    booking_id: Mapped[str] = mapped_column(String, index=True, unique=True)
     rating: Mapped[int] = mapped_column(Integer)  # 1-5
     comment: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -35,4 +38,6 @@ class Review(Base):
     # Relationships
     sauna = relationship("Sauna")
     user = relationship("User")
-    booking = relationship("Booking")
+    booking = relationship(
+        "Booking", primaryjoin="foreign(Review.booking_id) == Booking.id", viewonly=True
+    )
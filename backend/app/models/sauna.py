@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Float, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Float, Integer, String, Text, case
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -18,6 +19,7 @@ class Sauna(Base):
     capacity: Mapped[int] = mapped_column(Integer)
     hourly_rate: Mapped[float] = mapped_column(Float)
     image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    thumbnail_url: Mapped[str | None] = mapped_column(String(500), nullable=True)  # Primary image thumbnail variant
     amenities: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     open_time: Mapped[str] = mapped_column(String(5), default="10:00")
@@ -33,6 +35,15 @@ class Sauna(Base):
     temperature_min: Mapped[int | None] = mapped_column(Integer, nullable=True)
     temperature_max: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Review aggregates, maintained incrementally by review create/delete
+    review_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_1_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_2_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_3_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_4_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    rating_5_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc)
     )
@@ -40,6 +51,19 @@ class Sauna(Base):
         DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc)
     )
 
+    @hybrid_property
+    def average_rating(self) -> float | None:
+        if not self.review_count:
+            return None
+        return self.rating_sum / self.review_count
+
+    @average_rating.expression
+    def average_rating(cls):
+        return case(
+            (cls.review_count > 0, cls.rating_sum * 1.0 / cls.review_count),
+            else_=None,
+        )
+
     # Relationships
     images: Mapped[list["SaunaImage"]] = relationship("SaunaImage", back_populates="sauna", cascade="all, delete-orphan")
     operating_hours: Mapped[list["OperatingHours"]] = relationship("OperatingHours", back_populates="sauna", cascade="all, delete-orphan")
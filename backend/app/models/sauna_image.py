@@ -23,3 +23,6 @@ class SaunaImage(Base):
 
     # Relationship back to Sauna
     sauna: Mapped["Sauna"] = relationship("Sauna", back_populates="images")
+    variants: Mapped[list["SaunaImageVariant"]] = relationship(
+        "SaunaImageVariant", back_populates="image", cascade="all, delete-orphan", lazy="selectin"
+    )
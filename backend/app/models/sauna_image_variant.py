@@ -0,0 +1,35 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+
+
+class SaunaImageVariant(Base):
+    """
+    Resized rendition of an uploaded sauna image.
+    - name is "thumbnail", "medium", "large" or "original"
+    - storage_key locates the file in the configured storage backend
+    """
+    __tablename__ = "sauna_image_variants"
+
+    id: Mapped[str] = mapped_column(
+        String, primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    image_id: Mapped[str] = mapped_column(
+        String, ForeignKey("sauna_images.id"), nullable=False, index=True
+    )
+    name: Mapped[str] = mapped_column(String(20))
+    width: Mapped[int] = mapped_column(Integer)
+    height: Mapped[int] = mapped_column(Integer)
+    format: Mapped[str] = mapped_column(String(10))
+    url: Mapped[str] = mapped_column(String(500))
+    storage_key: Mapped[str] = mapped_column(String(500))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+
+    # Relationship back to SaunaImage
+    image: Mapped["SaunaImage"] = relationship("SaunaImage", back_populates="variants")
@@ -42,6 +42,8 @@ class RevenueByDate(BaseModel):
     date: str
     revenue: float
     booking_count: int
+    guest_count: int = 0
+    cancelled_count: int = 0
 
     @field_validator("revenue", mode="before")
     @classmethod
@@ -123,3 +125,64 @@ class RecentBooking(BaseModel):
         if hasattr(v, "isoformat"):
             return v.isoformat()
         return str(v)
+
+
+class OccupancyHeatmap(BaseModel):
+    """Hourly utilization matrix for one sauna; cells are [row][hour 0-23]"""
+    sauna_id: str
+    sauna_name: str
+    rows: list[str]  # Weekday names (Mon-Sun) or YYYY-MM-DD dates
+    booked_hours: list[list[float]]
+    open_hours: list[list[float]]
+    utilization: list[list[float | None]]  # booked / open, None when closed
+
+    @field_validator("sauna_id", mode="before")
+    @classmethod
+    def coerce_id(cls, v: Any) -> str:
+        return str(v)
+
+
+class CohortRow(BaseModel):
+    """One signup cohort; list cells are period offsets 0, 1, 2... from signup"""
+    cohort: str  # YYYY-MM, or the Monday YYYY-MM-DD for weekly cohorts
+    size: int
+    repeat_rate: float | None
+    median_days_between_visits: float | None
+    retention: list[float | None]  # Share of the cohort booking in each period
+    ltv: list[float | None]  # Cumulative revenue per cohort member
+
+
+class CohortAnalytics(BaseModel):
+    granularity: str
+    repeat_rate: float
+    median_days_between_visits: float | None
+    cohorts: list[CohortRow]
+
+
+class PoolStatus(BaseModel):
+    """Database connection pool state; counters are since process start"""
+    role: str  # "writer" or "reader"
+    backend: str
+    pool_class: str
+    mode: str
+    size: int | None
+    checked_in: int | None
+    checked_out: int | None
+    overflow: int | None
+    connects: int
+    checkouts: int
+    invalidations: int
+
+
+class JobStatusCount(BaseModel):
+    """Background jobs of one kind in one status"""
+    kind: str
+    status: str  # queued, running, succeeded or failed
+    count: int
+    last_error: str | None = None  # most recent, for failed jobs
+
+
+class StreamToken(BaseModel):
+    """Short-lived token for GET /admin/stream?token="""
+    token: str
+    expires_in: int  # seconds
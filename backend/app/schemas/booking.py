@@ -1,8 +1,11 @@
+import re
 from datetime import timedelta
 from typing import Any
 
 from pydantic import BaseModel, field_validator
 
+TIME_PATTERN = re.compile(r"([01]\d|2[0-3]):[0-5]\d|24:00")
+
 
 class BookingCreate(BaseModel):
     sauna_id: str
@@ -15,6 +18,14 @@ class BookingCreate(BaseModel):
     customer_email: str
     notes: str | None = None
 
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def validate_time(cls, v: str) -> str:
+        # Zero-padded so times sort as strings and parse at fixed offsets
+        if not TIME_PATTERN.fullmatch(v):
+            raise ValueError("시간은 HH:MM 형식(00:00~24:00)이어야 합니다.")
+        return v
+
 
 class BookingUpdate(BaseModel):
     status: str | None = None
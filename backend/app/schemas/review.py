@@ -63,3 +63,9 @@ class ReviewSummary(BaseModel):
     @classmethod
     def coerce_count(cls, v: Any) -> int:
         return int(v) if v is not None else 0
+
+
+class ReviewPage(BaseModel):
+    """One page of reviews; pass next_cursor back as cursor for the next page"""
+    items: list[ReviewResponse]
+    next_cursor: str | None = None
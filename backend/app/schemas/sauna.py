@@ -4,11 +4,20 @@ from typing import Any
 from pydantic import BaseModel, field_validator
 
 
+class SaunaImageVariantResponse(BaseModel):
+    name: str
+    width: int
+    height: int
+    format: str
+    url: str
+
+
 class SaunaImageResponse(BaseModel):
     id: str
     image_url: str
     display_order: int
     is_primary: bool
+    variants: list[SaunaImageVariantResponse] = []
 
     @field_validator("id", mode="before")
     @classmethod
@@ -16,6 +25,18 @@ class SaunaImageResponse(BaseModel):
         return str(v)
 
 
+class SaunaImageItem(BaseModel):
+    """Desired gallery entry: existing image by id, or a new image by image_url"""
+    id: str | None = None
+    image_url: str | None = None
+    is_primary: bool = False
+
+
+class SaunaImagesReplace(BaseModel):
+    """Full desired gallery; list position becomes display_order"""
+    images: list[SaunaImageItem]
+
+
 class OperatingHoursResponse(BaseModel):
     id: str
     day_of_week: int
@@ -75,6 +96,7 @@ class SaunaResponse(BaseModel):
     capacity: int
     hourly_rate: float
     image_url: str | None
+    thumbnail_url: str | None = None
     amenities: str | None
     is_active: bool
     open_time: str
@@ -87,6 +109,8 @@ class SaunaResponse(BaseModel):
     sauna_type: str | None = None
     temperature_min: int | None = None
     temperature_max: int | None = None
+    average_rating: float | None = None
+    review_count: int = 0
 
     @field_validator("id", mode="before")
     @classmethod
@@ -111,6 +135,7 @@ class SaunaDetailResponse(BaseModel):
     capacity: int
     hourly_rate: float
     image_url: str | None
+    thumbnail_url: str | None = None
     amenities: str | None
     is_active: bool
     open_time: str
@@ -123,6 +148,8 @@ class SaunaDetailResponse(BaseModel):
     sauna_type: str | None = None
     temperature_min: int | None = None
     temperature_max: int | None = None
+    average_rating: float | None = None
+    review_count: int = 0
     images: list[SaunaImageResponse] = []
     operating_hours: list[OperatingHoursResponse] = []
 
@@ -140,3 +167,22 @@ class SaunaDetailResponse(BaseModel):
             minutes = (total_seconds % 3600) // 60
             return f"{hours:02d}:{minutes:02d}"
         return str(v)
+
+
+class FacetCount(BaseModel):
+    value: str | None
+    count: int
+
+
+class SaunaFacets(BaseModel):
+    sauna_type: list[FacetCount] = []
+    price: list[FacetCount] = []
+    temperature: list[FacetCount] = []
+
+
+class SaunaListPage(BaseModel):
+    items: list[SaunaResponse]
+    total: int
+    limit: int
+    offset: int = 0
+    facets: SaunaFacets | None = None
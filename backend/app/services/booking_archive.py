@@ -0,0 +1,125 @@
+import argparse
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import DateTime, delete, func, insert, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.booking import Booking
+from app.models.booking_archive import BookingArchive
+
+BOOKING_COLUMNS = [c.name for c in Booking.__table__.columns]
+
+
+def archive_cutoff(today: date | None = None) -> str:
+    """Bookings dated before this (YYYY-MM-DD) are due for archival"""
+    today = today or date.today()
+    return (today - timedelta(days=settings.BOOKING_ARCHIVE_DAYS)).isoformat()
+
+
+async def archived_through(db: AsyncSession) -> str | None:
+    """Latest booking_date in the archive, None when it is empty (one index seek)"""
+    result = await db.execute(select(func.max(BookingArchive.booking_date)))
+    return result.scalar()
+
+
+async def reaches_archive(db: AsyncSession, start_date: str | None) -> bool:
+    """Whether bookings dated start_date or later may include archived ones"""
+    through = await archived_through(db)
+    return through is not None and (start_date is None or start_date <= through)
+
+
+def with_archive(build, include_archive: bool = True):
+    """
+    build(table) for bookings, UNION ALL the same for bookings_archive.
+    - build receives a Table and returns a select over its columns; filters
+      go inside build so each side can use its own indexes
+    """
+    hot = build(Booking.__table__)
+    if not include_archive:
+        return hot
+    return union_all(hot, build(BookingArchive.__table__))
+
+
+async def find_booking(db: AsyncSession, booking_id: str) -> Booking | BookingArchive | None:
+    """A booking by id from the hot table, falling back to the archive"""
+    for model in (Booking, BookingArchive):
+        result = await db.execute(select(model).where(model.id == booking_id))
+        booking = result.scalar_one_or_none()
+        if booking is not None:
+            return booking
+    return None
+
+
+async def archive_bookings(
+    db: AsyncSession,
+    before: str,
+    batch_size: int | None = None,
+    max_seconds: float | None = None,
+) -> int:
+    """
+    Move bookings dated before `before` into bookings_archive.
+    - Each batch is copied and deleted in one transaction, so an interrupted
+      run leaves every booking in exactly one table; rerunning continues
+    - Confirmed bookings stay until the status sweeper completes them
+    - booking_daily_stats rows are left alone; they already cover archived days
+    Returns the number of bookings moved.
+    """
+    batch_size = batch_size or settings.BOOKING_ARCHIVE_BATCH_SIZE
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+    table = Booking.__table__
+    total = 0
+
+    while deadline is None or time.monotonic() < deadline:
+        result = await db.execute(
+            select(Booking.id)
+            .where(Booking.booking_date < before, Booking.status != "confirmed")
+            .order_by(Booking.booking_date)
+            .limit(batch_size)
+        )
+        ids = result.scalars().all()
+        if not ids:
+            break
+
+        archived_at = literal(datetime.now(timezone.utc).replace(tzinfo=None), DateTime)
+        await db.execute(
+            insert(BookingArchive.__table__).from_select(
+                [*BOOKING_COLUMNS, "archived_at"],
+                select(*(table.c[c] for c in BOOKING_COLUMNS), archived_at).where(
+                    table.c.id.in_(ids)
+                ),
+            )
+        )
+        await db.execute(delete(table).where(table.c.id.in_(ids)))
+        await db.commit()
+        total += len(ids)
+    return total
+
+
+async def run_archival(max_seconds: float | None = None) -> int:
+    async with async_session() as db:
+        return await archive_bookings(db, archive_cutoff(), max_seconds=max_seconds)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Move old bookings into bookings_archive")
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=settings.BOOKING_ARCHIVE_DAYS,
+        help="Keep bookings from the last DAYS days in the hot table",
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.BOOKING_ARCHIVE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    before = (date.today() - timedelta(days=args.days)).isoformat()
+    async with async_session() as db:
+        moved = await archive_bookings(db, before, args.batch_size)
+    print(f"Archived {moved} booking(s) dated before {before}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
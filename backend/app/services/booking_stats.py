@@ -0,0 +1,179 @@
+import argparse
+import asyncio
+
+from sqlalchemy import and_, case, delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session
+from app.core.jobs import enqueue, job_handler, supersede_jobs
+from app.models.booking import Booking
+from app.models.booking_daily_stat import BookingDailyStat
+from app.services.booking_archive import reaches_archive, with_archive
+
+COUNTER_COLUMNS = ("booking_count", "revenue", "guest_count", "cancelled_count")
+APPLY_JOB = "booking_stats.apply"
+
+
+def _contribution(status: str | None, total_price: float, guest_count: int) -> dict:
+    """What a booking in the given status adds to its daily rollup row"""
+    if status is None:
+        return dict.fromkeys(COUNTER_COLUMNS, 0)
+    if status == "cancelled":
+        return {"booking_count": 0, "revenue": 0, "guest_count": 0, "cancelled_count": 1}
+    return {
+        "booking_count": 1,
+        "revenue": total_price or 0,
+        "guest_count": guest_count or 0,
+        "cancelled_count": 0,
+    }
+
+
+async def _upsert_increments(
+    db: AsyncSession, stat_date: str, sauna_id: str, deltas: dict
+) -> None:
+    table = BookingDailyStat.__table__
+    row = {"stat_date": stat_date, "sauna_id": sauna_id, **deltas}
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        stmt = sqlite_insert(table).values(row)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["stat_date", "sauna_id"],
+            set_={c: table.c[c] + stmt.excluded[c] for c in deltas},
+        )
+        await db.execute(stmt)
+    elif dialect == "mysql":
+        stmt = mysql_insert(table).values(row)
+        stmt = stmt.on_duplicate_key_update(
+            {c: table.c[c] + stmt.inserted[c] for c in deltas}
+        )
+        await db.execute(stmt)
+    else:
+        result = await db.execute(
+            update(table)
+            .where(and_(table.c.stat_date == stat_date, table.c.sauna_id == sauna_id))
+            .values({c: table.c[c] + v for c, v in deltas.items()})
+        )
+        if result.rowcount == 0:
+            await db.execute(insert(table).values(row))
+
+
+async def record_booking_change(
+    db: AsyncSession,
+    booking: Booking,
+    old_status: str | None,
+    new_status: str | None,
+) -> None:
+    """
+    Queue a booking status change for the daily rollup.
+    - old_status None means the booking is new; new_status None means it is removed
+    - Runs in the caller's transaction; commit together with the booking change
+    - The rollup itself is updated by the job runner, batched with other
+      changes, so revenue figures trail bookings: by about JOB_POLL_SECONDS
+      with a polling runner (JOB_RUNNER_IN_APP or app.worker), and by up to
+      a minute on Lambda, where the jobs EventBridge rule fires every minute
+    """
+    old = _contribution(old_status, booking.total_price, booking.guest_count)
+    new = _contribution(new_status, booking.total_price, booking.guest_count)
+    deltas = {c: new[c] - old[c] for c in COUNTER_COLUMNS if new[c] != old[c]}
+    if deltas:
+        await enqueue(
+            db,
+            APPLY_JOB,
+            {"stat_date": str(booking.booking_date), "sauna_id": str(booking.sauna_id), "deltas": deltas},
+        )
+
+
+@job_handler(APPLY_JOB, batch_size=500)
+async def apply_booking_changes(db: AsyncSession, payloads: list[dict]) -> None:
+    """Sum queued deltas per (date, sauna) and upsert each rollup row once"""
+    totals: dict[tuple[str, str], dict] = {}
+    for payload in payloads:
+        row = totals.setdefault((payload["stat_date"], payload["sauna_id"]), {})
+        for column, delta in payload["deltas"].items():
+            row[column] = row.get(column, 0) + delta
+    # Sorted, so concurrent batches lock rollup rows in the same order
+    for (stat_date, sauna_id), deltas in sorted(totals.items()):
+        deltas = {c: v for c, v in deltas.items() if v}
+        if deltas:
+            await _upsert_increments(db, stat_date, sauna_id, deltas)
+
+
+def rollup_select(
+    source=Booking.__table__, start_date: str | None = None, end_date: str | None = None
+):
+    """Aggregate a bookings-shaped table or subquery into booking_daily_stats rows"""
+    active = source.c.status != "cancelled"
+    query = select(
+        source.c.booking_date,
+        source.c.sauna_id,
+        func.sum(case((active, 1), else_=0)),
+        func.sum(case((active, source.c.total_price), else_=0)),
+        func.sum(case((active, source.c.guest_count), else_=0)),
+        func.sum(case((active, 0), else_=1)),
+    ).group_by(source.c.booking_date, source.c.sauna_id)
+    if start_date:
+        query = query.where(source.c.booking_date >= start_date)
+    if end_date:
+        query = query.where(source.c.booking_date <= end_date)
+    return query
+
+
+def _date_range(query, column, start_date: str | None, end_date: str | None):
+    if start_date:
+        query = query.where(column >= start_date)
+    if end_date:
+        query = query.where(column <= end_date)
+    return query
+
+
+async def rebuild_booking_daily_stats(
+    db: AsyncSession, start_date: str | None = None, end_date: str | None = None
+) -> None:
+    """
+    Recompute rollup rows for a date range (inclusive) from the bookings table.
+    - Archived bookings are included when the range reaches into the archive
+    - Queued rollup jobs for the range are marked done in the same transaction;
+      the recount already includes their bookings
+    """
+    await supersede_jobs(
+        db,
+        APPLY_JOB,
+        lambda payload: (not start_date or payload["stat_date"] >= start_date)
+        and (not end_date or payload["stat_date"] <= end_date),
+    )
+    table = BookingDailyStat.__table__
+    await db.execute(_date_range(delete(table), table.c.stat_date, start_date, end_date))
+
+    source = with_archive(
+        lambda t: _date_range(
+            select(t.c.booking_date, t.c.sauna_id, t.c.status, t.c.total_price, t.c.guest_count),
+            t.c.booking_date,
+            start_date,
+            end_date,
+        ),
+        include_archive=await reaches_archive(db, start_date),
+    ).subquery()
+    await db.execute(
+        insert(table).from_select(
+            ["stat_date", "sauna_id", *COUNTER_COLUMNS], rollup_select(source)
+        )
+    )
+    await db.commit()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Backfill booking_daily_stats")
+    parser.add_argument("--from", dest="start_date", help="YYYY-MM-DD (inclusive)")
+    parser.add_argument("--to", dest="end_date", help="YYYY-MM-DD (inclusive)")
+    args = parser.parse_args()
+
+    async with async_session() as db:
+        await rebuild_booking_daily_stats(db, args.start_date, args.end_date)
+    print("Rebuilt booking_daily_stats")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.events import Event, event_bus
+from app.models.booking import Booking
+
+
+def local_now() -> datetime:
+    """Wall clock at the saunas, which booking dates and times are written in"""
+    return datetime.now(ZoneInfo(settings.BOOKING_TIMEZONE))
+
+
+async def complete_finished_bookings(db: AsyncSession, now: datetime | None = None) -> int:
+    """
+    Move confirmed bookings whose end_time has passed to completed.
+    - One set-based UPDATE per booking date, committed per date, so a large
+      backlog never holds locks on more than a day's rows
+    - Only confirmed bookings move; cancelled and admin-marked no_show
+      bookings are final
+    - completed counts the same as confirmed in the daily rollup, so no
+      rollup change is needed
+    Returns the number of bookings completed.
+    """
+    now = now or local_now()
+    today = now.date().isoformat()
+    clock = now.strftime("%H:%M")
+
+    result = await db.execute(
+        select(Booking.booking_date)
+        .where(Booking.status == "confirmed", Booking.booking_date <= today)
+        .distinct()
+        .order_by(Booking.booking_date)
+    )
+    dates = result.scalars().all()
+
+    total = 0
+    for booking_date in dates:
+        stmt = update(Booking).where(
+            Booking.status == "confirmed", Booking.booking_date == booking_date
+        )
+        if booking_date == today:
+            stmt = stmt.where(Booking.end_time <= clock)
+        result = await db.execute(
+            stmt.values(status="completed").execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        total += result.rowcount
+
+    if total and event_bus.subscriber_count:
+        event_bus.publish(
+            Event(
+                type="bookings.completed",
+                data={"count": total, "stats_delta": {"confirmed_bookings": -total}},
+            )
+        )
+    return total
+
+
+async def sweep() -> int:
+    async with async_session() as db:
+        return await complete_finished_bookings(db)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Complete bookings whose time has passed")
+    parser.add_argument(
+        "--every", type=float, metavar="SECONDS", help="Keep running, sweeping at this interval"
+    )
+    args = parser.parse_args()
+
+    while True:
+        print(f"Completed {await sweep()} booking(s)")
+        if not args.every:
+            break
+        await asyncio.sleep(args.every)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,149 @@
+from datetime import date, datetime
+
+import numpy as np
+from sqlalchemy import func, select
+
+from app.models.booking import Booking
+from app.models.booking_daily_stat import BookingDailyStat
+
+# 1970-01-01 was a Thursday; shifting by 3 days makes weeks start on Monday
+_WEEK_SHIFT = 3
+_EPOCH = datetime(1970, 1, 1)
+
+
+def data_version_query():
+    """
+    Cheap stamp that changes whenever cohort inputs may have changed.
+    - Booking count and newest created_at catch inserts and deletes
+    - Rollup cancellation and revenue totals catch status and price updates
+    """
+    return select(
+        select(func.count()).select_from(Booking).scalar_subquery(),
+        select(func.max(Booking.created_at)).scalar_subquery(),
+        select(func.sum(BookingDailyStat.cancelled_count)).scalar_subquery(),
+        select(func.sum(BookingDailyStat.revenue)).scalar_subquery(),
+    )
+
+
+def to_epoch_seconds(values: list) -> np.ndarray:
+    """
+    Naive datetimes as datetime64[s].
+    - Subtracting the epoch in Python is several times faster than letting
+      numpy convert datetime objects
+    """
+    seconds = np.fromiter(
+        ((v - _EPOCH).total_seconds() for v in values), dtype=np.float64, count=len(values)
+    )
+    return seconds.astype(np.int64).astype("datetime64[s]")
+
+
+def to_period(timestamps: np.ndarray, granularity: str) -> np.ndarray:
+    """Month or Monday-week number since the epoch for datetime64 values"""
+    if granularity == "month":
+        return timestamps.astype("datetime64[M]").astype(np.int64)
+    days = timestamps.astype("datetime64[D]").astype(np.int64)
+    return (days + _WEEK_SHIFT) // 7
+
+
+def period_label(period: int, granularity: str) -> str:
+    """YYYY-MM for months, the Monday's YYYY-MM-DD for weeks"""
+    if granularity == "month":
+        return str(np.datetime64(period, "M"))
+    return str(np.datetime64(period * 7 - _WEEK_SHIFT, "D"))
+
+
+def _group_median(values: np.ndarray, groups: np.ndarray, size: int) -> np.ndarray:
+    """Median of values per group index, NaN for empty groups"""
+    order = np.lexsort((values, groups))
+    values = values[order]
+    counts = np.bincount(groups, minlength=size)
+    starts = np.cumsum(counts) - counts
+    medians = np.full(size, np.nan)
+    has = counts > 0
+    lo = starts[has] + (counts[has] - 1) // 2
+    hi = starts[has] + counts[has] // 2
+    medians[has] = (values[lo] + values[hi]) / 2
+    return medians
+
+
+def compute_cohorts(
+    columns: tuple[list, list, list],
+    granularity: str,
+    periods: int,
+    today: date,
+) -> dict:
+    """
+    Build signup-cohort matrices from booking columns.
+    - columns are (user_id, created_at, total_price) of non-cancelled bookings
+    - A user's cohort is the period of their first booking
+    - Only the latest `periods` cohorts and offsets 0..periods-1 are returned
+    Returns labels, per-cohort sizes, repeat rates and median days between
+    bookings, plus (cohorts, periods) retention and cumulative revenue per user
+    matrices; cells that lie in the future are NaN.
+    """
+    user_ids, created_at, prices = columns
+    current = int(to_period(np.array([today], dtype="datetime64[D]"), granularity)[0])
+    _, user = np.unique(np.array(user_ids, dtype=str), return_inverse=True)
+    seconds = to_epoch_seconds(created_at)
+    price = np.array(prices, dtype=np.float64)
+
+    # Sort bookings by (user, time) so each user's history is contiguous
+    order = np.lexsort((seconds, user))
+    user, seconds, price = user[order], seconds[order], price[order]
+    period = to_period(seconds, granularity)
+    first = np.flatnonzero(np.diff(user, prepend=-1))
+    n_users = len(first)
+    bookings_per_user = np.diff(np.r_[first, len(user)])
+
+    # Users' cohort periods, keeping only the latest `periods` cohorts
+    user_cohort = period[first]
+    cohort_periods = np.arange(current - periods + 1, current + 1)
+    cohort_idx = user_cohort - cohort_periods[0]
+    in_range = cohort_idx >= 0
+    n_cohorts = len(cohort_periods)
+
+    size = np.bincount(cohort_idx[in_range], minlength=n_cohorts).astype(np.float64)
+    repeaters = np.bincount(
+        cohort_idx[in_range], weights=(bookings_per_user[in_range] >= 2), minlength=n_cohorts
+    )
+
+    # Per-booking cohort cell (cohort, offset)
+    b_cohort = cohort_idx[user]
+    b_offset = period - user_cohort[user]
+    keep = (b_cohort >= 0) & (b_offset < periods)
+    cell = b_cohort[keep] * periods + b_offset[keep]
+
+    # Active users per cell: count each (user, cell) pair once
+    active_pairs = np.unique(user[keep].astype(np.int64) * (n_cohorts * periods) + cell)
+    active = np.bincount(active_pairs % (n_cohorts * periods), minlength=n_cohorts * periods)
+    revenue = np.bincount(cell, weights=price[keep], minlength=n_cohorts * periods)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        retention = active.reshape(n_cohorts, periods) / size[:, None]
+        ltv = np.cumsum(revenue.reshape(n_cohorts, periods), axis=1) / size[:, None]
+        repeat_rate = np.where(size > 0, repeaters / size, np.nan)
+
+    # Cells beyond today have not happened yet
+    future = np.arange(periods)[None, :] > (current - cohort_periods)[:, None]
+    retention[future] = np.nan
+    ltv[future] = np.nan
+
+    # Days between consecutive bookings of the same user
+    same_user = user[1:] == user[:-1]
+    gap_days = (np.diff(seconds).astype(np.float64) / 86400)[same_user]
+    gap_cohort = cohort_idx[user[1:][same_user]]
+    median_gap = _group_median(
+        gap_days[gap_cohort >= 0], gap_cohort[gap_cohort >= 0], n_cohorts
+    )
+
+    return {
+        "labels": [period_label(int(p), granularity) for p in cohort_periods],
+        "size": size,
+        "repeat_rate": repeat_rate,
+        "median_gap_days": median_gap,
+        "retention": retention,
+        "ltv": ltv,
+        "overall_repeat_rate": float((bookings_per_user >= 2).sum() / n_users) if n_users else 0.0,
+        "overall_median_gap_days": float(np.median(gap_days)) if len(gap_days) else np.nan,
+    }
+
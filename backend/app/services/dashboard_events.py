@@ -0,0 +1,61 @@
+from datetime import date
+
+from app.core.events import Event, event_bus
+from app.models.booking import Booking
+from app.schemas.admin import RecentBooking
+
+
+def _contribution(status: str | None, price: float, is_today: bool) -> dict:
+    """What a booking in the given status adds to the dashboard counters"""
+    active = status is not None and status != "cancelled"
+    return {
+        "total_bookings": int(active),
+        "confirmed_bookings": int(status == "confirmed"),
+        "cancelled_bookings": int(status == "cancelled"),
+        "total_revenue": price if active else 0.0,
+        "today_bookings": int(active and is_today),
+        "today_revenue": price if active and is_today else 0.0,
+    }
+
+
+def stats_delta(booking: Booking, old_status: str | None, new_status: str | None) -> dict:
+    """Change to DashboardStats counters caused by a booking status transition"""
+    is_today = str(booking.booking_date) == date.today().isoformat()
+    price = float(booking.total_price or 0)
+    old = _contribution(old_status, price, is_today)
+    new = _contribution(new_status, price, is_today)
+    return {key: new[key] - old[key] for key in new if new[key] != old[key]}
+
+
+def publish_booking_event(
+    event_type: str,
+    booking: Booking,
+    sauna_name: str | None,
+    old_status: str | None,
+) -> None:
+    """
+    Publish a booking change to live admin dashboard subscribers.
+    - Call after the change is committed
+    - total_customers is not included in deltas (it needs a distinct count)
+    """
+    if not event_bus.subscriber_count:
+        return
+    event_bus.publish(
+        Event(
+            type=event_type,
+            data={
+                "booking": RecentBooking(
+                    id=booking.id,
+                    customer_name=booking.customer_name,
+                    sauna_name=sauna_name,
+                    booking_date=booking.booking_date,
+                    start_time=booking.start_time,
+                    end_time=booking.end_time,
+                    total_price=booking.total_price,
+                    status=booking.status,
+                    created_at=booking.created_at.isoformat() if booking.created_at else "",
+                ).model_dump(),
+                "stats_delta": stats_delta(booking, old_status, booking.status),
+            },
+        )
+    )
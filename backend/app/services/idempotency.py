@@ -0,0 +1,154 @@
+import asyncio
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.idempotency_key import IdempotencyKey
+
+MAX_KEY_LENGTH = 255
+POLL_SECONDS = 0.1
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def _now() -> datetime:
+    """Naive UTC, comparable with what SQLite and MySQL return"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def request_fingerprint(payload: BaseModel) -> str:
+    return hashlib.sha256(payload.model_dump_json().encode()).hexdigest()
+
+
+def _scoped_key(user_id: str | None, key: str, fingerprint: str) -> str:
+    """
+    Storage key for a client's Idempotency-Key.
+    - Signed-in users: "<user id>:<key>"
+    - Guests share no identity, so the key is hashed with the request body: a
+      guest reusing another guest's key never sees their booking or a false
+      422, and only a byte-identical retry replays
+    """
+    if user_id:
+        return f"{user_id}:{key}"
+    digest = hashlib.sha256(f"{fingerprint}:{key}".encode()).hexdigest()
+    return f"anonymous:{digest}"
+
+
+def _replay(record: IdempotencyKey) -> Response:
+    return Response(
+        content=record.response_body,
+        status_code=record.response_status,
+        media_type="application/json",
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+async def claim_idempotency_key(
+    db: AsyncSession, user_id: str | None, key: str, fingerprint: str
+) -> str | Response:
+    """
+    Claim an Idempotency-Key before doing the work, or get the stored response.
+    - Returns the scoped key when this request should run; finish with
+      complete_idempotency_key (same transaction as the work) or
+      release_idempotency_key on failure
+    - Returns the first request's response when it already completed
+    - A concurrent duplicate waits up to IDEMPOTENCY_WAIT_SECONDS for the
+      first request, then gets 409 with Retry-After
+    - Reusing a key with a different body is a 422 for signed-in users; a
+      guest's key is scoped to the body itself (see _scoped_key)
+    """
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters",
+        )
+    scoped_key = _scoped_key(user_id, key, fingerprint)
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+
+    while True:
+        now = _now()
+        try:
+            await db.execute(
+                insert(IdempotencyKey).values(
+                    key=scoped_key,
+                    request_hash=fingerprint,
+                    locked_until=now + timedelta(seconds=settings.IDEMPOTENCY_LOCK_SECONDS),
+                    expires_at=now + timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS),
+                )
+            )
+            await db.commit()
+            return scoped_key
+        except IntegrityError:
+            await db.rollback()
+
+        result = await db.execute(
+            select(IdempotencyKey)
+            .where(IdempotencyKey.key == scoped_key)
+            .execution_options(populate_existing=True)
+        )
+        record = result.scalar_one_or_none()
+        if record is None:
+            continue  # Released in the meantime
+
+        finished = record.response_status is not None
+        if record.expires_at <= now or (not finished and record.locked_until <= now):
+            # Expired, or left behind by a request that died; take it over
+            # unless another request already did
+            await db.execute(
+                delete(IdempotencyKey).where(
+                    IdempotencyKey.key == scoped_key,
+                    IdempotencyKey.locked_until == record.locked_until,
+                )
+            )
+            await db.commit()
+            continue
+
+        if record.request_hash != fingerprint:
+            raise HTTPException(
+                status_code=422,
+                detail="Idempotency-Key was already used with a different request",
+            )
+        if finished:
+            return _replay(record)
+        if time.monotonic() >= deadline:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "1"},
+            )
+        # End the read transaction so the next poll sees the first request's commit
+        await db.rollback()
+        await asyncio.sleep(POLL_SECONDS)
+
+
+async def complete_idempotency_key(db: AsyncSession, scoped_key: str, response: Response) -> None:
+    """Store the response; commits together with the caller's work"""
+    await db.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == scoped_key)
+        .values(
+            response_status=response.status_code,
+            response_body=response.body.decode(),
+            locked_until=_now(),
+        )
+    )
+
+
+async def release_idempotency_key(db: AsyncSession, scoped_key: str) -> None:
+    """Drop a claim whose request failed, so a retry runs again"""
+    await db.rollback()
+    await db.execute(delete(IdempotencyKey).where(IdempotencyKey.key == scoped_key))
+    await db.commit()
+
+
+async def purge_expired_idempotency_keys(db: AsyncSession) -> int:
+    """Delete keys past their expiry; returns rows removed"""
+    result = await db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= _now()))
+    await db.commit()
+    return result.rowcount
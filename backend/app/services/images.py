@@ -0,0 +1,156 @@
+import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from app.core.config import settings
+from app.services.storage import Storage
+
+# Responsive widths generated for every upload (never upscaled)
+VARIANT_WIDTHS = [
+    ("thumbnail", 320),
+    ("medium", 768),
+    ("large", 1600),
+]
+WEBP_QUALITY = 80
+
+ORIGINAL_CONTENT_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+}
+
+# Pillow releases the GIL while decoding, resizing and encoding, so a thread
+# pool runs variants in parallel without the cost of worker processes.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.IMAGE_WORKERS, thread_name_prefix="image-variant"
+)
+
+
+class InvalidImageError(ValueError):
+    pass
+
+
+@dataclass
+class RenderedVariant:
+    name: str
+    width: int
+    height: int
+    format: str
+    content_type: str
+    data: bytes
+
+
+@dataclass
+class StoredVariant:
+    name: str
+    width: int
+    height: int
+    format: str
+    url: str
+    storage_key: str
+
+
+def _inspect(data: bytes) -> tuple[str, int, int]:
+    """Validate the upload and return (format, width, height) after EXIF rotation"""
+    try:
+        with Image.open(BytesIO(data)) as img:
+            img.verify()
+        with Image.open(BytesIO(data)) as img:
+            # The transposed copy has no format; read it from the original
+            image_format = img.format or "JPEG"
+            img = ImageOps.exif_transpose(img)
+            return image_format, img.width, img.height
+    except Image.DecompressionBombError as e:
+        raise InvalidImageError("Image dimensions are too large") from e
+    except (UnidentifiedImageError, OSError, SyntaxError) as e:
+        raise InvalidImageError("Unsupported or corrupt image") from e
+
+
+def _render(data: bytes, name: str, width: int) -> RenderedVariant:
+    with Image.open(BytesIO(data)) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+        if img.width > width:
+            height = max(1, round(img.height * width / img.width))
+            img = img.resize((width, height), Image.Resampling.LANCZOS)
+        out = BytesIO()
+        img.save(out, "WEBP", quality=WEBP_QUALITY, method=4)
+        return RenderedVariant(
+            name=name,
+            width=img.width,
+            height=img.height,
+            format="webp",
+            content_type="image/webp",
+            data=out.getvalue(),
+        )
+
+
+def _targets(original_width: int) -> list[tuple[str, int]]:
+    """Pick variant widths below the original; the smallest is always kept"""
+    targets = [(name, w) for name, w in VARIANT_WIDTHS if w < original_width]
+    if not targets:
+        targets = VARIANT_WIDTHS[:1]
+    return targets
+
+
+async def process_image_upload(
+    data: bytes, key_prefix: str, storage: Storage
+) -> list[StoredVariant]:
+    """
+    Store an uploaded image with resized WebP variants.
+    - Renders variants concurrently in the image worker pool
+    - Keeps the original bytes as the "original" variant
+    - Raises InvalidImageError if the data is not a readable image or too large
+      to decode safely
+    - If any variant fails to store, the ones already stored are deleted
+    """
+    loop = asyncio.get_running_loop()
+    image_format, width, height = await loop.run_in_executor(_executor, _inspect, data)
+
+    rendered = await asyncio.gather(
+        *(
+            loop.run_in_executor(_executor, _render, data, name, target)
+            for name, target in _targets(width)
+        )
+    )
+    rendered.append(
+        RenderedVariant(
+            name="original",
+            width=width,
+            height=height,
+            format=image_format.lower(),
+            content_type=ORIGINAL_CONTENT_TYPES.get(image_format, "application/octet-stream"),
+            data=data,
+        )
+    )
+
+    base_key = f"{key_prefix}/{uuid.uuid4().hex}"
+
+    async def _store(variant: RenderedVariant) -> StoredVariant:
+        key = f"{base_key}/{variant.name}.{variant.format}"
+        url = await storage.save(key, variant.data, variant.content_type)
+        return StoredVariant(
+            name=variant.name,
+            width=variant.width,
+            height=variant.height,
+            format=variant.format,
+            url=url,
+            storage_key=key,
+        )
+
+    results = await asyncio.gather(*(_store(v) for v in rendered), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        # Remove the variants that did get stored before reporting the failure
+        await asyncio.gather(
+            *(storage.delete(r.storage_key) for r in results if isinstance(r, StoredVariant)),
+            return_exceptions=True,
+        )
+        raise errors[0]
+    return results
@@ -0,0 +1,112 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+HOURS = np.arange(24)
+HOUR_START = HOURS * 60
+HOUR_END = HOUR_START + 60
+WEEKDAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# Rows processed per step when expanding intervals to (rows, 24) hour overlaps
+CHUNK_SIZE = 200_000
+
+
+def to_minutes_array(values) -> np.ndarray:
+    """
+    Convert HH:MM strings (or MySQL TIME timedeltas) to minutes since midnight.
+    - Strings are parsed as bytes without a Python-level loop; unpadded
+      ones such as "9:00" (stored before BookingCreate validated times) are
+      zero-padded first so the fixed offsets still line up
+    """
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int32)
+    if not isinstance(values[0], str):
+        return np.array(
+            [int(v.total_seconds()) // 60 for v in values], dtype=np.int32
+        )
+    padded = np.char.zfill(np.array(values, dtype="S5"), 5)
+    raw = padded.view(np.uint8).reshape(-1, 5).astype(np.int32) - 48
+    return raw[:, 0] * 600 + raw[:, 1] * 60 + raw[:, 3] * 10 + raw[:, 4]
+
+
+def hour_overlap(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Minutes of each [start, end) interval falling in each hour of the day, shape (n, 24)"""
+    overlap = np.minimum(end[:, None], HOUR_END[None, :]) - np.maximum(
+        start[:, None], HOUR_START[None, :]
+    )
+    return np.clip(overlap, 0, 60)
+
+
+def _accumulate(cells: np.ndarray, start, end, size: int) -> np.ndarray:
+    """Sum hour overlaps into a (size, 24) matrix indexed by cells"""
+    total = np.zeros(size * 24, dtype=np.float64)
+    for i in range(0, len(cells), CHUNK_SIZE):
+        overlap = hour_overlap(start[i:i + CHUNK_SIZE], end[i:i + CHUNK_SIZE])
+        index = cells[i:i + CHUNK_SIZE, None] * 24 + HOURS[None, :]
+        total += np.bincount(index.ravel(), weights=overlap.ravel(), minlength=size * 24)
+    return total.reshape(size, 24)
+
+
+def compute_utilization(
+    sauna_ids: list[str],
+    open_minutes: dict[str, list[tuple[int, int] | None]],
+    bookings: tuple[list, list, list, list],
+    start_date: date,
+    end_date: date,
+    mode: str,
+) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """
+    Build per-sauna booked and open hour matrices.
+    - open_minutes maps sauna id to 7 (open, close) minute pairs, Monday first;
+      None marks a closed day
+    - bookings are column lists (sauna_id, booking_date, start_time, end_time)
+    - mode "weekday" gives 7 x 24 rows per sauna, "date" one row per date
+    Returns (row labels, booked hours, open hours), arrays shaped (saunas, rows, 24).
+    """
+    days = (end_date - start_date).days + 1
+    sauna_index = {sauna_id: i for i, sauna_id in enumerate(sauna_ids)}
+    day_weekday = (np.arange(days) + start_date.weekday()) % 7
+    rows = 7 if mode == "weekday" else days
+    size = len(sauna_ids) * rows
+
+    # Booked minutes per (sauna, row, hour)
+    b_sauna, b_date, b_start, b_end = bookings
+    if b_sauna:
+        sauna_idx = np.array([sauna_index.get(s, -1) for s in b_sauna], dtype=np.int64)
+        day_idx = (
+            np.array(b_date, dtype="datetime64[D]") - np.datetime64(start_date, "D")
+        ).astype(np.int64)
+        start = to_minutes_array(b_start)
+        end = to_minutes_array(b_end)
+        keep = (sauna_idx >= 0) & (day_idx >= 0) & (day_idx < days)
+        sauna_idx, day_idx, start, end = sauna_idx[keep], day_idx[keep], start[keep], end[keep]
+        row_idx = day_weekday[day_idx] if mode == "weekday" else day_idx
+        booked = _accumulate(sauna_idx * rows + row_idx, start, end, size)
+    else:
+        booked = np.zeros((size, 24))
+
+    # Open minutes per (sauna, row, hour) from each sauna's weekly schedule
+    weekly = np.zeros((len(sauna_ids), 7, 24))
+    for i, sauna_id in enumerate(sauna_ids):
+        for weekday, hours in enumerate(open_minutes.get(sauna_id, [None] * 7)):
+            if hours is not None:
+                weekly[i, weekday] = hour_overlap(np.array([hours[0]]), np.array([hours[1]]))[0]
+    if mode == "weekday":
+        weekday_counts = np.bincount(day_weekday, minlength=7)
+        opened = weekly * weekday_counts[None, :, None]
+    else:
+        opened = weekly[:, day_weekday, :]
+
+    if mode == "weekday":
+        labels = WEEKDAY_LABELS
+    else:
+        labels = [(start_date + timedelta(days=d)).isoformat() for d in range(days)]
+
+    booked = booked.reshape(len(sauna_ids), rows, 24) / 60
+    return labels, booked, opened.reshape(len(sauna_ids), rows, 24) / 60
+
+
+def utilization_ratio(booked: np.ndarray, opened: np.ndarray) -> np.ndarray:
+    """booked / opened per cell, NaN where the sauna is never open"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(opened > 0, booked / opened, np.nan)
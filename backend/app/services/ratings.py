@@ -0,0 +1,88 @@
+import asyncio
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session
+from app.models.review import Review
+from app.models.sauna import Sauna
+
+RATING_COUNT_COLUMNS = {
+    1: Sauna.rating_1_count,
+    2: Sauna.rating_2_count,
+    3: Sauna.rating_3_count,
+    4: Sauna.rating_4_count,
+    5: Sauna.rating_5_count,
+}
+
+# Columns needed to build a review summary, for projected queries
+SUMMARY_COLUMNS = [
+    Sauna.id,
+    Sauna.review_count,
+    Sauna.rating_sum,
+    *RATING_COUNT_COLUMNS.values(),
+]
+
+
+def rating_distribution(sauna) -> dict[int, int]:
+    """Star distribution from a Sauna or a row selected with SUMMARY_COLUMNS"""
+    return {rating: getattr(sauna, column.key) for rating, column in RATING_COUNT_COLUMNS.items()}
+
+
+async def apply_review_rating(
+    db: AsyncSession, sauna_id: str, rating: int, delta: int
+) -> None:
+    """
+    Add (delta=1) or remove (delta=-1) one rating from a sauna's aggregates.
+    - Increments run in SQL so concurrent reviews cannot lose updates
+    - Runs in the caller's transaction; commit together with the review change
+    """
+    column = RATING_COUNT_COLUMNS[rating]
+    await db.execute(
+        update(Sauna)
+        .where(Sauna.id == sauna_id)
+        .values(
+            {
+                Sauna.review_count: Sauna.review_count + delta,
+                Sauna.rating_sum: Sauna.rating_sum + delta * rating,
+                column: column + delta,
+            }
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def rebuild_rating_aggregates(db: AsyncSession) -> int:
+    """Recompute every sauna's aggregates from the reviews table; returns saunas updated"""
+    result = await db.execute(
+        select(Review.sauna_id, Review.rating, func.count(Review.id))
+        .group_by(Review.sauna_id, Review.rating)
+    )
+
+    sauna_ids = await db.execute(select(Sauna.id))
+    empty = {"review_count": 0, "rating_sum": 0}
+    empty.update({column.key: 0 for column in RATING_COUNT_COLUMNS.values()})
+    aggregates = {sauna_id: {"id": sauna_id, **empty} for (sauna_id,) in sauna_ids.all()}
+
+    for sauna_id, rating, count in result.all():
+        row = aggregates.get(sauna_id)
+        if row is None or rating not in RATING_COUNT_COLUMNS:
+            continue
+        row["review_count"] += count
+        row["rating_sum"] += rating * count
+        row[RATING_COUNT_COLUMNS[rating].key] += count
+
+    if aggregates:
+        await db.execute(update(Sauna), list(aggregates.values()))
+    await db.commit()
+    return len(aggregates)
+
+
+async def main():
+    async with async_session() as db:
+        count = await rebuild_rating_aggregates(db)
+    print(f"Rebuilt rating aggregates for {count} saunas")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+import asyncio
+import os
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+from app.core.config import settings
+
+
+class Storage(ABC):
+    """Interface for storing uploaded image files"""
+
+    @abstractmethod
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        """Store data under key and return its public URL"""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove the object under key; missing keys are not an error"""
+
+
+class LocalStorage(Storage):
+    """Filesystem storage for development and tests, served from base_url"""
+
+    def __init__(self, root: str, base_url: str):
+        self.root = root
+        self.base_url = base_url.rstrip("/")
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(os.path.abspath(self.root) + os.sep):
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def _write(self, path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        await asyncio.to_thread(self._write, self._path(key), data)
+        return f"{self.base_url}/{key}"
+
+    async def delete(self, key: str) -> None:
+        path = self._path(key)
+        if os.path.exists(path):
+            await asyncio.to_thread(os.remove, path)
+
+
+class S3Storage(Storage):
+    """S3 storage for production, served from base_url (e.g. CloudFront)"""
+
+    def __init__(self, bucket: str, prefix: str, base_url: str):
+        import boto3
+
+        self.client = boto3.client("s3")
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.base_url = base_url.rstrip("/")
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    async def save(self, key: str, data: bytes, content_type: str) -> str:
+        await asyncio.to_thread(
+            self.client.put_object,
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Body=data,
+            ContentType=content_type,
+            CacheControl="public, max-age=31536000, immutable",
+        )
+        return f"{self.base_url}/{self._object_key(key)}"
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(
+            self.client.delete_object, Bucket=self.bucket, Key=self._object_key(key)
+        )
+
+
+@lru_cache
+def get_storage() -> Storage:
+    if settings.STORAGE_BACKEND == "s3":
+        return S3Storage(settings.S3_BUCKET, settings.S3_PREFIX, settings.STORAGE_BASE_URL)
+    return LocalStorage(settings.STORAGE_LOCAL_DIR, settings.STORAGE_BASE_URL)
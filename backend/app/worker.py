@@ -0,0 +1,52 @@
+"""
+Standalone background job worker.
+
+Usage (from backend/):
+    python -m app.worker               # poll (and sweep bookings) until SIGINT/SIGTERM
+    python -m app.worker --once        # run due jobs, then exit
+    python -m app.worker --retry-failed [--kind KIND]
+                                       # queue jobs that used up their attempts again
+"""
+import argparse
+import asyncio
+import logging
+import signal
+
+from app.core.database import async_session
+from app.core.jobs import JobRunner, retry_failed_jobs
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Run queued background jobs")
+    parser.add_argument("--once", action="store_true", help="Drain due jobs and exit")
+    parser.add_argument("--max-seconds", type=float, default=300, help="Time limit for --once")
+    parser.add_argument("--concurrency", type=int, help="Batches run at once (JOB_CONCURRENCY)")
+    parser.add_argument("--batch-size", type=int, help="Jobs claimed per batch (JOB_BATCH_SIZE)")
+    parser.add_argument("--retry-failed", action="store_true", help="Requeue failed jobs and exit")
+    parser.add_argument("--kind", help="With --retry-failed, only jobs of this kind")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.retry_failed:
+        async with async_session() as db:
+            requeued = await retry_failed_jobs(db, args.kind)
+        print(f"Requeued {requeued} failed job(s)")
+        return
+
+    runner = JobRunner(concurrency=args.concurrency, batch_size=args.batch_size)
+    if args.once:
+        processed = await runner.drain(args.max_seconds)
+        print(f"Processed {processed} job(s)")
+        return
+
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopped.set)
+    runner.start()
+    await stopped.wait()
+    await runner.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
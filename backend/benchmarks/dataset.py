@@ -0,0 +1,45 @@
+"""
+Cached synthetic dataset for the endpoint benchmarks.
+
+The rows come from app.services.synthetic_data; this module only decides
+whether an existing database file can be reused.
+"""
+import json
+import os
+from dataclasses import asdict
+from datetime import date
+
+from app.core.database import engine, init_db
+from app.services.synthetic_data import GeneratorParams, generate
+
+# Hundreds of saunas, a million bookings, hundreds of thousands of reviews
+BENCHMARK_PARAMS = GeneratorParams(saunas=300, users=50_000, bookings=1_000_000, reviews=200_000)
+
+
+async def ensure_dataset(db_path: str, params: GeneratorParams, rebuild: bool = False) -> dict:
+    """
+    Reuse db_path when it was built with the same params, otherwise rebuild it.
+    - The params and row counts are kept next to the database as JSON
+    - The database URL must already point at db_path
+    """
+    meta_path = db_path + ".json"
+    built_on = params.today or date.today().isoformat()
+    if not rebuild and os.path.exists(db_path) and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta["params"] == asdict(params) and meta["built_on"] == built_on:
+            await init_db()  # Adds tables introduced since the file was built
+            return meta
+
+    for path in (db_path, meta_path, db_path + "-wal", db_path + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    await engine.dispose()
+
+    await init_db()
+    result = await generate(params, log=lambda line: None)
+    meta = {"params": asdict(params), "built_on": built_on, **result}
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=2)
+    return meta
@@ -0,0 +1,284 @@
+"""
+Endpoint latency and throughput benchmark over a large seeded dataset.
+
+Builds (or reuses) a SQLite database with hundreds of saunas, a million
+bookings and hundreds of thousands of reviews, boots the app against it and
+drives each endpoint through the ASGI interface with concurrent clients.
+- Measures app + database time only; no network or server in between
+- The dashboard cache is disabled so every request computes its stats
+- Reports p50/p95/p99 latency, throughput and SQL statements per request
+- Results are saved as JSON so runs on different commits can be compared
+
+Usage (from backend/):
+    python -m benchmarks.endpoints
+    python -m benchmarks.endpoints --bookings 200000 --requests 200 --case get_availability
+    python -m benchmarks.endpoints --compare benchmarks/results/abc1234.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import time
+from collections import Counter
+from dataclasses import fields
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+DEFAULT_DB = os.path.join(os.path.dirname(__file__), "data", "endpoints.db")
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+BENCHMARK_NOTE = "endpoint-benchmark"
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+class Cases:
+    """Request factories per benchmark case; each returns (method, url, json body)"""
+
+    def __init__(self, ids: dict, params, rng: np.random.Generator):
+        self.sauna_ids = ids["saunas"]
+        self.reviewed_sauna_ids = ids["reviewed_saunas"]
+        self.params = params
+        self.rng = rng
+        self.today = date.today()
+
+    def list_saunas(self, i):
+        return "GET", "/api/v1/saunas", None
+
+    def list_saunas_facets(self, i):
+        return "GET", "/api/v1/saunas?limit=20&include_facets=true&sort=rating", None
+
+    def get_availability(self, i):
+        sauna_id = self.sauna_ids[self.rng.integers(len(self.sauna_ids))]
+        day = self.today + timedelta(days=int(self.rng.integers(-30, self.params.future_days)))
+        return "GET", f"/api/v1/bookings/availability?sauna_id={sauna_id}&date={day}", None
+
+    def create_booking(self, i):
+        # Days past the seeded range are free, so every request should succeed
+        sauna_id = self.sauna_ids[i % len(self.sauna_ids)]
+        day = self.today + timedelta(days=self.params.future_days + 1 + i // len(self.sauna_ids))
+        return "POST", "/api/v1/bookings", {
+            "sauna_id": sauna_id,
+            "booking_date": day.isoformat(),
+            "start_time": "10:00",
+            "end_time": "12:00",
+            "guest_count": 2,
+            "customer_name": "Benchmark",
+            "customer_phone": "010-0000-0000",
+            "customer_email": "benchmark@example.com",
+            "notes": BENCHMARK_NOTE,
+        }
+
+    def get_dashboard_stats(self, i):
+        return "GET", "/api/v1/admin/stats", None
+
+    def list_reviews(self, i):
+        sauna_id = self.reviewed_sauna_ids[i % len(self.reviewed_sauna_ids)]
+        return "GET", f"/api/v1/reviews?sauna_id={sauna_id}&limit=20", None
+
+
+# Writes run last so the read cases see the seeded data only
+CASES = [
+    "list_saunas",
+    "list_saunas_facets",
+    "get_availability",
+    "list_reviews",
+    "get_dashboard_stats",
+    "create_booking",
+]
+
+
+async def run_case(client, factory, headers: dict, requests: int, concurrency: int, warmup: int) -> dict:
+    from app.core.sql_instrumentation import capture_queries
+
+    async def send(i: int):
+        method, url, body = factory(i)
+        with capture_queries() as capture:
+            start = time.perf_counter()
+            response = await client.request(method, url, json=body, headers=headers)
+            elapsed = time.perf_counter() - start
+        return elapsed, response.status_code, capture.count
+
+    for i in range(warmup):
+        await send(requests + i)
+
+    latencies, statuses, queries = [], Counter(), []
+    next_index = iter(range(requests))
+
+    async def worker():
+        for i in next_index:
+            elapsed, status, count = await send(i)
+            latencies.append(elapsed)
+            statuses[status] += 1
+            queries.append(count)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "throughput_rps": round(requests / wall, 1),
+        "mean_ms": round(float(ms.mean()), 2),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p95_ms": round(float(np.percentile(ms, 95)), 2),
+        "p99_ms": round(float(np.percentile(ms, 99)), 2),
+        "max_ms": round(float(ms.max()), 2),
+        "queries": int(np.median(queries)),
+    }
+
+
+async def _reset_benchmark_writes(params) -> None:
+    """Remove bookings left by earlier create_booking runs and fix the rollup"""
+    from sqlalchemy import delete
+
+    from app.core.database import async_session
+    from app.core.jobs import JobRunner
+    from app.models import Booking
+    from app.services.booking_stats import rebuild_booking_daily_stats
+
+    # Apply rollup changes still queued by the last run before recounting
+    await JobRunner().drain(max_seconds=60)
+    first_free_day = (date.today() + timedelta(days=params.future_days + 1)).isoformat()
+    async with async_session() as db:
+        await db.execute(delete(Booking).where(Booking.notes == BENCHMARK_NOTE))
+        await db.commit()
+        await rebuild_booking_daily_stats(db, start_date=first_free_day)
+
+
+async def _fixture_ids() -> dict:
+    from sqlalchemy import select
+
+    from app.core.database import async_session
+    from app.models import Sauna, User
+
+    async with async_session() as db:
+        saunas = (await db.execute(select(Sauna.id).order_by(Sauna.name))).scalars().all()
+        reviewed = (
+            await db.execute(select(Sauna.id).order_by(Sauna.review_count.desc()).limit(20))
+        ).scalars().all()
+        admin_id = (
+            await db.execute(select(User.id).where(User.is_admin.is_(True)).limit(1))
+        ).scalar_one()
+    return {"saunas": list(saunas), "reviewed_saunas": list(reviewed), "admin": admin_id}
+
+
+async def benchmark(args, params) -> dict:
+    import httpx
+
+    from app.core.security import create_access_token
+    from app.main import app
+    from benchmarks.dataset import ensure_dataset
+
+    start = time.perf_counter()
+    meta = await ensure_dataset(args.db, params, rebuild=args.rebuild)
+    print(f"dataset ready in {time.perf_counter() - start:.1f}s: {meta['rows']}")
+    await _reset_benchmark_writes(params)
+    ids = await _fixture_ids()
+
+    cases = Cases(ids, params, np.random.default_rng(params.seed))
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': ids['admin']})}"}
+    results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name in args.case or CASES:
+                results[name] = await run_case(
+                    client, getattr(cases, name), headers, args.requests, args.concurrency, args.warmup
+                )
+                _print_case(name, results[name])
+    await _reset_benchmark_writes(params)
+
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dataset": {"params": meta["params"], "rows": meta["rows"]},
+        "cases": results,
+    }
+
+
+def _print_case(name: str, r: dict) -> None:
+    statuses = " ".join(f"{k}x{v}" for k, v in r["statuses"].items())
+    print(
+        f"  {name:<22} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} {r['p99_ms']:8.2f} "
+        f"{r['throughput_rps']:9.1f} {r['queries']:5d}  {statuses}"
+    )
+
+
+def compare(current: dict, base: dict) -> None:
+    """Print p50/p95/throughput deltas against an earlier result file"""
+    print(f"\n{base.get('commit') or '?'} -> {current.get('commit') or '?'}")
+    print(f"  {'case':<22} {'p50 ms':>18} {'p95 ms':>18} {'req/s':>20}")
+    for name, r in current["cases"].items():
+        b = base["cases"].get(name)
+        if b is None:
+            continue
+        cells = []
+        for key in ("p50_ms", "p95_ms", "throughput_rps"):
+            change = (r[key] - b[key]) / b[key] if b[key] else 0.0
+            cells.append(f"{b[key]:8.1f}->{r[key]:<8.1f}{change:+6.0%}")
+        print(f"  {name:<22} " + " ".join(cells))
+
+
+def main():
+    from app.services.synthetic_data import GeneratorParams
+    from benchmarks.dataset import BENCHMARK_PARAMS
+
+    parser = argparse.ArgumentParser(description="Benchmark API endpoints over a large dataset")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite file for the dataset")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the dataset even if it matches")
+    for field in fields(GeneratorParams):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=type(field.default),
+            default=getattr(BENCHMARK_PARAMS, field.name),
+        )
+    parser.add_argument("--case", action="append", choices=CASES, help="Case to run (repeatable)")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per case")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per case")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="Earlier result file to compare against")
+    args = parser.parse_args()
+    params = GeneratorParams(**{f.name: getattr(args, f.name) for f in fields(GeneratorParams)})
+
+    print(f"  {'case':<22} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>9} {'sql':>5}  statuses")
+    result = asyncio.run(benchmark(args, params))
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{result['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"\nsaved {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(result, json.load(f))
+
+
+if __name__ == "__main__":
+    # Settings are read at import time, so point the app at the benchmark
+    # database before anything under app/ is imported
+    import sys
+
+    db = DEFAULT_DB
+    if "--db" in sys.argv:
+        db = sys.argv[sys.argv.index("--db") + 1]
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.abspath(db)}"
+    os.environ["STARTUP_MODE"] = "fast"
+    os.environ["DASHBOARD_CACHE_TTL"] = "0"
+    logging.getLogger("app.sql").setLevel(logging.ERROR)
+    main()
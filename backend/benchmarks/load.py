@@ -0,0 +1,354 @@
+"""
+Traffic-replay load test against a running API server.
+
+Virtual users, each with its own httpx client, replay a weighted mix of real
+traffic in a closed loop:
+- browse: sauna list, a sauna's detail, review summary and first review page
+- availability: one sauna/date availability check
+- book: check availability, then book a free slot (evening slots first)
+- cancel: cancel one of the user's upcoming bookings
+- review: review one of the user's completed, unreviewed bookings
+- admin: dashboard stats, recent bookings and revenue
+
+Stages with increasing user counts show where a single worker saturates.
+Booking attempts concentrate on a few hot sauna/date pairs (--hot-share),
+so users race for the same slots and the 409 conflict rate is measurable.
+
+Usage (from backend/), with the server on a synthetic dataset:
+    python -m app.services.synthetic_data --saunas 300 --bookings 1000000 --replace
+    STARTUP_MODE=fast uvicorn app.main:app --workers 1 &
+    python -m benchmarks.load --users 10,50,100,200 --stage-seconds 30
+    python -m benchmarks.load --mix browse=0,book=1 --hot-share 1 --users 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+import httpx
+import numpy as np
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+DEFAULT_MIX = "browse=50,availability=25,book=10,cancel=3,review=2,admin=5"
+EVENING = "17:00"
+
+
+class Recorder:
+    """Latencies and statuses per route, plus booking outcomes, for one stage"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)  # route -> [(status, seconds)]
+        self.booking = defaultdict(int)
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def record(self, route: str, status: int, seconds: float) -> None:
+        self.samples[route].append((status, seconds))
+
+    def summary(self) -> dict:
+        routes = {}
+        for route, samples in sorted(self.samples.items()):
+            statuses = np.array([s for s, _ in samples])
+            ms = np.array([t for _, t in samples]) * 1000
+            # A 409 on a booking is a lost race, not a server error
+            failed = (statuses == 0) | ((statuses >= 400) & (statuses != 409))
+            routes[route] = {
+                "requests": len(samples),
+                "rps": round(len(samples) / self.elapsed, 1),
+                "p50_ms": round(float(np.percentile(ms, 50)), 1),
+                "p95_ms": round(float(np.percentile(ms, 95)), 1),
+                "p99_ms": round(float(np.percentile(ms, 99)), 1),
+                "errors": int(failed.sum()),
+                "statuses": {str(k): int(v) for k, v in zip(*np.unique(statuses, return_counts=True))},
+            }
+        total = sum(r["requests"] for r in routes.values())
+        attempts = self.booking["created"] + self.booking["conflict"]
+        hot_attempts = self.booking["hot_created"] + self.booking["hot_conflict"]
+        return {
+            "seconds": round(self.elapsed, 1),
+            "requests": total,
+            "rps": round(total / self.elapsed, 1) if self.elapsed else 0.0,
+            "routes": routes,
+            "booking": {
+                **dict(self.booking),
+                "attempts": attempts,
+                "conflict_rate": round(self.booking["conflict"] / attempts, 4) if attempts else 0.0,
+                "hot_conflict_rate": (
+                    round(self.booking["hot_conflict"] / hot_attempts, 4) if hot_attempts else 0.0
+                ),
+            },
+        }
+
+
+def _client(base_url: str) -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url=base_url, timeout=30.0)
+
+
+class VirtualUser:
+    def __init__(self, world: "World", index: int, recorder: Recorder):
+        self.world = world
+        self.rng = random.Random(world.seed * 100_003 + index)
+        self.account = world.accounts[index % len(world.accounts)]
+        self.recorder = recorder
+        self.client = _client(world.base_url)
+        self.booked: list[str] = []
+
+    async def call(self, route: str, method: str, url: str, token: str | None = None, **kwargs):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(route, 0, time.perf_counter() - start)
+            return None
+        self.recorder.record(route, response.status_code, time.perf_counter() - start)
+        return response
+
+    async def browse(self):
+        await self.call("GET /saunas", "GET", "/api/v1/saunas")
+        sauna_id = self.rng.choice(self.world.sauna_ids)
+        await self.call("GET /saunas/{id}", "GET", f"/api/v1/saunas/{sauna_id}")
+        await self.call("GET /reviews/summary", "GET", f"/api/v1/reviews/summary?sauna_id={sauna_id}")
+        await self.call("GET /reviews", "GET", f"/api/v1/reviews?sauna_id={sauna_id}&limit=10")
+
+    async def _availability(self, sauna_id: str, day: str):
+        response = await self.call(
+            "GET /bookings/availability",
+            "GET",
+            f"/api/v1/bookings/availability?sauna_id={sauna_id}&date={day}",
+        )
+        if response is None or response.status_code != 200:
+            return []
+        return [slot["time"] for slot in response.json() if slot["available"]]
+
+    async def availability(self):
+        day = date.today() + timedelta(days=self.rng.randrange(0, 30))
+        await self._availability(self.rng.choice(self.world.sauna_ids), day.isoformat())
+
+    async def book(self):
+        hot = self.rng.random() < self.world.hot_share
+        if hot:
+            sauna_id, day = self.rng.choice(self.world.hot_pairs)
+        else:
+            sauna_id = self.rng.choice(self.world.sauna_ids)
+            day = (date.today() + timedelta(days=self.rng.randrange(1, 30))).isoformat()
+        free = await self._availability(sauna_id, day)
+        if not free:
+            self.recorder.booking["sold_out"] += 1
+            return
+        evening = [t for t in free if t >= EVENING]
+        start = self.rng.choice(evening[:2] or free)
+        end = f"{int(start[:2]) + 1:02d}:{start[3:]}"
+        response = await self.call(
+            "POST /bookings",
+            "POST",
+            "/api/v1/bookings",
+            token=self.account["token"],
+            json={
+                "sauna_id": sauna_id,
+                "booking_date": day,
+                "start_time": start,
+                "end_time": end,
+                "guest_count": 1,
+                "customer_name": self.account["email"].split("@")[0],
+                "customer_phone": "010-0000-0000",
+                "customer_email": self.account["email"],
+                "notes": "load-test",
+            },
+        )
+        if response is None:
+            return
+        if response.status_code == 200:
+            self.booked.append(response.json()["id"])
+            outcome = "created"
+        elif response.status_code == 409:
+            outcome = "conflict"
+        else:
+            return
+        self.recorder.booking[outcome] += 1
+        if hot:
+            self.recorder.booking["hot_" + outcome] += 1
+
+    async def _my_bookings(self, status: str) -> list[dict]:
+        response = await self.call(
+            "GET /bookings/my", "GET", f"/api/v1/bookings/my?status={status}", token=self.account["token"]
+        )
+        return response.json() if response is not None and response.status_code == 200 else []
+
+    async def cancel(self):
+        if self.booked:
+            booking_id = self.booked.pop(self.rng.randrange(len(self.booked)))
+        else:
+            today = date.today().isoformat()
+            upcoming = [b for b in await self._my_bookings("confirmed") if b["booking_date"] > today]
+            if not upcoming:
+                return
+            booking_id = self.rng.choice(upcoming)["id"]
+        await self.call(
+            "PATCH /bookings/{id}/cancel",
+            "PATCH",
+            f"/api/v1/bookings/{booking_id}/cancel",
+            token=self.account["token"],
+        )
+
+    async def review(self):
+        candidates = [b for b in await self._my_bookings("completed") if not b["has_review"]]
+        if not candidates:
+            return
+        booking = self.rng.choice(candidates)
+        await self.call(
+            "POST /reviews",
+            "POST",
+            "/api/v1/reviews",
+            token=self.account["token"],
+            json={
+                "sauna_id": booking["sauna_id"],
+                "booking_id": booking["id"],
+                "rating": self.rng.choice([3, 4, 4, 5, 5]),
+                "comment": "load test review",
+            },
+        )
+
+    async def admin(self):
+        token = self.world.admin_token
+        await self.call("GET /admin/stats", "GET", "/api/v1/admin/stats", token=token)
+        await self.call("GET /admin/recent-bookings", "GET", "/api/v1/admin/recent-bookings", token=token)
+        await self.call("GET /admin/revenue", "GET", "/api/v1/admin/revenue?period=30", token=token)
+
+    async def run(self, deadline: float, think: float) -> None:
+        actions, weights = self.world.actions, self.world.weights
+        try:
+            while time.perf_counter() < deadline:
+                await getattr(self, self.rng.choices(actions, weights)[0])()
+                if think:
+                    await asyncio.sleep(self.rng.expovariate(1 / think))
+        finally:
+            await self.client.aclose()
+
+
+class World:
+    """Shared fixtures: sauna ids, logged-in accounts and hot booking targets"""
+
+    def __init__(self, args):
+        self.base_url = args.base_url
+        self.seed = args.seed
+        self.hot_share = args.hot_share
+        mix = dict(item.split("=") for item in args.mix.split(","))
+        self.actions = [name for name, weight in mix.items() if float(weight) > 0]
+        self.weights = [float(mix[name]) for name in self.actions]
+        self.args = args
+
+    async def _login(self, client: httpx.AsyncClient, email: str) -> str:
+        response = await client.post(
+            "/api/v1/auth/login", json={"email": email, "password": self.args.password}
+        )
+        response.raise_for_status()
+        return response.json()["access_token"]
+
+    async def prepare(self) -> None:
+        rng = random.Random(self.seed)
+        async with _client(self.base_url) as client:
+            (await client.get("/health")).raise_for_status()
+            response = await client.get("/api/v1/saunas")
+            response.raise_for_status()
+            self.sauna_ids = [s["id"] for s in response.json()]
+
+            # Log in once up front: bcrypt checks would otherwise dominate the run
+            emails = [f"user{self.args.first_account + i}@example.com" for i in range(self.args.accounts)]
+            tokens = await asyncio.gather(*(self._login(client, email) for email in emails))
+            self.accounts = [{"email": e, "token": t} for e, t in zip(emails, tokens)]
+            self.admin_token = await self._login(client, self.args.admin_email)
+
+        # Next weekend's evenings at a handful of saunas
+        saturday = date.today() + timedelta(days=(5 - date.today().weekday()) % 7 or 7)
+        self.hot_pairs = [
+            (sauna_id, (saturday + timedelta(days=rng.randrange(2))).isoformat())
+            for sauna_id in rng.sample(self.sauna_ids, min(self.args.hot_saunas, len(self.sauna_ids)))
+        ]
+
+
+async def run_stage(world: World, users: int, seconds: float, think: float) -> dict:
+    recorder = Recorder()
+    deadline = time.perf_counter() + seconds
+    vus = [VirtualUser(world, i, recorder) for i in range(users)]
+    await asyncio.gather(*(vu.run(deadline, think) for vu in vus))
+    recorder.elapsed = time.perf_counter() - recorder.started
+    return recorder.summary()
+
+
+def _print_stage(users: int, s: dict) -> None:
+    b = s["booking"]
+    print(
+        f"\n{users} users: {s['requests']} requests in {s['seconds']}s, {s['rps']} req/s; "
+        f"bookings {b.get('created', 0)} created, {b.get('conflict', 0)} conflicts "
+        f"({b['conflict_rate']:.1%}, hot {b['hot_conflict_rate']:.1%}), {b.get('sold_out', 0)} sold out"
+    )
+    print(f"  {'route':<30} {'req':>7} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+    for route, r in s["routes"].items():
+        print(
+            f"  {route:<30} {r['requests']:7d} {r['rps']:7.1f} {r['p50_ms']:8.1f} "
+            f"{r['p95_ms']:8.1f} {r['p99_ms']:8.1f} {r['errors']:6d}"
+        )
+
+
+async def load_test(args) -> dict:
+    world = World(args)
+    await world.prepare()
+    stages = {}
+    for users in (int(u) for u in args.users.split(",")):
+        if args.warmup_seconds:
+            await run_stage(world, users, args.warmup_seconds, args.think_ms / 1000)
+        stages[str(users)] = await run_stage(world, users, args.stage_seconds, args.think_ms / 1000)
+        _print_stage(users, stages[str(users)])
+    return stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a traffic mix against a running API server")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", default="10,50,100", help="Concurrent users per stage, comma separated")
+    parser.add_argument("--stage-seconds", type=float, default=30.0, help="Measured seconds per stage")
+    parser.add_argument("--warmup-seconds", type=float, default=5.0, help="Unmeasured seconds before each stage")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Mean pause between a user's actions")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Action weights, e.g. browse=50,book=10")
+    parser.add_argument("--hot-share", type=float, default=0.5, help="Share of bookings aimed at hot slots")
+    parser.add_argument("--hot-saunas", type=int, default=5, help="Saunas in the hot set")
+    parser.add_argument("--accounts", type=int, default=50, help="Distinct user accounts to log in")
+    parser.add_argument("--first-account", type=int, default=1000, help="First userN@example.com account")
+    parser.add_argument("--password", default="admin123", help="Password shared by synthetic users")
+    parser.add_argument("--admin-email", default="admin@sauna.fi")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/load-<commit>.json)")
+    args = parser.parse_args()
+
+    stages = asyncio.run(load_test(args))
+
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+    ).stdout.strip()
+    output = args.output or os.path.join(RESULTS_DIR, f"load-{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "commit": commit,
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "base_url": args.base_url,
+                "mix": args.mix,
+                "hot_share": args.hot_share,
+                "think_ms": args.think_ms,
+                "stages": stages,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nsaved {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Serialization CPU benchmark for list/detail endpoint payloads.
+
+Compares, per endpoint shape, the CPU time of:
+- response_model: build models field by field, then let FastAPI dump,
+  re-validate and jsonable_encode them before json.dumps
+- fast: validate ORM rows once (from_attributes) and dump JSON in pydantic-core
+
+Usage (from backend/):
+    python -m benchmarks.serialization --rows 500 --repeat 50
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+
+from app.api.responses import from_rows, get_adapter
+from app.models import Booking, OperatingHours, Review, Sauna, SaunaImage
+from app.schemas.booking import BookingResponse
+from app.schemas.review import ReviewResponse
+from app.schemas.sauna import SaunaDetailResponse, SaunaResponse
+
+
+def _make_sauna(i: int) -> Sauna:
+    sauna = Sauna(
+        id=f"sauna-{i}",
+        name=f"Sauna {i}",
+        description="Traditional wood-heated sauna with löyly. " * 4,
+        capacity=6,
+        hourly_rate=80000.0,
+        image_url=f"/images/sauna_{i}.jpg",
+        amenities='["Shower", "Towels", "Birch Whisks", "Changing Room"]',
+        is_active=True,
+        open_time="10:00",
+        close_time="22:00",
+        address="경기도 용인시 양지면 양지중로 123",
+        road_address="경기도 용인시 양지면 봉양로 45",
+        latitude=37.2401,
+        longitude=127.0742,
+        phone="031-234-5678",
+        sauna_type="traditional",
+        temperature_min=80,
+        temperature_max=100,
+    )
+    sauna.images = [
+        SaunaImage(
+            id=f"img-{i}-{n}",
+            image_url=f"/images/sauna_{i}_{n}.jpg",
+            display_order=n,
+            is_primary=n == 0,
+        )
+        for n in range(3)
+    ]
+    sauna.operating_hours = [
+        OperatingHours(
+            id=f"hours-{i}-{d}",
+            day_of_week=d,
+            open_time="10:00",
+            close_time="23:00",
+            is_closed=d == 0,
+        )
+        for d in range(7)
+    ]
+    return sauna
+
+
+def _make_booking(i: int) -> Booking:
+    return Booking(
+        id=f"booking-{i}",
+        sauna_id=f"sauna-{i % 20}",
+        user_id=f"user-{i % 100}",
+        booking_date="2026-10-19",
+        start_time="12:00",
+        end_time="14:00",
+        guest_count=2,
+        total_price=160000.0,
+        customer_name="홍길동",
+        customer_phone="010-1234-5678",
+        customer_email="guest@example.com",
+        notes=None,
+        status="confirmed",
+    )
+
+
+def _make_review(i: int) -> Review:
+    return Review(
+        id=f"review-{i}",
+        sauna_id="sauna-0",
+        user_id=f"user-{i % 100}",
+        booking_id=f"booking-{i}",
+        rating=i % 5 + 1,
+        comment="Great löyly, would come again.",
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def _response_model_path(response_type, models) -> bytes:
+    """Mimic FastAPI's response_model handling of returned models"""
+    adapter = get_adapter(response_type)
+    if isinstance(models, list):
+        content = [m.model_dump() for m in models]
+    else:
+        content = models.model_dump()
+    validated = adapter.validate_python(content)
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def _legacy_sauna(s: Sauna) -> SaunaResponse:
+    return SaunaResponse(**{f: getattr(s, f) for f in SaunaResponse.model_fields})
+
+
+def _legacy_detail(s: Sauna) -> SaunaDetailResponse:
+    fields = {
+        f: getattr(s, f)
+        for f in SaunaDetailResponse.model_fields
+        if f not in ("images", "operating_hours")
+    }
+    return SaunaDetailResponse(
+        **fields,
+        images=[
+            {
+                "id": img.id,
+                "image_url": img.image_url,
+                "display_order": img.display_order,
+                "is_primary": img.is_primary,
+            }
+            for img in s.images
+        ],
+        operating_hours=[
+            {
+                "id": h.id,
+                "day_of_week": h.day_of_week,
+                "open_time": h.open_time,
+                "close_time": h.close_time,
+                "is_closed": h.is_closed,
+            }
+            for h in s.operating_hours
+        ],
+    )
+
+
+def _legacy_booking(b: Booking) -> BookingResponse:
+    fields = {
+        f: getattr(b, f)
+        for f in BookingResponse.model_fields
+        if f not in ("sauna_name", "has_review")
+    }
+    return BookingResponse(**fields, sauna_name="Sauna", has_review=False)
+
+
+def _fast_booking(b: Booking) -> BookingResponse:
+    response = from_rows(BookingResponse, b)
+    response.sauna_name = "Sauna"
+    response.has_review = False
+    return response
+
+
+def _review(r: Review) -> ReviewResponse:
+    fields = {f: getattr(r, f) for f in ReviewResponse.model_fields if f != "user_name"}
+    return ReviewResponse(**fields, user_name="홍길동")
+
+
+def _cases(rows: int):
+    saunas = [_make_sauna(i) for i in range(rows)]
+    bookings = [_make_booking(i) for i in range(rows)]
+    reviews = [_make_review(i) for i in range(rows)]
+    detail = saunas[0]
+
+    list_saunas = list[SaunaResponse]
+    list_bookings = list[BookingResponse]
+    list_reviews = list[ReviewResponse]
+
+    return [
+        (
+            "list_saunas",
+            lambda: _response_model_path(
+                list_saunas, [_legacy_sauna(s) for s in saunas]
+            ),
+            lambda: get_adapter(list_saunas).dump_json(from_rows(list_saunas, saunas)),
+        ),
+        (
+            "get_sauna",
+            lambda: _response_model_path(SaunaDetailResponse, _legacy_detail(detail)),
+            lambda: get_adapter(SaunaDetailResponse).dump_json(
+                from_rows(SaunaDetailResponse, detail)
+            ),
+        ),
+        (
+            "list_bookings",
+            lambda: _response_model_path(
+                list_bookings, [_legacy_booking(b) for b in bookings]
+            ),
+            lambda: get_adapter(list_bookings).dump_json(
+                [_fast_booking(b) for b in bookings]
+            ),
+        ),
+        (
+            "list_reviews",
+            lambda: _response_model_path(list_reviews, [_review(r) for r in reviews]),
+            lambda: get_adapter(list_reviews).dump_json([_review(r) for r in reviews]),
+        ),
+    ]
+
+
+def _cpu_ms(fn, repeat: int) -> float:
+    fn()  # warm up adapters and caches
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"rows={args.rows} repeat={args.repeat} (CPU ms per call)")
+    print(f"{'endpoint':<16}{'response_model':>16}{'fast':>10}{'speedup':>10}")
+    for name, legacy, fast in _cases(args.rows):
+        legacy_ms = _cpu_ms(legacy, args.repeat)
+        fast_ms = _cpu_ms(fast, args.repeat)
+        print(f"{name:<16}{legacy_ms:>16.3f}{fast_ms:>10.3f}{legacy_ms / fast_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
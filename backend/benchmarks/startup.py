@@ -0,0 +1,143 @@
+"""
+Cold-start profiler for the API entry point.
+
+Starts a fresh interpreter with `-X importtime` and reports:
+- wall time to import the entry module, run the lifespan and serve the
+  first requests
+- import cost per top-level package (self time, so nothing is counted twice)
+- cumulative import cost of the app's own modules
+
+Usage (from backend/):
+    python -m benchmarks.startup --entry app.main --mode fast
+    python -m benchmarks.startup --entry mangum_handler --path /api/v1/saunas
+"""
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+
+async def _request(app, path: str) -> int:
+    """Send one GET through the ASGI app and return the status code"""
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [(b"host", b"localhost")],
+        "server": ("localhost", 80),
+        "client": ("127.0.0.1", 0),
+        "root_path": "",
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _serve(app, paths: list[str], timings: dict) -> None:
+    start = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        timings["lifespan startup"] = time.perf_counter() - start
+        for label in ("first", "second"):
+            for path in paths:
+                start = time.perf_counter()
+                status = await _request(app, path)
+                timings[f"{label} GET {path} ({status})"] = time.perf_counter() - start
+
+
+def child(entry: str, paths: list[str]) -> None:
+    """Runs inside the profiled interpreter; prints phase timings as JSON"""
+    timings = {}
+    start = time.perf_counter()
+    module = importlib.import_module(entry)
+    timings[f"import {entry}"] = time.perf_counter() - start
+
+    app = getattr(module, "app", None)
+    if app is None:
+        from app.main import app
+    asyncio.run(_serve(app, paths, timings))
+    print(json.dumps(timings))
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) for each -X importtime line"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def report(timings: dict, modules: list[tuple[str, int, int]], top: int) -> None:
+    print("Phases")
+    for phase, seconds in timings.items():
+        print(f"  {phase:<48} {seconds * 1000:9.1f} ms")
+
+    by_package = defaultdict(int)
+    for name, self_us, _ in modules:
+        by_package[name.split(".")[0]] += self_us
+    total = sum(by_package.values())
+    print(f"\nImport self time by package (total {total / 1000:.1f} ms)")
+    for package, self_us in sorted(by_package.items(), key=lambda i: -i[1])[:top]:
+        print(f"  {package:<48} {self_us / 1000:9.1f} ms {self_us / total:6.1%}")
+
+    app_modules = [m for m in modules if m[0] == "app" or m[0].startswith("app.")]
+    print("\nApp modules by cumulative import time (includes what they pull in)")
+    for name, _, cumulative_us in sorted(app_modules, key=lambda m: -m[2])[:top]:
+        print(f"  {name:<48} {cumulative_us / 1000:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile API cold-start cost")
+    parser.add_argument("--entry", default="app.main", help="Module to import (app.main, mangum_handler)")
+    parser.add_argument("--mode", default="fast", choices=["fast", "full"], help="STARTUP_MODE for the run")
+    parser.add_argument("--path", action="append", help="Request path to time after startup (repeatable)")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    paths = args.path or ["/health"]
+
+    if args.child:
+        child(args.entry, paths)
+        return
+
+    command = [sys.executable, "-X", "importtime", "-m", "benchmarks.startup", "--child", "--entry", args.entry]
+    for path in paths:
+        command += ["--path", path]
+    result = subprocess.run(
+        command,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "STARTUP_MODE": args.mode},
+    )
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+
+    print(f"entry={args.entry} STARTUP_MODE={args.mode}\n")
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    report(timings, parse_importtime(result.stderr), args.top)
+
+
+if __name__ == "__main__":
+    main()
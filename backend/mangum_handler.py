@@ -1,4 +1,56 @@
+import asyncio
+
 from mangum import Mangum
 from app.main import app
 
-handler = Mangum(app, lifespan="off")
+# Built once per Lambda instance; warm invocations reuse the app, the
+# database engine and its pooled connections. The lifespan (schema and seed
+# work) is skipped entirely here; app.main's handler honours STARTUP_MODE.
+http_handler = Mangum(app, lifespan="off")
+
+# Seconds left for the response after a time-limited scheduled task
+_JOB_DRAIN_MARGIN = 5.0
+
+
+async def _drain_jobs(context) -> dict:
+    from app.core.jobs import JobRunner
+
+    budget = context.get_remaining_time_in_millis() / 1000 - _JOB_DRAIN_MARGIN
+    runner = JobRunner()
+    processed = await runner.drain(budget)
+    # Each purge is one indexed DELETE, cheap enough for every scheduled run
+    await runner.housekeeping()
+    return {"processed": processed}
+
+
+async def _sweep_bookings(context) -> dict:
+    from app.services.booking_status import sweep
+
+    return {"completed": await sweep()}
+
+
+async def _archive_bookings(context) -> dict:
+    from app.services.booking_archive import run_archival
+
+    budget = context.get_remaining_time_in_millis() / 1000 - _JOB_DRAIN_MARGIN
+    return {"archived": await run_archival(max_seconds=budget)}
+
+
+# EventBridge schedules invoke the function with {"task": <name>}
+_SCHEDULED_TASKS = {
+    "jobs": _drain_jobs,
+    "sweep_bookings": _sweep_bookings,
+    "archive_bookings": _archive_bookings,
+}
+
+
+def handler(event, context):
+    """
+    API Gateway requests go to the app; scheduled invocations run a task
+    (the lifespan job runner never starts here).
+    """
+    task = _SCHEDULED_TASKS.get(event.get("task"))
+    if task is not None:
+        # Mangum runs requests on this same loop, so pooled connections stay usable
+        return asyncio.get_event_loop().run_until_complete(task(context))
+    return http_handler(event, context)
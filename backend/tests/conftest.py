@@ -0,0 +1,75 @@
+import os
+import tempfile
+
+# Settings are read at import time, so point them at a throwaway database first
+_db_dir = tempfile.mkdtemp(prefix="sauna-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/test.db"
+os.environ["DATABASE_READ_URL"] = ""
+os.environ["STARTUP_MODE"] = "fast"
+os.environ["JOB_RUNNER_IN_APP"] = "false"
+os.environ["DASHBOARD_CACHE_TTL"] = "0"
+os.environ["SLOW_QUERY_MS"] = "100000"
+os.environ["STORAGE_LOCAL_DIR"] = f"{_db_dir}/media"
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from app.core.database import Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.seed import ADMIN_EMAIL, ADMIN_PASSWORD, seed_data  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def seeded():
+    """Fresh schema with the demo saunas and admin account"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await seed_data()
+    yield
+    # Pooled connections belong to this test's event loop
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(seeded):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def admin_headers(client):
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+async def sauna_id(client):
+    response = await client.get("/api/v1/saunas")
+    return response.json()[0]["id"]
+
+
+@pytest.fixture
+def booking_payload(sauna_id):
+    """Build a BookingCreate body for the first demo sauna"""
+    def build(booking_date: str, start: str = "10:00", end: str = "12:00") -> dict:
+        return {
+            "sauna_id": sauna_id,
+            "booking_date": booking_date,
+            "start_time": start,
+            "end_time": end,
+            "guest_count": 2,
+            "customer_name": "테스트",
+            "customer_phone": "010-1234-5678",
+            "customer_email": "test@example.com",
+        }
+
+    return build
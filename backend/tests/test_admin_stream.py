@@ -0,0 +1,50 @@
+import pytest
+from fastapi import HTTPException
+
+from app.api.deps import require_admin_event_stream
+from app.core.config import settings
+from app.core.database import async_session
+
+pytestmark = pytest.mark.anyio
+
+
+async def _stream_token(client, admin_headers) -> str:
+    response = await client.post("/api/v1/admin/stream-token", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["expires_in"] == settings.STREAM_TOKEN_SECONDS
+    return response.json()["token"]
+
+
+async def test_stream_token_opens_the_stream_only(client, admin_headers):
+    token = await _stream_token(client, admin_headers)
+
+    async with async_session() as db:
+        admin = await require_admin_event_stream(token=token, db=db)
+    assert admin.is_admin
+
+    response = await client.get(
+        "/api/v1/admin/stats", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 401
+
+
+async def test_stream_rejects_access_tokens(client, admin_headers):
+    access_token = admin_headers["Authorization"].removeprefix("Bearer ")
+
+    response = await client.get(f"/api/v1/admin/stream?token={access_token}")
+    assert response.status_code == 401
+    response = await client.get(f"/api/v1/admin/stream?access_token={access_token}")
+    assert response.status_code == 401
+    response = await client.get("/api/v1/admin/stream", headers=admin_headers)
+    assert response.status_code == 401
+
+    async with async_session() as db:
+        with pytest.raises(HTTPException):
+            await require_admin_event_stream(token=access_token, db=db)
+
+
+async def test_stream_disabled(client, admin_headers, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_STREAM_ENABLED", False)
+
+    response = await client.post("/api/v1/admin/stream-token", headers=admin_headers)
+    assert response.status_code == 404
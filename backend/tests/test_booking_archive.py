@@ -0,0 +1,82 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.api.v1.endpoints.admin import _dashboard_stats
+from app.core.database import async_session
+from app.models import Booking
+from app.models.booking_archive import BookingArchive
+from app.services.booking_archive import archive_bookings, find_booking
+from app.services.booking_status import complete_finished_bookings
+
+pytestmark = pytest.mark.anyio
+
+
+async def _book_past_bookings(client, admin_headers, booking_payload) -> dict[str, str]:
+    """A completed and a cancelled booking from ten days ago; returns ids by status"""
+    past = (date.today() - timedelta(days=10)).isoformat()
+    ids = {}
+    for start, end in (("10:00", "12:00"), ("13:00", "15:00")):
+        response = await client.post(
+            "/api/v1/bookings", json=booking_payload(past, start, end), headers=admin_headers
+        )
+        ids.setdefault("completed", response.json()["id"])
+    ids["cancelled"] = response.json()["id"]
+    await client.patch(f"/api/v1/bookings/{ids['cancelled']}/cancel", headers=admin_headers)
+    async with async_session() as db:
+        await complete_finished_bookings(db)
+    return ids
+
+
+async def _archive(before_days: int = 5) -> int:
+    async with async_session() as db:
+        return await archive_bookings(
+            db, (date.today() - timedelta(days=before_days)).isoformat()
+        )
+
+
+async def test_archived_bookings_stay_reachable(client, admin_headers, booking_payload):
+    ids = await _book_past_bookings(client, admin_headers, booking_payload)
+    assert await _archive() >= 2
+
+    async with async_session() as db:
+        assert not (
+            await db.execute(select(func.count()).where(Booking.id.in_(ids.values())))
+        ).scalar()
+        for booking_id in ids.values():
+            assert isinstance(await find_booking(db, booking_id), BookingArchive)
+
+    for status, booking_id in ids.items():
+        response = await client.get(f"/api/v1/bookings/{booking_id}")
+        assert response.status_code == 200
+        assert response.json()["status"] == status
+
+    response = await client.get("/api/v1/bookings/my", headers=admin_headers)
+    assert set(ids.values()) <= {b["id"] for b in response.json()}
+    response = await client.get("/api/v1/bookings/my?status=completed", headers=admin_headers)
+    assert ids["completed"] in {b["id"] for b in response.json()}
+    assert ids["cancelled"] not in {b["id"] for b in response.json()}
+
+
+async def test_dashboard_stats_unchanged_by_archival(client, admin_headers, booking_payload):
+    await _book_past_bookings(client, admin_headers, booking_payload)
+    today = date.today().isoformat()
+    async with async_session() as db:
+        before = await _dashboard_stats(db, today)
+
+    assert await _archive() >= 2
+    # A customer with bookings in both tables is still counted once
+    response = await client.post(
+        "/api/v1/bookings",
+        json=booking_payload((date.today() + timedelta(days=2)).isoformat()),
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+    async with async_session() as db:
+        after = await _dashboard_stats(db, today)
+
+    assert after.total_customers == before.total_customers
+    assert after.total_bookings == before.total_bookings + 1
+    assert after.cancelled_bookings == before.cancelled_bookings
+    assert after.total_revenue == before.total_revenue + response.json()["total_price"]
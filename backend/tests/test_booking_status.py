@@ -0,0 +1,61 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import select
+
+from app.core.database import async_session
+from app.core.jobs import JobRunner
+from app.models import Booking
+from app.services.booking_status import complete_finished_bookings
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_sweeper_completes_only_finished_bookings(client, admin_headers, booking_payload):
+    today = date.today()
+    cases = {
+        "yesterday": booking_payload((today - timedelta(days=1)).isoformat()),
+        "ended": booking_payload(today.isoformat(), "10:00", "12:00"),
+        "running": booking_payload(today.isoformat(), "13:00", "15:00"),
+        "tomorrow": booking_payload((today + timedelta(days=1)).isoformat()),
+    }
+    ids = {}
+    for name, payload in cases.items():
+        response = await client.post("/api/v1/bookings", json=payload, headers=admin_headers)
+        ids[response.json()["id"]] = name
+
+    now = datetime.combine(today, datetime.min.time(), ZoneInfo("Asia/Seoul")).replace(hour=14)
+    async with async_session() as db:
+        assert await complete_finished_bookings(db, now) == 2
+        rows = (await db.execute(select(Booking.id, Booking.status))).all()
+
+    assert {ids[booking_id]: status for booking_id, status in rows} == {
+        "yesterday": "completed",
+        "ended": "completed",
+        "running": "confirmed",
+        "tomorrow": "confirmed",
+    }
+
+
+async def test_job_runner_sweeps_so_reviews_open_up(client, admin_headers, booking_payload, sauna_id):
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    booking = (
+        await client.post("/api/v1/bookings", json=booking_payload(yesterday), headers=admin_headers)
+    ).json()
+    review = {"sauna_id": sauna_id, "booking_id": booking["id"], "rating": 5}
+    response = await client.post("/api/v1/reviews", json=review, headers=admin_headers)
+    assert response.status_code == 400
+
+    runner = JobRunner()
+    runner.start()
+    for _ in range(50):  # the first poll sweeps
+        await asyncio.sleep(0.05)
+        async with async_session() as db:
+            if (await db.get(Booking, booking["id"])).status == "completed":
+                break
+    await runner.stop()
+
+    response = await client.post("/api/v1/reviews", json=review, headers=admin_headers)
+    assert response.status_code == 200
@@ -0,0 +1,24 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.services.occupancy import to_minutes_array
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [("9:00", "11:00"), ("10:00", "12:5"), ("25:00", "26:00"), ("10:60", "12:00")],
+)
+async def test_create_booking_rejects_malformed_times(
+    client, admin_headers, booking_payload, start, end
+):
+    payload = booking_payload((date.today() + timedelta(days=1)).isoformat(), start, end)
+    response = await client.post("/api/v1/bookings", json=payload, headers=admin_headers)
+    assert response.status_code == 422
+
+
+def test_to_minutes_array_pads_short_times():
+    assert to_minutes_array(["9:00", "10:30", "00:05", "24:00"]).tolist() == [540, 630, 5, 1440]
+    assert to_minutes_array([timedelta(hours=9, minutes=15)]).tolist() == [555]
@@ -0,0 +1,23 @@
+import pytest
+
+from app.core.cache import TTLCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_failed_compute_leaves_no_lock_or_entry():
+    cache = TTLCache(ttl=60)
+
+    async def failing():
+        raise RuntimeError("database unavailable")
+
+    async def working():
+        return 42
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute(("occupancy", "2026-01-01"), failing)
+    assert not cache._locks
+    assert cache.get(("occupancy", "2026-01-01")) is None
+
+    assert await cache.get_or_compute(("occupancy", "2026-01-01"), working) == 42
+    assert not cache._locks
@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.database import async_session
+from app.core.jobs import JobRunner
+from app.models import Booking, IdempotencyKey
+from app.services.idempotency import REPLAYED_HEADER
+
+pytestmark = pytest.mark.anyio
+
+DAY = (date.today() + timedelta(days=5)).isoformat()
+
+
+async def _count(model) -> int:
+    async with async_session() as db:
+        return (await db.execute(select(func.count()).select_from(model))).scalar()
+
+
+async def test_retry_replays_first_response(client, admin_headers, booking_payload):
+    headers = {**admin_headers, "Idempotency-Key": "replay-1"}
+    first = await client.post("/api/v1/bookings", json=booking_payload(DAY), headers=headers)
+    second = await client.post("/api/v1/bookings", json=booking_payload(DAY), headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.headers[REPLAYED_HEADER] == "true"
+    assert second.json() == first.json()
+    assert await _count(Booking) == 1
+
+
+async def test_key_reused_with_different_body_is_rejected(client, admin_headers, booking_payload):
+    headers = {**admin_headers, "Idempotency-Key": "mismatch-1"}
+    first = await client.post("/api/v1/bookings", json=booking_payload(DAY), headers=headers)
+    other = await client.post(
+        "/api/v1/bookings", json=booking_payload(DAY, "14:00", "16:00"), headers=headers
+    )
+
+    assert first.status_code == 200
+    assert other.status_code == 422
+    assert await _count(Booking) == 1
+
+
+async def test_guests_reusing_a_key_do_not_collide(client, booking_payload):
+    headers = {"Idempotency-Key": "guest-1"}
+    first_guest = booking_payload(DAY)
+    second_guest = {
+        **booking_payload(DAY, "14:00", "16:00"),
+        "customer_name": "다른 손님",
+        "customer_email": "other@example.com",
+    }
+
+    first = await client.post("/api/v1/bookings", json=first_guest, headers=headers)
+    second = await client.post("/api/v1/bookings", json=second_guest, headers=headers)
+    retry = await client.post("/api/v1/bookings", json=first_guest, headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert REPLAYED_HEADER not in second.headers
+    assert second.json()["id"] != first.json()["id"]
+    assert second.json()["customer_email"] == "other@example.com"
+    assert retry.headers[REPLAYED_HEADER] == "true"
+    assert retry.json() == first.json()
+    assert await _count(Booking) == 2
+
+
+async def test_key_is_released_when_booking_conflicts(client, admin_headers, booking_payload):
+    blocking = await client.post("/api/v1/bookings", json=booking_payload(DAY), headers=admin_headers)
+    headers = {**admin_headers, "Idempotency-Key": "conflict-1"}
+
+    conflict = await client.post("/api/v1/bookings", json=booking_payload(DAY), headers=headers)
+    assert conflict.status_code == 409
+    assert await _count(IdempotencyKey) == 0
+
+    # The failed attempt is not replayed; once the slot frees up the same key books it
+    await client.patch(f"/api/v1/bookings/{blocking.json()['id']}/cancel", headers=admin_headers)
+    retry = await client.post("/api/v1/bookings", json=booking_payload(DAY), headers=headers)
+    assert retry.status_code == 200
+    assert REPLAYED_HEADER not in retry.headers
+
+
+async def test_housekeeping_purges_expired_keys(client, admin_headers, booking_payload, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "IDEMPOTENCY_TTL_HOURS", 0)
+    headers = {**admin_headers, "Idempotency-Key": "expired-1"}
+    await client.post("/api/v1/bookings", json=booking_payload(DAY), headers=headers)
+    assert await _count(IdempotencyKey) == 1
+
+    await JobRunner().housekeeping()
+    assert await _count(IdempotencyKey) == 0
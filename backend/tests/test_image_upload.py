@@ -0,0 +1,85 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from sqlalchemy.exc import OperationalError
+
+from app.api.v1.endpoints import saunas
+from app.services.images import process_image_upload
+from app.services.storage import LocalStorage, Storage
+
+pytestmark = pytest.mark.anyio
+
+
+def _png(width: int, height: int) -> bytes:
+    out = BytesIO()
+    Image.new("RGB", (width, height), "white").save(out, "PNG")
+    return out.getvalue()
+
+
+class RecordingStorage(LocalStorage):
+    def __init__(self, root):
+        super().__init__(str(root), "/media")
+        self.saved, self.deleted = [], []
+        self.content_types = {}
+
+    async def save(self, key, data, content_type):
+        self.saved.append(key)
+        self.content_types[key] = content_type
+        return await super().save(key, data, content_type)
+
+    async def delete(self, key):
+        self.deleted.append(key)
+        await super().delete(key)
+
+
+def _rotated_png(width: int, height: int) -> bytes:
+    """PNG whose EXIF orientation (6) says to rotate it a quarter turn"""
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    out = BytesIO()
+    Image.new("RGB", (width, height), "white").save(out, "PNG", exif=exif)
+    return out.getvalue()
+
+
+def test_storage_is_abstract():
+    with pytest.raises(TypeError):
+        Storage()
+
+
+async def test_decompression_bomb_is_rejected(client, admin_headers, sauna_id, monkeypatch):
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)
+    response = await client.post(
+        f"/api/v1/saunas/{sauna_id}/images/upload",
+        files={"file": ("big.png", _png(64, 64), "image/png")},
+        headers=admin_headers,
+    )
+    assert response.status_code == 400
+
+
+async def test_failed_commit_removes_stored_files(client, admin_headers, sauna_id, monkeypatch, tmp_path):
+    storage = RecordingStorage(tmp_path)
+    monkeypatch.setattr(saunas, "get_storage", lambda: storage)
+
+    async def failing_add_image(*args, **kwargs):
+        raise OperationalError("INSERT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(saunas, "_add_image", failing_add_image)
+    with pytest.raises(OperationalError):
+        await client.post(
+            f"/api/v1/saunas/{sauna_id}/images/upload",
+            files={"file": ("photo.png", _png(400, 300), "image/png")},
+            headers=admin_headers,
+        )
+    assert storage.saved and sorted(storage.deleted) == sorted(storage.saved)
+    assert not any(tmp_path.rglob("*.*"))
+
+
+async def test_rotated_png_keeps_its_format(tmp_path):
+    storage = RecordingStorage(tmp_path)
+    variants = await process_image_upload(_rotated_png(400, 300), "test", storage)
+
+    original = next(v for v in variants if v.name == "original")
+    assert (original.format, original.width, original.height) == ("png", 300, 400)
+    assert original.storage_key.endswith("/original.png")
+    assert storage.content_types[original.storage_key] == "image/png"
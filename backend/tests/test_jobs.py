@@ -0,0 +1,65 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from app.core.database import async_session
+from app.core.jobs import JobRunner, enqueue, retry_failed_jobs
+from app.models import Booking, BookingDailyStat, Job
+from app.services.booking_stats import rebuild_booking_daily_stats
+
+pytestmark = pytest.mark.anyio
+
+
+async def _rollup_bookings(day: str) -> int:
+    async with async_session() as db:
+        result = await db.execute(
+            select(func.sum(BookingDailyStat.booking_count)).where(BookingDailyStat.stat_date == day)
+        )
+        return result.scalar() or 0
+
+
+async def test_booking_changes_reach_rollup_through_jobs(client, admin_headers, booking_payload):
+    day = (date.today() + timedelta(days=3)).isoformat()
+    response = await client.post("/api/v1/bookings", json=booking_payload(day), headers=admin_headers)
+    assert response.status_code == 200
+    assert await _rollup_bookings(day) == 0
+
+    assert await JobRunner().drain(max_seconds=10) == 1
+    assert await _rollup_bookings(day) == 1
+
+
+async def test_rebuild_supersedes_queued_rollup_jobs(client, admin_headers, booking_payload):
+    day = (date.today() + timedelta(days=3)).isoformat()
+    for start, end in (("10:00", "12:00"), ("14:00", "16:00")):
+        response = await client.post(
+            "/api/v1/bookings", json=booking_payload(day, start, end), headers=admin_headers
+        )
+        assert response.status_code == 200
+
+    # One booking disappears before its queued rollup job runs
+    async with async_session() as db:
+        await db.execute(delete(Booking).where(Booking.start_time == "14:00"))
+        await db.commit()
+        await rebuild_booking_daily_stats(db, start_date=day)
+
+    await JobRunner().drain(max_seconds=10)
+    assert await _rollup_bookings(day) == 1
+
+
+async def test_failed_jobs_are_kept_and_can_be_retried(seeded):
+    async with async_session() as db:
+        await enqueue(db, "tests.unknown", {})
+        await db.commit()
+    runner = JobRunner()
+    await runner.run_once()
+    await runner.purge_finished()
+
+    async with async_session() as db:
+        job = (await db.execute(select(Job))).scalar_one()
+        assert job.status == "failed"
+        assert "No handler" in job.last_error
+
+        assert await retry_failed_jobs(db, "tests.unknown") == 1
+        job = (await db.execute(select(Job).execution_options(populate_existing=True))).scalar_one()
+        assert (job.status, job.attempts) == ("queued", 0)
@@ -0,0 +1,89 @@
+"""
+Query-count budgets for the hot endpoints.
+
+A failure lists every statement the request ran; an N+1 regression shows
+up as the same shape repeated per row. Raise a budget only together with
+the change that needs the extra statement.
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.database import async_session
+from app.core.sql_instrumentation import assert_max_queries
+from app.services.booking_status import complete_finished_bookings
+
+pytestmark = pytest.mark.anyio
+
+PAST_DAYS = [(date.today() - timedelta(days=d)).isoformat() for d in (3, 4, 5)]
+FUTURE_DAY = (date.today() + timedelta(days=2)).isoformat()
+
+
+@pytest.fixture
+async def activity(client, admin_headers, booking_payload, sauna_id):
+    """Several bookings and reviews, so per-row queries would multiply"""
+    booking_ids = []
+    for day in [*PAST_DAYS, FUTURE_DAY]:
+        response = await client.post("/api/v1/bookings", json=booking_payload(day), headers=admin_headers)
+        booking_ids.append(response.json()["id"])
+    async with async_session() as db:
+        await complete_finished_bookings(db)
+    for booking_id in booking_ids[:3]:
+        response = await client.post(
+            "/api/v1/reviews",
+            json={"sauna_id": sauna_id, "booking_id": booking_id, "rating": 5, "comment": "좋아요"},
+            headers=admin_headers,
+        )
+        assert response.status_code == 200
+    return booking_ids
+
+
+@pytest.mark.parametrize(
+    "params, budget",
+    [
+        ({}, 1),
+        ({"limit": 2, "offset": 1}, 2),  # total count + page
+        ({"limit": 10, "include_facets": "true"}, 2),  # facet counts + page
+    ],
+    ids=["all", "page", "facets"],
+)
+async def test_list_saunas(client, activity, params, budget):
+    with assert_max_queries(budget):
+        response = await client.get("/api/v1/saunas", params=params)
+    assert response.status_code == 200
+
+
+async def test_get_sauna(client, activity, sauna_id):
+    # Sauna, then one selectin load each for images, hours and image variants
+    with assert_max_queries(4):
+        response = await client.get(f"/api/v1/saunas/{sauna_id}")
+    assert response.status_code == 200
+
+
+async def test_availability(client, activity, sauna_id):
+    with assert_max_queries(2):
+        response = await client.get(
+            "/api/v1/bookings/availability", params={"sauna_id": sauna_id, "date": FUTURE_DAY}
+        )
+    assert response.status_code == 200
+
+
+async def test_list_reviews(client, activity, sauna_id):
+    with assert_max_queries(1):
+        response = await client.get("/api/v1/reviews", params={"sauna_id": sauna_id})
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 3
+
+
+async def test_my_bookings(client, activity, admin_headers):
+    # User, hot and archived bookings, then sauna names and reviews for all rows at once
+    with assert_max_queries(5):
+        response = await client.get("/api/v1/bookings/my", headers=admin_headers)
+    assert len(response.json()) == 4
+
+
+async def test_dashboard_stats(client, activity, admin_headers):
+    # User, archive version, sauna aggregates, one booking counter scan
+    with assert_max_queries(4):
+        response = await client.get("/api/v1/admin/stats", headers=admin_headers)
+    assert response.status_code == 200
@@ -0,0 +1,40 @@
+import time
+from datetime import date, timedelta
+
+import pytest
+from starlette.requests import Request
+
+from app.api.deps import _reads_pinned
+from app.core.middleware import READ_PRIMARY_COOKIE
+from app.core.security import sign_value
+
+pytestmark = pytest.mark.anyio
+
+
+def _request(cookie: str) -> Request:
+    header = f"{READ_PRIMARY_COOKIE}={cookie}".encode()
+    return Request({"type": "http", "headers": [(b"cookie", header)]})
+
+
+async def test_write_sets_a_signed_cookie(client, admin_headers, booking_payload):
+    payload = booking_payload((date.today() + timedelta(days=3)).isoformat())
+    response = await client.post("/api/v1/bookings", json=payload, headers=admin_headers)
+    assert response.status_code == 200
+
+    cookie = response.cookies[READ_PRIMARY_COOKIE]
+    assert _reads_pinned(_request(cookie))
+
+
+def test_forged_or_expired_cookies_are_ignored():
+    later = str(int(time.time()) + 3600)
+    assert _reads_pinned(_request(sign_value(later)))
+    assert not _reads_pinned(_request(later))
+    assert not _reads_pinned(_request(f"{later}.{'0' * 64}"))
+    assert not _reads_pinned(_request(sign_value(str(int(time.time()) - 1))))
+    assert not _reads_pinned(_request(sign_value("soon")))
+
+
+async def test_db_pool_reports_each_engines_mode(client, admin_headers):
+    response = await client.get("/api/v1/admin/db-pool", headers=admin_headers)
+    assert response.status_code == 200
+    assert [(row["role"], row["mode"]) for row in response.json()] == [("writer", "sqlite")]
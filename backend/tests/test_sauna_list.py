@@ -0,0 +1,33 @@
+import pytest
+
+from app.api.v1.endpoints import saunas
+
+pytestmark = pytest.mark.anyio
+
+
+async def _names(client, **params) -> list[str]:
+    response = await client.get("/api/v1/saunas", params=params)
+    return [s["name"] for s in response.json()]
+
+
+async def test_offset_alone_returns_a_page(client):
+    everything = await _names(client)
+
+    response = await client.get("/api/v1/saunas", params={"offset": 1})
+    page = response.json()
+    assert page["offset"] == 1
+    assert page["limit"] == saunas.DEFAULT_PAGE_LIMIT
+    assert page["total"] == len(everything)
+    assert [s["name"] for s in page["items"]] == everything[1:]
+
+
+async def test_facets_without_limit_return_one_page(client, monkeypatch):
+    monkeypatch.setattr(saunas, "DEFAULT_PAGE_LIMIT", 2)
+    everything = await _names(client)
+
+    response = await client.get("/api/v1/saunas", params={"include_facets": "true"})
+    page = response.json()
+    assert page["limit"] == 2
+    assert [s["name"] for s in page["items"]] == everything[:2]
+    assert page["total"] == len(everything) > 2
+    assert sum(f["count"] for f in page["facets"]["sauna_type"]) == len(everything)
@@ -1,21 +1,28 @@
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery, useQuery } from "@tanstack/react-query";
 import { Star, User } from "lucide-react";
 import { fetchReviews, fetchReviewSummary } from "../../services/api";
-import { Review, ReviewSummary } from "../../types";
+import { ReviewPage, ReviewSummary } from "../../types";
 
 interface ReviewListProps {
   saunaId: string;
 }
 
 export default function ReviewList({ saunaId }: ReviewListProps) {
+  // 리뷰는 커서 기반 페이지 단위로 불러옴
   const {
-    data: reviews,
+    data: reviewPages,
     isLoading: reviewsLoading,
     error: reviewsError,
-  } = useQuery<Review[]>({
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
     queryKey: ["reviews", saunaId],
-    queryFn: () => fetchReviews(saunaId),
+    queryFn: ({ pageParam }) => fetchReviews(saunaId, pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage: ReviewPage) => lastPage.next_cursor,
   });
+  const reviews = reviewPages?.pages.flatMap((page) => page.items);
 
   const {
     data: summary,
@@ -190,6 +197,19 @@ export default function ReviewList({ saunaId }: ReviewListProps) {
               </div>
             ))}
           </div>
+
+          {/* 더 보기 */}
+          {hasNextPage && (
+            <div className="mt-6 text-center">
+              <button
+                onClick={() => fetchNextPage()}
+                disabled={isFetchingNextPage}
+                className="px-6 py-2 border border-stone-300 rounded-lg text-stone-700 hover:bg-stone-50 disabled:opacity-50"
+              >
+                {isFetchingNextPage ? "불러오는 중..." : "리뷰 더 보기"}
+              </button>
+            </div>
+          )}
         </>
       ) : (
         /* 리뷰 없음 */
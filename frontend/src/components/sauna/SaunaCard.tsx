@@ -20,9 +20,10 @@ export default function SaunaCard({ sauna }: { sauna: Sauna }) {
       className="bg-white rounded-2xl shadow-md overflow-hidden hover:shadow-xl transition group cursor-pointer"
     >
       <div className="h-48 bg-gradient-to-br from-orange-300 to-amber-500 relative overflow-hidden">
-        {sauna.image_url ? (
+        {sauna.thumbnail_url || sauna.image_url ? (
           <img
-            src={sauna.image_url}
+            src={sauna.thumbnail_url || sauna.image_url || undefined}
+            loading="lazy"
             alt={sauna.name}
             className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-300"
           />
@@ -11,19 +11,24 @@ import {
   Users,
   Building2,
 } from "lucide-react";
-import { useQuery } from "@tanstack/react-query";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
 import { api } from "../services/api";
 import { useAuth } from "../hooks/useAuth";
-import { Booking, Sauna } from "../types";
+import { Booking, DashboardStats, RecentBooking, Sauna } from "../types";
 import {
   fetchDashboardStats,
   fetchRevenueByDate,
   fetchBookingsBySauna,
   fetchRecentBookings,
+  openDashboardStream,
 } from "../services/api";
 
 type TabType = "dashboard" | "bookings";
 
+// Dashboard polling interval when the live stream is unavailable
+const POLL_INTERVAL_MS = 30_000;
+const BOOKING_EVENTS = ["booking.created", "booking.cancelled", "booking.updated"];
+
 export default function AdminPage() {
   const { user, isAdmin } = useAuth();
   const navigate = useNavigate();
@@ -36,6 +41,8 @@ export default function AdminPage() {
   const [filterDate, setFilterDate] = useState("");
   const [filterSauna, setFilterSauna] = useState("");
   const [filterStatus, setFilterStatus] = useState("");
+  const [live, setLive] = useState(false);
+  const queryClient = useQueryClient();
 
   useEffect(() => {
     if (!isAdmin) {
@@ -46,29 +53,99 @@ export default function AdminPage() {
     loadBookings();
   }, [isAdmin, navigate]);
 
+  // 실시간 스트림: 연결되면 이벤트로 갱신하고, 안 되면 폴링으로 대체
+  useEffect(() => {
+    if (!isAdmin || activeTab !== "dashboard") return;
+    let source: EventSource | null = null;
+    let cancelled = false;
+
+    const applyDelta = (delta: Partial<DashboardStats>) => {
+      queryClient.setQueryData<DashboardStats>(["dashboardStats"], (prev) => {
+        if (!prev) return prev;
+        const next = { ...prev };
+        for (const [key, value] of Object.entries(delta)) {
+          const field = key as keyof DashboardStats;
+          next[field] = next[field] + (value ?? 0);
+        }
+        return next;
+      });
+    };
+
+    openDashboardStream().then((stream) => {
+      if (cancelled) {
+        stream?.close();
+        return;
+      }
+      if (!stream) return;
+      source = stream;
+      source.addEventListener("snapshot", (e) => {
+        queryClient.setQueryData(
+          ["dashboardStats"],
+          JSON.parse((e as MessageEvent).data)
+        );
+        setLive(true);
+      });
+      for (const type of BOOKING_EVENTS) {
+        source.addEventListener(type, (e) => {
+          const data = JSON.parse((e as MessageEvent).data);
+          applyDelta(data.stats_delta);
+          queryClient.setQueryData<RecentBooking[]>(["recentBookings"], (prev) =>
+            prev
+              ? [data.booking, ...prev.filter((b) => b.id !== data.booking.id)].slice(
+                  0,
+                  5
+                )
+              : prev
+          );
+        });
+      }
+      source.addEventListener("bookings.completed", (e) => {
+        applyDelta(JSON.parse((e as MessageEvent).data).stats_delta);
+      });
+      // The token is only good for opening the stream, so reconnects would
+      // fail; close and poll instead
+      source.onerror = () => {
+        source?.close();
+        setLive(false);
+      };
+    });
+
+    return () => {
+      cancelled = true;
+      source?.close();
+      setLive(false);
+    };
+  }, [isAdmin, activeTab, queryClient]);
+
+  const pollInterval = live ? false : POLL_INTERVAL_MS;
+
   // 대시보드 데이터 쿼리
   const { data: stats, refetch: refetchStats } = useQuery({
     queryKey: ["dashboardStats"],
     queryFn: fetchDashboardStats,
     enabled: isAdmin && activeTab === "dashboard",
+    refetchInterval: pollInterval,
   });
 
   const { data: revenueData, refetch: refetchRevenue } = useQuery({
     queryKey: ["revenueByDate"],
     queryFn: () => fetchRevenueByDate(7),
     enabled: isAdmin && activeTab === "dashboard",
+    refetchInterval: POLL_INTERVAL_MS,
   });
 
   const { data: saunaStats, refetch: refetchSaunaStats } = useQuery({
     queryKey: ["bookingsBySauna"],
     queryFn: fetchBookingsBySauna,
     enabled: isAdmin && activeTab === "dashboard",
+    refetchInterval: POLL_INTERVAL_MS,
   });
 
   const { data: recentBookings, refetch: refetchRecentBookings } = useQuery({
     queryKey: ["recentBookings"],
     queryFn: () => fetchRecentBookings(5),
     enabled: isAdmin && activeTab === "dashboard",
+    refetchInterval: pollInterval,
   });
 
   const loadBookings = async () => {
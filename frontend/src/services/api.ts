@@ -44,6 +44,7 @@ import {
   Booking,
   Review,
   ReviewCreate,
+  ReviewPage,
   ReviewSummary,
   DashboardStats,
   RevenueByDate,
@@ -70,8 +71,13 @@ export async function cancelBooking(bookingId: string): Promise<Booking> {
 }
 
 // 리뷰 관련
-export async function fetchReviews(saunaId: string): Promise<Review[]> {
-  return api.get<Review[]>(`/reviews?sauna_id=${saunaId}`);
+export async function fetchReviews(
+  saunaId: string,
+  cursor?: string | null
+): Promise<ReviewPage> {
+  const params = new URLSearchParams({ sauna_id: saunaId });
+  if (cursor) params.set("cursor", cursor);
+  return api.get<ReviewPage>(`/reviews?${params}`);
 }
 
 export async function fetchReviewSummary(saunaId: string): Promise<ReviewSummary> {
@@ -102,3 +108,20 @@ export async function fetchBookingsBySauna(): Promise<BookingsBySauna[]> {
 export async function fetchRecentBookings(limit: number = 5): Promise<RecentBooking[]> {
   return api.get<RecentBooking[]>(`/admin/recent-bookings?limit=${limit}`);
 }
+
+// Live dashboard updates. The stream needs a short-lived token in the URL
+// (EventSource cannot send headers); resolves null when the server has the
+// stream disabled, e.g. on Lambda, so the caller keeps polling.
+export async function openDashboardStream(): Promise<EventSource | null> {
+  try {
+    const { token } = await api.post<{ token: string; expires_in: number }>(
+      "/admin/stream-token",
+      {}
+    );
+    return new EventSource(
+      `${API_BASE}/admin/stream?token=${encodeURIComponent(token)}`
+    );
+  } catch {
+    return null;
+  }
+}
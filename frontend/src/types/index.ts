@@ -5,6 +5,7 @@ export interface Sauna {
   capacity: number;
   hourly_rate: number;
   image_url: string | null;
+  thumbnail_url?: string | null;
   amenities: string | null;
   is_active: boolean;
   open_time: string;
@@ -28,6 +29,15 @@ export interface SaunaImage {
   image_url: string;
   display_order: number;
   is_primary: boolean;
+  variants?: SaunaImageVariant[];
+}
+
+export interface SaunaImageVariant {
+  name: "thumbnail" | "medium" | "large" | "original";
+  width: number;
+  height: number;
+  format: string;
+  url: string;
 }
 
 export interface OperatingHours {
@@ -110,6 +120,11 @@ export interface Review {
   user_name: string;
 }
 
+export interface ReviewPage {
+  items: Review[];
+  next_cursor: string | null;
+}
+
 export interface ReviewCreate {
   sauna_id: string;
   booking_id: string;
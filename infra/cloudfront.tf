@@ -43,7 +43,14 @@ resource "aws_cloudfront_distribution" "main" {
     origin_access_control_id = aws_cloudfront_origin_access_control.s3.id
   }
 
-  # Origin 2: API Gateway
+  # Origin 2: S3 uploaded images
+  origin {
+    domain_name              = aws_s3_bucket.media.bucket_regional_domain_name
+    origin_id                = "S3-${var.project_name}-media"
+    origin_access_control_id = aws_cloudfront_origin_access_control.s3.id
+  }
+
+  # Origin 3: API Gateway
   origin {
     domain_name = replace(aws_apigatewayv2_api.main.api_endpoint, "https://", "")
     origin_id   = "API-Gateway"
@@ -93,6 +100,27 @@ resource "aws_cloudfront_distribution" "main" {
     compress    = true
   }
 
+  # /media/* -> uploaded images; keys are unique per upload, so cache for long
+  ordered_cache_behavior {
+    path_pattern           = "/media/*"
+    target_origin_id       = "S3-${var.project_name}-media"
+    viewer_protocol_policy = "redirect-to-https"
+    allowed_methods        = ["GET", "HEAD", "OPTIONS"]
+    cached_methods         = ["GET", "HEAD"]
+
+    forwarded_values {
+      query_string = false
+      cookies {
+        forward = "none"
+      }
+    }
+
+    min_ttl     = 0
+    default_ttl = 86400
+    max_ttl     = 31536000
+    compress    = true
+  }
+
   # SPA routing: 403/404 -> /index.html
   custom_error_response {
     error_code            = 403
@@ -49,3 +49,23 @@ resource "aws_iam_role_policy" "lambda_secrets" {
     ]
   })
 }
+
+# Uploaded image objects (app.services.storage.S3Storage)
+resource "aws_iam_role_policy" "lambda_media" {
+  name = "${var.project_name}-lambda-media"
+  role = aws_iam_role.lambda.id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "s3:PutObject",
+          "s3:DeleteObject"
+        ]
+        Resource = "${aws_s3_bucket.media.arn}/media/*"
+      }
+    ]
+  })
+}
@@ -17,10 +17,24 @@ resource "aws_lambda_function" "api" {
 
   environment {
     variables = {
-      DATABASE_URL = "mysql+aiomysql://admin:${var.aurora_master_password}@${aws_rds_cluster.main.endpoint}:3306/sauna_booking"
-      SECRET_KEY   = var.jwt_secret_key
-      CORS_ORIGINS = "[\"*\"]"
-      STAGE        = "prod"
+      DATABASE_URL      = "mysql+aiomysql://admin:${var.aurora_master_password}@${aws_rds_cluster.main.endpoint}:3306/sauna_booking"
+      DATABASE_READ_URL = "mysql+aiomysql://admin:${var.aurora_master_password}@${aws_rds_cluster.main.reader_endpoint}:3306/sauna_booking"
+      SECRET_KEY        = var.jwt_secret_key
+      CORS_ORIGINS      = "[\"*\"]"
+      STAGE             = "prod"
+      STARTUP_MODE      = "fast"
+      METRICS_LOG       = "true"
+      JOB_RUNNER_IN_APP = "false"
+      BOOKING_TIMEZONE  = "Asia/Seoul"
+      # API Gateway buffers Lambda responses, so SSE can't stream; the admin
+      # dashboard falls back to polling
+      ADMIN_STREAM_ENABLED = "false"
+      # Uploads go to the media bucket and are served by CloudFront at /media/*,
+      # the same origin as the frontend, so URLs stay relative
+      STORAGE_BACKEND  = "s3"
+      S3_BUCKET        = aws_s3_bucket.media.id
+      S3_PREFIX        = "media"
+      STORAGE_BASE_URL = ""
     }
   }
 
@@ -42,3 +56,65 @@ resource "aws_lambda_permission" "apigw" {
   principal     = "apigateway.amazonaws.com"
   source_arn    = "${aws_apigatewayv2_api.main.execution_arn}/*/*"
 }
+
+# Background jobs: the API enqueues rows in the jobs table and a scheduled
+# invocation of the same function drains them (see mangum_handler.py)
+resource "aws_cloudwatch_event_rule" "jobs" {
+  name                = "${var.project_name}-jobs"
+  schedule_expression = "rate(1 minute)"
+}
+
+resource "aws_cloudwatch_event_target" "jobs" {
+  rule  = aws_cloudwatch_event_rule.jobs.name
+  arn   = aws_lambda_function.api.arn
+  input = jsonencode({ task = "jobs" })
+}
+
+resource "aws_lambda_permission" "jobs" {
+  statement_id  = "AllowEventBridgeInvoke"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.api.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.jobs.arn
+}
+
+# Completes bookings whose end time has passed (app.services.booking_status)
+resource "aws_cloudwatch_event_rule" "sweep_bookings" {
+  name                = "${var.project_name}-sweep-bookings"
+  schedule_expression = "rate(15 minutes)"
+}
+
+resource "aws_cloudwatch_event_target" "sweep_bookings" {
+  rule  = aws_cloudwatch_event_rule.sweep_bookings.name
+  arn   = aws_lambda_function.api.arn
+  input = jsonencode({ task = "sweep_bookings" })
+}
+
+resource "aws_lambda_permission" "sweep_bookings" {
+  statement_id  = "AllowEventBridgeSweepBookings"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.api.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.sweep_bookings.arn
+}
+
+# Moves bookings older than BOOKING_ARCHIVE_DAYS to bookings_archive; each
+# run stops before the function timeout and the next one continues
+resource "aws_cloudwatch_event_rule" "archive_bookings" {
+  name                = "${var.project_name}-archive-bookings"
+  schedule_expression = "cron(30 1 * * ? *)"
+}
+
+resource "aws_cloudwatch_event_target" "archive_bookings" {
+  rule  = aws_cloudwatch_event_rule.archive_bookings.name
+  arn   = aws_lambda_function.api.arn
+  input = jsonencode({ task = "archive_bookings" })
+}
+
+resource "aws_lambda_permission" "archive_bookings" {
+  statement_id  = "AllowEventBridgeArchiveBookings"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.api.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.archive_bookings.arn
+}
@@ -18,6 +18,11 @@ output "s3_bucket_name" {
   value       = aws_s3_bucket.frontend.id
 }
 
+output "media_bucket_name" {
+  description = "Uploaded images S3 bucket name"
+  value       = aws_s3_bucket.media.id
+}
+
 output "aurora_endpoint" {
   description = "Aurora cluster endpoint"
   value       = aws_rds_cluster.main.endpoint
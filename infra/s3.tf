@@ -43,6 +43,49 @@ resource "aws_s3_bucket_policy" "frontend" {
   })
 }
 
+# S3 Bucket for uploaded sauna images (STORAGE_BACKEND=s3), served under /media/*
+resource "aws_s3_bucket" "media" {
+  bucket = "${var.project_name}-media-${var.account_id}"
+
+  tags = {
+    Name    = "${var.project_name}-media"
+    Project = var.project_name
+  }
+}
+
+resource "aws_s3_bucket_public_access_block" "media" {
+  bucket = aws_s3_bucket.media.id
+
+  block_public_acls       = true
+  block_public_policy     = true
+  ignore_public_acls      = true
+  restrict_public_buckets = true
+}
+
+resource "aws_s3_bucket_policy" "media" {
+  bucket = aws_s3_bucket.media.id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Sid    = "AllowCloudFrontOAC"
+        Effect = "Allow"
+        Principal = {
+          Service = "cloudfront.amazonaws.com"
+        }
+        Action   = "s3:GetObject"
+        Resource = "${aws_s3_bucket.media.arn}/media/*"
+        Condition = {
+          StringEquals = {
+            "AWS:SourceArn" = aws_cloudfront_distribution.main.arn
+          }
+        }
+      }
+    ]
+  })
+}
+
 # Terraform state bucket (created separately)
 resource "aws_s3_bucket" "tfstate" {
   bucket = "${var.project_name}-tfstate-${var.account_id}"